@@ -1,8 +1,43 @@
+import threading
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, cast
+
 from .handlers import add_defaults
 from .parse import Parser
 
-_parser = Parser()
-add_defaults(_parser)
+if TYPE_CHECKING:
+    from .aio import aparse_stream, aparse_title
+
+# Number of results the default parser keeps; the same titles tend to come up again from different trackers and feeds.
+CACHE_SIZE = 8192
+
+# Built by the first parse (or ``warmup``), so that importing the package stays cheap.
+_parser: Optional[Parser] = None
+_parser_lock = threading.Lock()
+
+
+def _default_parser() -> Parser:
+    """Return the parser with the default handlers, building it on first use."""
+    global _parser
+    parser = _parser
+    if parser is None:
+        with _parser_lock:
+            if _parser is None:
+                parser = Parser(cache_size=CACHE_SIZE)
+                add_defaults(parser)
+                _parser = parser.freeze()
+            parser = _parser
+    return parser
+
+
+def warmup() -> None:
+    """
+    Build the default parser and compile all of its patterns now instead of on first use.
+
+    Importing the package does not build anything; the first ``parse_title`` builds the parser and every pattern is
+    compiled the first time it is searched. Services that would rather pay that cost at startup than on their first
+    requests can call this once after importing.
+    """
+    _default_parser().warmup()
 
 
 def parse_title(raw_title: str, translate_languages: bool = False) -> dict:
@@ -13,7 +48,36 @@ def parse_title(raw_title: str, translate_languages: bool = False) -> dict:
     :param translate_languages: Whether to translate language codes to language names or short codes (default: False returns short codes)
     :return: A dictionary with the parsed results.
     """
-    return _parser.parse(raw_title, translate_languages)
+    return _default_parser().parse(raw_title, translate_languages)
+
+
+cast(Any, parse_title).cache_info = lambda: _default_parser().cache_info()
+cast(Any, parse_title).cache_clear = lambda: _default_parser().cache_clear()
+cast(Any, parse_title).set_persistent_cache = lambda path: _default_parser().set_persistent_cache(path)
+
+
+def parse_titles(raw_titles: Iterable[str], translate_languages: bool = False, workers: int = 1, threads: int = 1) -> List[dict]:
+    """
+    Parse a batch of input strings using the initialized parser instance.
+
+    Duplicate titles are parsed only once, see ``Parser.parse_many``.
+
+    :param raw_titles: The input raw torrent titles to parse.
+    :param translate_languages: Whether to translate language codes to language names or short codes (default: False returns short codes)
+    :param workers: The number of worker processes to parse with (default: 1 parses in the current process)
+    :param threads: The number of threads to parse with (default: 1 parses in the calling thread)
+    :return: A list with the parsed results, in input order.
+    """
+    return cast(List[dict], _default_parser().parse_many(raw_titles, translate_languages, workers=workers, threads=threads, initializer=add_defaults))
+
+
+def __getattr__(name: str):
+    # The asyncio wrappers are only imported when asked for, asyncio itself is slow to import.
+    if name in ("aparse_stream", "aparse_title"):
+        from . import aio
+
+        return getattr(aio, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-__all__ = ["Parser", "add_defaults", "parse", "parse_title", "handlers", "transformers"]
+__all__ = ["Parser", "add_defaults", "aparse_stream", "aparse_title", "parse", "parse_title", "parse_titles", "warmup", "handlers", "transformers"]
@@ -1,26 +1,161 @@
 from pathlib import Path
-from typing import Set
+from typing import Any, Iterable, Optional, Set, Tuple
 
 import regex
 
+from PTT.tokens import TitleTokens
 
-def load_adult_keywords(filename: str = "combined-keywords.txt") -> Set[str]:
-    """Load adult keywords from the keywords file."""
-    keywords_file = Path(__file__).parent / "keywords" / filename
+KEYWORDS_DIR = Path(__file__).parent / "keywords"
+# Characters a keyword may consist of, all of which only match themselves and their case variants.
+KEYWORD_CHARS = regex.compile(r"[a-z0-9](?:[a-z0-9' \-]*[a-z0-9])?")
+
+
+def read_keywords(filename: str = "combined-keywords.txt") -> Set[str]:
+    """Read the keywords of a keywords file, one per line."""
+    keywords_file = KEYWORDS_DIR / filename
     keywords = set()
-    
+
     with open(keywords_file, "r") as f:
         for line in f:
             keyword = line.strip()
             if keyword and not keyword.isspace():
-                keywords.add(regex.escape(keyword))
-    
+                keywords.add(keyword)
+
     return keywords
 
-def create_adult_pattern() -> regex.Pattern:
-    """Create a compiled regex pattern for adult content detection."""
-    keywords = load_adult_keywords()
-    return regex.compile(
-        r'\b(' + '|'.join(keywords) + r')\b',
-        regex.IGNORECASE
-    )
+
+def is_plain_keyword(keyword: str) -> bool:
+    """Whether a keyword can be looked up in the set of a ``KeywordMatcher``, rather than in its fallback regex."""
+    return keyword.isascii() and KEYWORD_CHARS.fullmatch(keyword.lower()) is not None
+
+
+def load_adult_keywords(filename: str = "combined-keywords.txt") -> Set[str]:
+    """Load adult keywords from the keywords file, escaped for use in a regex pattern."""
+    return {regex.escape(keyword) for keyword in read_keywords(filename)}
+
+
+def alternation(keywords: Iterable[str]) -> str:
+    """Return the ``\\b(k1|k2|...)\\b`` pattern of keywords, longest first and otherwise sorted, so that it does not depend on set order."""
+    ordered = sorted(keywords, key=lambda keyword: (-len(keyword), keyword))
+    return r"\b(" + "|".join(regex.escape(keyword) for keyword in ordered) + r")\b"
+
+
+class KeywordMatch:
+    """The match of a ``KeywordMatcher``, with the parts of the ``regex.Match`` interface the parser uses."""
+
+    __slots__ = ("string", "_start", "_end")
+
+    lastindex = 1
+
+    def __init__(self, string: str, start: int, end: int):
+        self.string = string
+        self._start = start
+        self._end = end
+
+    def group(self, *groups: int) -> Any:
+        # The keyword is both the whole match and group 1, like in ``\b(keyword)\b``.
+        text = self.string[self._start : self._end]
+        return text if len(groups) <= 1 else (text,) * len(groups)
+
+    def groups(self) -> Tuple[str]:
+        return (self.group(),)
+
+    def start(self, group: int = 0) -> int:
+        return self._start
+
+    def end(self, group: int = 0) -> int:
+        return self._end
+
+    def span(self, group: int = 0) -> Tuple[int, int]:
+        return self._start, self._end
+
+    def __repr__(self) -> str:
+        return f"<KeywordMatch object; span=({self._start}, {self._end}), match={self.group()!r}>"
+
+
+class KeywordMatcher:
+    """
+    Find the first of a set of keywords in a title, with the same result as searching for ``\\b(k1|k2|...)\\b`` with
+    ``regex.IGNORECASE`` and the longest keywords first.
+
+    A keyword starts and ends with a letter or digit, so it can only start where a token (a run of word characters, see
+    ``TitleTokens``) starts and only end where one ends. Every stretch from a token start to a token end that is no longer
+    than the longest keyword is looked up in a set of the lowercased keywords. The leftmost start
+    wins, and of the keywords found there the longest. Unlike the alternation, the cost does not grow with the number
+    of keywords.
+
+    Keywords that fail ``is_plain_keyword`` (other characters, or a space, apostrophe or hyphen at either end) do not
+    line up with tokens. They are searched for with a regex alternation of their own, and the earlier match (the longer
+    one at the same position) of the two wins.
+
+    Matchers are used as handler patterns: ``pattern`` is the equivalent regex, for fingerprints and debug output.
+    """
+
+    __slots__ = ("keywords", "irregular", "max_length", "fallback", "_pattern")
+
+    flags = regex.IGNORECASE
+    groups = 1
+
+    def __init__(self, keywords: Iterable[str]):
+        folded = set()
+        irregular = set()
+        for keyword in keywords:
+            if is_plain_keyword(keyword):
+                folded.add(keyword.lower())
+            else:
+                irregular.add(keyword)
+        self.keywords = frozenset(folded)
+        self.irregular = frozenset(irregular)
+        self.max_length = max((len(keyword) for keyword in folded), default=0)
+        self.fallback = regex.compile(alternation(irregular), regex.IGNORECASE) if irregular else None
+        self._pattern: Optional[str] = None
+
+    @property
+    def pattern(self) -> str:
+        """The regex pattern the matcher is equivalent to."""
+        if self._pattern is None:
+            self._pattern = alternation(self.keywords | self.irregular)
+        return self._pattern
+
+    def search(self, string: str, concurrent: Optional[bool] = None, tokens: Optional[TitleTokens] = None) -> Optional[KeywordMatch]:
+        """
+        Return the match of the first keyword in the string, or None.
+
+        :param string: The string to search.
+        :param concurrent: Accepted for compatibility with regex patterns; the matcher never releases the GIL.
+        :param tokens: The tokens of the string, if the caller has them already.
+        """
+        span = self._search_tokens(tokens if tokens is not None else TitleTokens(string))
+        if self.fallback is not None:
+            match = self.fallback.search(string)
+            if match is not None and (span is None or match.start() < span[0] or match.start() == span[0] and match.end() > span[1]):
+                span = match.span()
+        return KeywordMatch(string, *span) if span is not None else None
+
+    def _search_tokens(self, tokens: TitleTokens) -> Optional[Tuple[int, int]]:
+        """Return the span of the first plain keyword in a tokenized string, or None."""
+        keywords = self.keywords
+        max_length = self.max_length
+        folded = tokens.folded
+        ends = tokens.ends
+
+        count = len(ends)
+        for index, start in enumerate(tokens.starts):
+            found = None
+            for following in range(index, count):
+                end = ends[following]
+                if end - start > max_length:
+                    break
+                if folded[start:end] in keywords:
+                    found = end
+            if found is not None:
+                return start, found
+        return None
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords) + len(self.irregular)} keywords)"
+
+
+def create_adult_pattern() -> KeywordMatcher:
+    """Create the keyword matcher for adult content detection."""
+    return KeywordMatcher(read_keywords())
@@ -0,0 +1,172 @@
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Titles parsed by a single executor job at most. Larger batches amortize the hand-off better but delay the first result.
+MAX_BATCH_SIZE = 64
+# Executor jobs a stream keeps in flight before it stops reading its source.
+MAX_PENDING_BATCHES = 4
+
+# Marks the end of the title source inside a stream.
+END = object()
+
+
+def parse_batch(requests: Sequence[Tuple[str, bool]]) -> List[Dict[str, Any]]:
+    """Parse ``(title, translate_languages)`` pairs with the default parser, in the executor."""
+    from PTT import parse_title
+
+    return [parse_title(title, translate_languages) for title, translate_languages in requests]
+
+
+class Batcher:
+    """
+    Collects the ``aparse_title`` calls of one event loop and executor that arrive in the same loop iteration and
+    hands them to the executor as a single job.
+    """
+
+    def __init__(self, executor: Optional[Executor], max_batch_size: int = MAX_BATCH_SIZE):
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.pending: List[Tuple[str, bool, asyncio.Future]] = []
+        self.flush_scheduled = False
+
+    def submit(self, title: str, translate_languages: bool) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((title, translate_languages, future))
+        if len(self.pending) >= self.max_batch_size:
+            self.flush(loop)
+        elif not self.flush_scheduled:
+            self.flush_scheduled = True
+            loop.call_soon(self.flush, loop)
+        return future
+
+    def flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.flush_scheduled = False
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+
+        job = loop.run_in_executor(self.executor, parse_batch, [(title, translate_languages) for title, translate_languages, _ in batch])
+
+        def distribute(job: asyncio.Future) -> None:
+            futures = [future for _, _, future in batch]
+            if job.cancelled():
+                for future in futures:
+                    if not future.done():
+                        future.cancel()
+                return
+            exception = job.exception()
+            if exception is not None:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exception)
+                return
+            for future, result in zip(futures, job.result()):
+                if not future.done():
+                    future.set_result(result)
+
+        job.add_done_callback(distribute)
+
+
+_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Optional[Executor], Batcher]]" = weakref.WeakKeyDictionary()
+
+
+async def aparse_title(raw_title: str, translate_languages: bool = False, executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """
+    Parse the given input string without blocking the event loop.
+
+    Calls made in the same event loop iteration (e.g. through ``asyncio.gather``) are parsed together in one executor job.
+
+    :param raw_title: The input raw torrent title to parse.
+    :param translate_languages: Whether to translate language codes to language names or short codes (default: False returns short codes)
+    :param executor: The thread or process executor to parse in (default: the event loop's default executor)
+    :return: A dictionary with the parsed results.
+    """
+    loop = asyncio.get_running_loop()
+    batchers = _batchers.setdefault(loop, {})
+    batcher = batchers.get(executor)
+    if batcher is None:
+        batcher = batchers[executor] = Batcher(executor)
+    return await batcher.submit(raw_title, translate_languages)
+
+
+async def aparse_stream(
+    raw_titles: AsyncIterable[str],
+    translate_languages: bool = False,
+    executor: Optional[Executor] = None,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    max_pending_batches: int = MAX_PENDING_BATCHES,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Parse titles from an async iterable in an executor, yielding the results in input order.
+
+    Titles that are already waiting when the executor can take more work are parsed together, up to ``max_batch_size``
+    per job. At most ``max_pending_batches`` jobs are in flight; beyond that the source is not read any further until
+    the consumer catches up.
+
+    Example:
+        >>> async for result in aparse_stream(feed_titles()):
+        ...     print(result["title"])
+
+    :param raw_titles: The input raw torrent titles to parse.
+    :param translate_languages: Whether to translate language codes to language names or short codes (default: False returns short codes)
+    :param executor: The thread or process executor to parse in (default: the event loop's default executor)
+    :param max_batch_size: The maximum number of titles per executor job.
+    :param max_pending_batches: The maximum number of executor jobs in flight.
+    :return: An async generator of parsed results.
+    """
+    loop = asyncio.get_running_loop()
+    titles: asyncio.Queue = asyncio.Queue(maxsize=max_batch_size)
+    jobs: asyncio.Queue = asyncio.Queue(maxsize=max_pending_batches)
+
+    async def read() -> None:
+        try:
+            async for title in raw_titles:
+                await titles.put(title)
+        except Exception as error:
+            await titles.put(error)
+        await titles.put(END)
+
+    async def dispatch() -> None:
+        done = False
+        while not done:
+            item = await titles.get()
+            batch: List[str] = []
+            while True:
+                if item is END or isinstance(item, Exception):
+                    done = True
+                    break
+                batch.append(item)
+                if len(batch) >= max_batch_size or titles.empty():
+                    break
+                item = titles.get_nowait()
+            if batch:
+                await jobs.put(loop.run_in_executor(executor, parse_batch, [(title, translate_languages) for title in batch]))
+            if isinstance(item, Exception):
+                failed = loop.create_future()
+                failed.set_exception(item)
+                await jobs.put(failed)
+        await jobs.put(END)
+
+    tasks = [loop.create_task(read()), loop.create_task(dispatch())]
+    try:
+        while True:
+            job = await jobs.get()
+            if job is END:
+                break
+            for result in await job:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
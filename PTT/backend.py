@@ -0,0 +1,131 @@
+import re
+import time
+import warnings
+from typing import Any, Iterable, List, NamedTuple, Optional, Sequence
+
+import regex
+
+from .adult import KeywordMatcher
+
+# Engines a parser can match its handler patterns with. "regex" keeps every pattern on regex, "re" moves every pattern
+# the stdlib ``re`` compiles the same way to re, and "auto" only moves those that search measurably faster with re.
+BACKENDS = ("regex", "re", "auto")
+# How much faster re has to search a pattern for "auto" to pick it, so that timing noise does not flip the choice.
+MIN_STDLIB_SPEEDUP = 1.25
+# Runs per pattern and engine when "auto" times them, the fastest one counts.
+CALIBRATION_REPEAT = 3
+
+# regex flags with the same meaning (and value) in re. Patterns with any other flag stay on regex.
+STDLIB_FLAGS = regex.IGNORECASE | regex.MULTILINE | regex.DOTALL | regex.VERBOSE | regex.ASCII | regex.UNICODE
+# Always set on patterns compiled by regex without an explicit version, and what re behaves like.
+DEFAULT_FLAGS = regex.VERSION0
+
+# Titles to time the engines on when no others are given.
+SAMPLE_TITLES = (
+    "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole",
+    "Mad.Max.Fury.Road.2015.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTG",
+    "[Erai-raws] Shingeki no Kyojin - 01 [1080p][Multiple Subtitle]",
+    "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+    "Deadpool 2 (2018) PL.DUB.1080p.WEB-DL.x264 + Napisy PL",
+    "Game of Thrones - The Complete Season 1-8 (2011-2019) [1080p BluRay x265 10bit]",
+    "Сезон 2 Серии 1-10 (2019) WEB-DLRip",
+)
+
+
+def compile_stdlib(pattern: regex.Pattern) -> Optional[re.Pattern]:
+    """
+    Compile a regex pattern with the stdlib ``re`` module, if it means the same there.
+
+    Patterns using regex-only flags or syntax (variable-length lookbehinds, ``\\p{...}`` classes, nested sets, ...)
+    fail to compile with re or make it warn about a future change in meaning; those return None, and so do keyword
+    matchers.
+
+    :param pattern: A pattern compiled with regex.
+    :return: The equivalent re pattern, or None if the pattern has to stay on regex.
+    """
+    if isinstance(pattern, KeywordMatcher) or pattern.flags & ~(STDLIB_FLAGS | DEFAULT_FLAGS):
+        return None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            compiled = re.compile(pattern.pattern, pattern.flags & STDLIB_FLAGS)
+        except (re.error, Warning):
+            return None
+    if compiled.groups != pattern.groups or compiled.groupindex != dict(pattern.groupindex):
+        return None
+    return compiled
+
+
+def stdlib_speedup(pattern: regex.Pattern, compiled: re.Pattern, titles: Sequence[str] = SAMPLE_TITLES, repeat: int = CALIBRATION_REPEAT) -> float:
+    """Return how many times faster ``compiled`` (re) searches the titles than ``pattern`` (regex)."""
+    return time_searches(pattern, titles, repeat) / max(time_searches(compiled, titles, repeat), 1e-9)
+
+
+def choose_pattern(pattern: Any, backend: str) -> Any:
+    """
+    Return the pattern to search with under the given backend: ``pattern`` itself or its re equivalent.
+
+    :param pattern: A pattern compiled with regex, or a ``KeywordMatcher``, which has no re equivalent.
+    :param backend: One of ``BACKENDS``.
+    """
+    if backend == "regex":
+        return pattern
+    compiled = compile_stdlib(pattern)
+    if compiled is None:
+        return pattern
+    if backend == "auto" and stdlib_speedup(pattern, compiled) < MIN_STDLIB_SPEEDUP:
+        return pattern
+    return compiled
+
+
+def engine_name(pattern: Any) -> str:
+    """Return the name of the module a compiled pattern belongs to, or "keywords" for a keyword matcher."""
+    if isinstance(pattern, KeywordMatcher):
+        return "keywords"
+    return "re" if isinstance(pattern, re.Pattern) else "regex"
+
+
+class BackendChoice(NamedTuple):
+    """
+    The engine chosen for the pattern of one plan step, and how many times faster re searched it than regex (None if re
+    does not support the pattern).
+    """
+
+    name: str
+    pattern: str
+    engine: str
+    speedup: Optional[float]
+
+
+def time_searches(pattern: Any, titles: Sequence[str], repeat: int) -> float:
+    search = pattern.search
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title in titles:
+            search(title)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def backend_report(plan: Iterable[Any], titles: Sequence[str] = SAMPLE_TITLES, repeat: int = 20) -> List[BackendChoice]:
+    """
+    Report the engine every regex step of a plan uses, with the measured speedup of re over regex where re supports
+    the pattern.
+
+    :param plan: The compiled plan, see ``Parser.get_plan``.
+    :param titles: The titles to time the searches on.
+    :param repeat: Runs per pattern and engine, the fastest one counts.
+    :return: One entry per regex step, in plan order.
+    """
+    report = []
+    for step in plan:
+        if step.reg_exp is None:
+            continue
+        engine = engine_name(step.reg_exp)
+        speedup = None
+        compiled = step.reg_exp if engine == "re" else compile_stdlib(step.handler.reg_exp)
+        if compiled is not None:
+            speedup = stdlib_speedup(step.handler.reg_exp, compiled, titles, repeat)
+        report.append(BackendChoice(step.name, step.reg_exp.pattern, engine, speedup))
+    return report
@@ -0,0 +1,255 @@
+import atexit
+import hashlib
+import json
+import threading
+import time
+import types
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, NamedTuple, Optional, Tuple, Union
+
+import regex
+
+from .adult import KEYWORDS_DIR, KeywordMatcher
+from .lazy import LazyPattern
+
+# Bump when the layout of the persistent cache or the way results are stored changes.
+CACHE_FORMAT = 2
+# Entries of a ruleset that no process has opened the persistent cache with or stored a result for in this many seconds
+# are deleted, so that processes running different parser versions on one file do not evict each other.
+STALE_RULESET_AGE = 7 * 24 * 3600
+# How often, in seconds, a persistent cache that stores results marks its ruleset as still in use.
+RULESET_TOUCH_INTERVAL = 3600
+# New results are written to the persistent cache together, in one transaction, once this many of them are pending or
+# the oldest of them waited this many seconds.
+WRITE_BATCH_SIZE = 256
+WRITE_BATCH_DELAY = 1.0
+# Result values that JSON stores and loads back with the same type.
+JSON_SCALARS = (str, int, float, bool, type(None))
+# How deep closures and containers are followed when describing a handler for the fingerprint.
+MAX_DESCRIBE_DEPTH = 8
+PACKAGE_DIR = Path(__file__).parent
+
+
+class CacheInfo(NamedTuple):
+    """Usage statistics of a result cache, in the spirit of ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded mapping that evicts the least recently used entry once ``maxsize`` is exceeded.
+
+    Values are stored and returned as they are; callers that hand them out (see ``Parser.parse``) copy them on the way
+    in and out, so that cached results cannot be modified from outside.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError(f"Cache size must be positive. Got {maxsize}")
+        self.maxsize = maxsize
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value cached for ``key`` and mark it as recently used, or None on a miss."""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache ``value`` for ``key``, evicting the least recently used entry if the cache is full."""
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """Return the current statistics."""
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self.entries), self.maxsize)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def describe(obj: Any, depth: int = 0) -> str:
+    """
+    Describe a handler, transformer or option value as a string that is stable across processes.
+
+    Functions are described by their name, bytecode, constants and closure contents, so two closures created by the same
+    factory with different arguments (e.g. ``value("a")`` and ``value("b")``) differ, and so does a changed implementation.
+    Sets and dicts are ordered, and objects without a stable representation only contribute their type.
+    """
+    if depth > MAX_DESCRIBE_DEPTH:
+        return type(obj).__qualname__
+    depth += 1
+    if obj is None or isinstance(obj, (str, bytes, int, float, bool)):
+        return repr(obj)
+    if isinstance(obj, (regex.Pattern, LazyPattern, KeywordMatcher)):
+        return f"pattern({obj.pattern!r},{obj.flags})"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ",".join(describe(item, depth) for item in obj) + "]"
+    if isinstance(obj, (set, frozenset)):
+        return "{" + ",".join(sorted(describe(item, depth) for item in obj)) + "}"
+    if isinstance(obj, dict):
+        return "{" + ",".join(sorted(f"{describe(key, depth)}:{describe(val, depth)}" for key, val in obj.items())) + "}"
+    if isinstance(obj, types.CodeType):
+        return f"code({obj.co_code.hex()},{describe(obj.co_consts, depth)},{describe(obj.co_names, depth)})"
+    if isinstance(obj, types.FunctionType):
+        closure = [cell.cell_contents for cell in obj.__closure__ or () if cell.cell_contents is not obj]
+        return f"function({obj.__module__}.{obj.__qualname__},{describe(obj.__code__, depth)},{describe(obj.__defaults__, depth)},{describe(closure, depth)})"
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        return f"{getattr(obj, '__module__', '')}.{obj.__qualname__}"
+    return type(obj).__qualname__
+
+
+def fingerprint_ruleset(handlers: Iterable[Any], preprocessors: Iterable[Any], postprocessors: Iterable[Any], settings: Iterable[str] = ()) -> str:
+    """
+    Hash everything a parse result depends on: the handlers with their patterns, options and transformers, the pre- and
+    postprocessing stages, the parser settings, the keyword files and the parser's own source code.
+
+    :return: A hex digest that changes whenever any of them changes.
+    """
+    digest = hashlib.sha256(f"format {CACHE_FORMAT}\n".encode())
+    for setting in settings:
+        digest.update(f"setting {setting}\n".encode())
+    for path in sorted(PACKAGE_DIR.glob("*.py")) + sorted(KEYWORDS_DIR.iterdir()):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes() + b"\0")
+    for handler in handlers:
+        digest.update(f"handler {getattr(handler, 'handler_name', '')} {describe(handler)}\n".encode())
+    for stage in preprocessors:
+        digest.update(f"preprocessor {describe(stage)}\n".encode())
+    for stage in postprocessors:
+        digest.update(f"postprocessor {describe(stage)}\n".encode())
+    return digest.hexdigest()
+
+
+def is_json_native(value: Any) -> bool:
+    """
+    Return whether JSON loads the value back as it is: made of lists, dicts with string keys and ``JSON_SCALARS`` only.
+    Tuples come back as lists, other keys as strings, and other types, e.g. of a custom handler, do not encode at all.
+    """
+    kind = type(value)
+    if kind in JSON_SCALARS:
+        return True
+    if kind is list:
+        return all(is_json_native(item) for item in value)
+    if kind is dict:
+        return all(type(key) is str and is_json_native(item) for key, item in value.items())
+    return False
+
+
+class SQLiteCache:
+    """
+    A persistent store of parse results in an SQLite database, shared by all processes that use the same file.
+
+    Entries are keyed by a hash of the title, the ``translate_languages`` flag and the fingerprint of the ruleset that
+    produced them. Opening the store deletes the entries of rulesets that were last used ``STALE_RULESET_AGE`` ago, so
+    results of an old parser or keyword lists go away once nothing uses them any more, while processes running
+    different rulesets on the same file keep each other's entries.
+
+    Results are stored as JSON. Those that would come back different (see ``is_json_native``) are not stored, so a hit
+    always returns the same result as parsing again. New results are written in batches (see ``WRITE_BATCH_SIZE``),
+    and the pending ones when the store is closed or the interpreter exits; until then only this store sees them.
+    """
+
+    def __init__(self, path: Union[str, Path], fingerprint: str):
+        # Most processes never open a persistent cache, so the import is left to the first that does.
+        import sqlite3
+
+        self.fingerprint = fingerprint
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results (fingerprint TEXT NOT NULL, title_hash BLOB NOT NULL, translate_languages INTEGER NOT NULL, result TEXT NOT NULL, PRIMARY KEY (fingerprint, title_hash, translate_languages)) WITHOUT ROWID")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS rulesets (fingerprint TEXT PRIMARY KEY, last_used REAL NOT NULL)")
+        self.touched = 0.0
+        self.touch()
+        self.connection.execute("DELETE FROM rulesets WHERE last_used < ?", (self.touched - STALE_RULESET_AGE,))
+        self.connection.execute("DELETE FROM results WHERE fingerprint NOT IN (SELECT fingerprint FROM rulesets)")
+        # Encoded results that are not written yet, by title hash and translate_languages flag.
+        self.pending: Dict[Tuple[bytes, int], str] = {}
+        self.pending_since = 0.0
+        atexit.register(self.close)
+
+    def touch(self) -> None:
+        """Mark the ruleset of this store as in use now."""
+        self.touched = time.time()
+        self.connection.execute("INSERT OR REPLACE INTO rulesets VALUES (?, ?)", (self.fingerprint, self.touched))
+
+    @staticmethod
+    def hash_title(title: str) -> bytes:
+        return hashlib.blake2b(title.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def get(self, title: str, translate_languages: bool) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the result stored for the title, or None."""
+        key = (self.hash_title(title), int(translate_languages))
+        with self.lock:
+            encoded = self.pending.get(key)
+            if encoded is None:
+                row = self.connection.execute("SELECT result FROM results WHERE fingerprint = ? AND title_hash = ? AND translate_languages = ?", (self.fingerprint, *key)).fetchone()
+                encoded = row[0] if row is not None else None
+        return json.loads(encoded) if encoded is not None else None
+
+    def put(self, title: str, translate_languages: bool, result: Dict[str, Any]) -> None:
+        """Store the result for the title, unless JSON cannot hold it unchanged."""
+        if not is_json_native(result):
+            return
+        encoded = json.dumps(result, ensure_ascii=False)
+        with self.lock:
+            now = time.time()
+            if not self.pending:
+                self.pending_since = now
+            self.pending[(self.hash_title(title), int(translate_languages))] = encoded
+            if len(self.pending) >= WRITE_BATCH_SIZE or now - self.pending_since >= WRITE_BATCH_DELAY:
+                self._flush(now)
+
+    def flush(self) -> None:
+        """Write the pending results."""
+        with self.lock:
+            if self.pending:
+                self._flush(time.time())
+
+    def _flush(self, now: float) -> None:
+        with self.connection:
+            self.connection.execute("BEGIN")
+            if now - self.touched > RULESET_TOUCH_INTERVAL:
+                self.touch()
+            self.connection.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", [(self.fingerprint, title_hash, translate_languages, encoded) for (title_hash, translate_languages), encoded in self.pending.items()])
+        self.pending.clear()
+
+    def __len__(self) -> int:
+        self.flush()
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM results WHERE fingerprint = ?", (self.fingerprint,)).fetchone()[0]
+
+    def close(self) -> None:
+        """Write the pending results and close the database; closing it again does nothing."""
+        atexit.unregister(self.close)
+        with self.lock:
+            if self.pending:
+                self._flush(time.time())
+            self.connection.close()
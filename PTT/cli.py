@@ -2,6 +2,7 @@ import argparse
 import sys
 import os
 import json
+from typing import Optional
 
 def main():
     parser = argparse.ArgumentParser(description="Parse filename or torrent name using Parsett")
@@ -26,6 +27,11 @@ def main():
     dedupe_parser = subparsers.add_parser('dedupe', help='Deduplicate and sort a file by count. Requires `keyword` format on every line.')
     dedupe_parser.add_argument('filename', type=str, help='File to deduplicate and sort')
 
+    # Backends command
+    backends_parser = subparsers.add_parser('backends', help='Show which regex engine every handler pattern uses and the measured speedup of re')
+    backends_parser.add_argument('--titles', type=str, help='File with one title per line to time the patterns on (default: a built-in sample)')
+    backends_parser.add_argument('--backend', type=str, default='auto', choices=['regex', 're', 'auto'], help='Backend to choose the engines with (default: auto)')
+
     args = parser.parse_args()
 
     if args.command == 'parse':
@@ -45,11 +51,33 @@ def main():
         combine_keywords(args.directory)
     elif args.command == 'dedupe':
         dedupe_and_sort(args.filename)
+    elif args.command == 'backends':
+        print_backend_report(args.titles, args.backend)
     else:
         parser.print_help()
         sys.exit(1)
 
 
+def print_backend_report(titles_file: Optional[str] = None, backend: str = 'auto') -> None:
+    """Print the engine chosen for every handler pattern of the default parser, with the speedup of re over regex."""
+    from PTT import Parser, add_defaults
+    from PTT.backend import SAMPLE_TITLES, backend_report
+
+    titles = SAMPLE_TITLES
+    if titles_file:
+        with open(titles_file, 'r', encoding='utf-8') as f:
+            titles = [line.strip() for line in f if line.strip()]
+
+    parser = Parser(backend=backend)
+    add_defaults(parser)
+    report = backend_report(parser.freeze().get_plan(), titles)
+    for choice in report:
+        speedup = f"{choice.speedup:.2f}x" if choice.speedup is not None else "-"
+        print(f"{choice.engine:<6} {speedup:>7}  {choice.name:<12} {choice.pattern[:80]}")
+    on_stdlib = sum(1 for choice in report if choice.engine == 're')
+    print(f"{on_stdlib} of {len(report)} patterns use re")
+
+
 def combine_keywords(directory: str) -> None:
     """Combine keywords from all txt files in directory into a single sorted list."""
     keywords = set()
@@ -69,6 +97,12 @@ def combine_keywords(directory: str) -> None:
     
     print(f"Combined and sorted into {output_file.split('/')[-1]} using {files_used} files")
 
+    from PTT.adult import is_plain_keyword
+
+    irregular = sorted(keyword for keyword in keywords if not is_plain_keyword(keyword))
+    if irregular:
+        print(f"{len(irregular)} keywords are not plain ASCII words and are matched with a slower regex: {', '.join(map(repr, irregular))}")
+
 
 def sort_by_count(filename: str) -> None:
     """Sort a file by counts."""
@@ -0,0 +1,69 @@
+from typing import Any, Dict, NamedTuple, Sequence, Tuple
+
+import regex
+
+# Flags that are either the default or can be scoped to a single branch of an alternation.
+FUSABLE_FLAGS = regex.IGNORECASE | regex.UNICODE | regex.VERSION0
+# Patterns with these constructs are left alone: backreferences and conditionals would point at the wrong group once
+# the groups are renumbered, global inline flags would no longer apply to the branch alone, and lookarounds and greedy
+# wildcards make the alternation slower than the separate scans.
+UNFUSABLE_REGEX = regex.compile(r"\\[1-9]|\\g<|\(\?P[=>]|\(\?\(|\(\?[a-zA-Z]+\)|\(\?<?[=!]|[.\]][*+]")
+
+
+def can_fuse_pattern(pattern: regex.Pattern) -> bool:
+    """Return whether a pattern can be a branch of a fused alternation with the same matches as on its own."""
+    return not pattern.flags & ~FUSABLE_FLAGS and UNFUSABLE_REGEX.search(pattern.pattern) is None
+
+
+class FusedBranches(NamedTuple):
+    """
+    The patterns of several handlers of one field merged into a single alternation, one capturing group per branch.
+
+    A search of the alternation finds the leftmost position where any branch matches, while the handlers themselves
+    are tried one after the other and the first one that matches anywhere wins. ``resolve`` bridges the two: an earlier
+    branch can only match further to the right, so the branches before the current winner are searched again from
+    just after its position until none of them matches. Titles where no branch matches, the common case, are scanned
+    once instead of once per handler.
+    """
+
+    # ``prefixes[k]`` is the alternation of the first ``k`` branches; ``prefixes[0]`` is unused.
+    prefixes: Tuple[Any, ...]
+    # The group number of every branch's outer group, mapped to the branch index.
+    groups: Dict[int, int]
+    # What each branch stands for, e.g. the plan step it was built from.
+    branches: Tuple[Any, ...]
+
+    def resolve(self, title: str, match: Any, concurrent: bool = False) -> Tuple[Any, Any]:
+        """
+        Turn the leftmost match of the full alternation into the match of the first branch that matches anywhere.
+
+        :return: The match, whose whole match is the branch's, and the branch it belongs to.
+        """
+        index = self.groups[match.lastindex]
+        while index:
+            earlier = self.prefixes[index].search(title, match.start() + 1, concurrent=concurrent)
+            if earlier is None:
+                break
+            match = earlier
+            index = self.groups[match.lastindex]
+        return match, self.branches[index]
+
+
+def fuse_patterns(patterns: Sequence[regex.Pattern], branches: Sequence[Any]) -> Tuple[regex.Pattern, FusedBranches]:
+    """
+    Merge patterns into one alternation, in order.
+
+    :param patterns: The patterns, all of which pass ``can_fuse_pattern``.
+    :param branches: What each pattern stands for, returned by ``FusedBranches.resolve``.
+    :return: The full alternation and the branch table to resolve its matches with.
+    """
+    parts = []
+    groups = {}
+    group = 1
+    for index, pattern in enumerate(patterns):
+        scope = "i" if pattern.flags & regex.IGNORECASE else "-i"
+        parts.append(f"((?{scope}:{pattern.pattern}))")
+        groups[group] = index
+        group += 1 + pattern.groups
+    prefixes = (None,) + tuple(regex.compile("|".join(parts[:count])) for count in range(1, len(parts) + 1))
+    return prefixes[-1], FusedBranches(prefixes, groups, tuple(branches))
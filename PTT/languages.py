@@ -0,0 +1,167 @@
+from typing import Dict, Tuple
+
+import regex
+
+from PTT.lazy import LazyPattern
+from PTT.parse import Parser
+from PTT.transformers import uniq_concat, value
+
+# The ``languages`` handlers, in the order they run: the ISO 639-1 code a match adds, the pattern with its flags, and
+# the options of the handler. None of them has ``skipIfAlreadyFound``: every language of a title is collected, in the
+# order of the rows that match.
+#
+# Context exclusions are part of the patterns, as lookarounds. The parser derives from every pattern the tokens one of
+# which a title needs for it to match (see ``PTT.literals.required_tokens``), e.g. ``en`` or ``eng`` for ``\beng?\b``,
+# so that a title is only searched for the few rows whose tokens it has.
+LANGUAGE_RULES: Tuple[Tuple[str, str, int, Dict[str, bool]], ...] = (
+    ("en", r"\bengl?(?:sub[A-Z]*)?\b", regex.IGNORECASE, {"remove": True}),
+    ("en", r"\beng?sub[A-Z]*\b", regex.IGNORECASE, {}),
+    ("en", r"\bing(?:l[eéê]s)?\b", regex.IGNORECASE, {}),
+    ("en", r"\besub\b", regex.IGNORECASE, {"remove": True}),
+    ("en", r"\benglish\W+(?:subs?|sdh|hi)\b", regex.IGNORECASE, {}),
+    ("en", r"\beng?\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("en", r"\benglish?\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("ja", r"\b(?:JP|JAP|JPN)\b", regex.IGNORECASE, {}),
+    ("ja", r"\b(japanese|japon[eê]s)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("ko", r"\b(?:KOR|kor[ .-]?sub)\b", regex.IGNORECASE, {}),
+    ("ko", r"\b(korean|coreano)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("zh", r"\b(?:traditional\W*chinese|chinese\W*traditional)(?:\Wchi)?\b", regex.IGNORECASE, {"remove": True}),
+    ("zh", r"\bzh-hant\b", regex.IGNORECASE, {}),
+    ("zh", r"\b(?:mand[ae]rin|ch[sn])\b", regex.IGNORECASE, {}),
+    ("zh", r"(?<!shang-?)\bCH(?:I|T)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("zh", r"\b(chinese|chin[eê]s)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("zh", r"\bzh-hans\b", regex.IGNORECASE, {}),
+    ("fr", r"\bFR(?:a|e|anc[eê]s|VF[FQIB2]?)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("fr", r"\b\[?(VF[FQRIB2]?\]?\b|(VOST)?FR2?)\b", 0, {"remove": True}),
+    ("fr", r"\b(TRUE|SUB).?FRENCH\b|\bFRENCH\b|\bFre?\b", 0, {"remove": True}),
+    ("fr", r"\b(VOST(?:FR?|A)?)\b", regex.IGNORECASE, {}),
+    # ("fr", r"\b(VF[FQIB2]?|(TRUE|SUB).?FRENCH|(VOST)?FR2?)\b", regex.IGNORECASE, {"remove": True}),  with skipIfAlreadyFound
+    ("la", r"\bspanish\W?latin|american\W*(?:spa|esp?)", regex.IGNORECASE, {"skipFromTitle": True, "remove": True}),
+    ("es", r"\b(?:\bla\b.+(?:cia\b))", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("la", r"\b(?:audio.)?lat(?:in?|ino)?\b", regex.IGNORECASE, {}),
+    ("es", r"\b(?:audio.)?(?:ESP?|spa|(en[ .]+)?espa[nñ]ola?|castellano)\b", regex.IGNORECASE, {}),
+    ("es", r"\bes(?=[ .,/-]+(?:[A-Z]{2}[ .,/-]+){2,})\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("es", r"\b(?<=[ .,/-]+(?:[A-Z]{2}[ .,/-]+){2,})es\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("es", r"\b(?<=[ .,/-]+[A-Z]{2}[ .,/-]+)es(?=[ .,/-]+[A-Z]{2}[ .,/-]+)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("es", r"\bes(?=\.(?:ass|ssa|srt|sub|idx)$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("es", r"\bspanish\W+subs?\b", regex.IGNORECASE, {}),
+    ("es", r"\b(spanish|espanhol)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("es", r"\b[\.\s\[]?Sp[\.\s\]]?\b", regex.IGNORECASE, {"remove": True}),
+    ("pt", r"\b(?:p[rt]|en|port)[. (\\/-]*BR\b", regex.IGNORECASE, {"remove": True}),
+    ("pt", r"\bbr(?:a|azil|azilian)\W+(?:pt|por)\b", regex.IGNORECASE, {"remove": True}),
+    ("pt", r"\b(?:leg(?:endado|endas?)?|dub(?:lado)?|portugu[eèê]se?)[. -]*BR\b", regex.IGNORECASE, {}),
+    ("pt", r"\bleg(?:endado|endas?)\b", regex.IGNORECASE, {}),
+    ("pt", r"\bportugu[eèê]s[ea]?\b", regex.IGNORECASE, {}),
+    ("pt", r"\bPT[. -]*(?:PT|ENG?|sub(?:s|titles?))\b", regex.IGNORECASE, {}),
+    ("pt", r"\bpt(?=\.(?:ass|ssa|srt|sub|idx)$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("pt", r"\bPT\b", regex.IGNORECASE, {"remove": True}),
+    ("pt", r"\bpor\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("it", r"\b-?ITA\b", regex.IGNORECASE, {"remove": True}),
+    ("it", r"\b(?<!w{3}\.\w+\.)IT(?=[ .,/-]+(?:[a-zA-Z]{2}[ .,/-]+){2,})\b", 0, {"skipFromTitle": True}),
+    ("it", r"\bit(?=\.(?:ass|ssa|srt|sub|idx)$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("it", r"\bitaliano?\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("el", r"\bgreek[ .-]*(?:audio|lang(?:uage)?|subs?(?:titles?)?)?\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("de", r"\b(?:GER|DEU)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("de", r"\bde(?=[ .,/-]+(?:[A-Z]{2}[ .,/-]+){2,})\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("de", r"\b(?<=[ .,/-]+(?:[A-Z]{2}[ .,/-]+){2,})de\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("de", r"\b(?<=[ .,/-]+[A-Z]{2}[ .,/-]+)de(?=[ .,/-]+[A-Z]{2}[ .,/-]+)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("de", r"\bde(?=\.(?:ass|ssa|srt|sub|idx)$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("de", r"\b(german|alem[aã]o)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("ru", r"\bRUS?\b", regex.IGNORECASE, {}),
+    ("ru", r"\b(russian|russo)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("uk", r"\bUKR\b", regex.IGNORECASE, {}),
+    ("uk", r"\bukrainian\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("hi", r"\bhin(?:di)?\b", regex.IGNORECASE, {}),
+    ("te", r"\b(?:(?<!w{3}\.\w+\.)tel(?!\W*aviv)|telugu)\b", regex.IGNORECASE, {"remove": True}),
+    ("ta", r"\bt[aâ]m(?:il)?\b", regex.IGNORECASE, {"remove": True}),
+    ("ml", r"\b(?:(?<!w{3}\.\w+\.)MAL(?:ay)?|malayalam)\b", regex.IGNORECASE, {"remove": True, "skipIfFirst": True}),
+    ("kn", r"\b(?:(?<!w{3}\.\w+\.)KAN(?:nada)?|kannada)\b", regex.IGNORECASE, {"remove": True}),
+    ("mr", r"\b(?:(?<!w{3}\.\w+\.)MAR(?:a(?:thi)?)?|marathi)\b", regex.IGNORECASE, {}),
+    ("gu", r"\b(?:(?<!w{3}\.\w+\.)GUJ(?:arati)?|gujarati)\b", regex.IGNORECASE, {}),
+    ("pa", r"\b(?:(?<!w{3}\.\w+\.)PUN(?:jabi)?|punjabi)\b", regex.IGNORECASE, {}),
+    ("bn", r"\b(?:(?<!w{3}\.\w+\.)BEN(?!.\bThe|and|of\b)(?:gali)?|bengali)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("lt", r"\b(?<!YTS\.)LT\b", 0, {"skipFromTitle": True}),
+    ("lt", r"\blithuanian\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("lv", r"\blatvian\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("et", r"\bestonian\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("pl", r"\b(polish|polon[eê]s|polaco)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    # Frazy typu "serial polski", "polski serial", "film polski", "polski film"
+    # (zamiast spacji mogą być kropki) → język PL i USUWAMY z tytułu.
+    ("pl", r"\b(?:serial|film)[ .]polski\b", regex.IGNORECASE, {"remove": True}),
+    ("pl", r"\bpolski[ .](?:serial|film)\b", regex.IGNORECASE, {"remove": True}),
+    (
+        "pl",
+        r"""
+        \b(?:
+              PLDUB(?![\s._\-|\]\)\(\[\}\{]*MD\b)
+            | DUBPL(?![\s._\-|\]\)\(\[\}\{]*MD\b)
+            | DubbingPL(?![\s._\-|\]\)\(\[\}\{]*MD\b)
+            | PLDubbing(?![\s._\-|\]\)\(\[\}\{]*MD\b)
+            | LekPL
+            | LektorPL
+            | PLLektor
+            | Lektor
+        )\b
+        """,
+        regex.IGNORECASE | regex.VERBOSE,
+        {"remove": True},
+    ),
+    ("pl", r"(Polski Dubbing|Dubbing ?i ?napisy|Dubbing ?DDP ?5.1 ?i ?Napisy|Dubbing ?5.1 ?i ?Napisy|Dubbing ?DDP ?i ?Napisy|Dubbing ?DD ?5.1 ?i ?Napisy)", regex.IGNORECASE, {"remove": True}),
+    ("cs", r"\bCZ[EH]?\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("cs", r"\bczech\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("sk", r"\bslo(?:vak|vakian|subs|[\]_)]?\.\w{2,4}$)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("hu", r"\bHU\b", 0, {"skipFromTitle": True}),
+    ("hu", r"\bHUN(?:garian)?\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("ro", r"\bROM(?:anian)?\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("ro", r"\bRO(?=[ .,/-]*(?:[A-Z]{2}[ .,/-]+)*sub)", regex.IGNORECASE, {}),
+    ("bg", r"\bbul(?:garian)?\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("sr", r"\b(?:srp|serbian)\b", regex.IGNORECASE, {}),
+    ("hr", r"\b(?:HRV|croatian)\b", regex.IGNORECASE, {}),
+    ("hr", r"\bHR(?=[ .,/-]*(?:[A-Z]{2}[ .,/-]+)*sub)\b", regex.IGNORECASE, {}),
+    ("sl", r"\bslovenian\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("nl", r"\b(?:(?<!w{3}\.\w+\.)NL|dut|holand[eê]s)\b", regex.IGNORECASE, {}),
+    ("nl", r"\bdutch\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("nl", r"\bflemish\b", regex.IGNORECASE, {}),
+    ("da", r"\b(?:DK|danska|dansub|nordic)\b", regex.IGNORECASE, {}),
+    ("da", r"\b(danish|dinamarqu[eê]s)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("da", r"\bdan\b(?=.*\.(?:srt|vtt|ssa|ass|sub|idx)$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("fi", r"\b(?:(?<!w{3}\.\w+\.|Sci-)FI|finsk|finsub|nordic)\b", regex.IGNORECASE, {}),
+    ("fi", r"\bfinnish\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("sv", r"\b(?:(?<!w{3}\.\w+\.)SE|swe|swesubs?|sv(?:ensk)?|nordic)\b", regex.IGNORECASE, {}),
+    ("sv", r"\b(swedish|sueco)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("no", r"\b(?:NOR|norsk|norsub|nordic)\b", regex.IGNORECASE, {}),
+    ("no", r"\b(norwegian|noruegu[eê]s|bokm[aå]l|nob|nor(?=[\]_)]?\.\w{2,4}$))\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("ar", r"\b(?:arabic|[aá]rabe|ara)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("ar", r"\barab.*(?:audio|lang(?:uage)?|sub(?:s|titles?)?)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("ar", r"\bar(?=\.(?:ass|ssa|srt|sub|idx)$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("tr", r"\b(?:turkish|tur(?:co)?)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("tr", r"\b(TİVİBU|tivibu|bitturk(.net)?|turktorrent)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("vi", r"\bvietnamese\b|\bvie(?=[\]_)]?\.\w{2,4}$)", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("id", r"\bind(?:onesian)?\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("th", r"\b(thai|tailand[eê]s)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("th", r"\b(THA|tha)\b", 0, {"skipFromTitle": True}),
+    ("ms", r"\b(?:malay|may(?=[\]_)]?\.\w{2,4}$)|(?<=subs?\([a-z,]+)may)\b", regex.IGNORECASE, {"skipIfFirst": True}),
+    ("he", r"\bheb(?:rew|raico)?\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    ("fa", r"\b(persian|persa)\b", regex.IGNORECASE, {"skipFromTitle": True}),
+    # Scripts
+    ("ja", r"[\u3040-\u30ff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # japanese
+    ("zh", r"[\u3400-\u4dbf]+", regex.IGNORECASE, {"skipFromTitle": True}),  # chinese
+    ("zh", r"[\u4e00-\u9fff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # chinese
+    ("zh", r"[\uf900-\ufaff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # chinese
+    ("ja", r"[\uff66-\uff9f]+", regex.IGNORECASE, {"skipFromTitle": True}),  # japanese
+    ("ru", r"[\u0400-\u04ff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # russian
+    ("ar", r"[\u0600-\u06ff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # arabic
+    ("ar", r"[\u0750-\u077f]+", regex.IGNORECASE, {"skipFromTitle": True}),  # arabic
+    ("kn", r"[\u0c80-\u0cff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # kannada
+    ("ml", r"[\u0d00-\u0d7f]+", regex.IGNORECASE, {"skipFromTitle": True}),  # malayalam
+    ("th", r"[\u0e00-\u0e7f]+", regex.IGNORECASE, {"skipFromTitle": True}),  # thai
+    ("hi", r"[\u0900-\u097f]+", regex.IGNORECASE, {"skipFromTitle": True}),  # hindi
+    ("bn", r"[\u0980-\u09ff]+", regex.IGNORECASE, {"skipFromTitle": True}),  # bengali
+    ("gu", r"[\u0a00-\u0a7f]+", regex.IGNORECASE, {"skipFromTitle": True}),  # gujarati
+)
+
+
+def add_language_handlers(parser: Parser):
+    """Add a handler for every row of ``LANGUAGE_RULES``."""
+    for code, pattern, flags, options in LANGUAGE_RULES:
+        parser.add_handler("languages", LazyPattern(pattern, flags), uniq_concat(value(code)), {**options, "skipIfAlreadyFound": False})
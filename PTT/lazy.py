@@ -0,0 +1,61 @@
+from typing import Any
+
+import regex
+
+from PTT.literals import pattern_groups
+
+
+class LazyPattern:
+    """
+    A regex pattern that is only compiled the first time it is used.
+
+    ``pattern`` and ``flags`` are available right away, and so is ``groups`` for patterns the stdlib parser reads (see
+    ``pattern_groups``), which is all a plan needs to be built. The first ``search`` compiles the pattern and replaces
+    itself with the compiled pattern's method, so later searches cost the same as with a compiled pattern. Any other
+    attribute of a compiled pattern compiles it as well.
+
+    ``flags`` are the flags the pattern was created with; unlike ``regex.Pattern.flags`` they do not include flags set
+    inline or by default.
+    """
+
+    __slots__ = ("pattern", "flags", "search", "_compiled")
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+        self.search = self._search_first
+        self._compiled = None
+
+    def compile(self) -> regex.Pattern:
+        """Return the compiled pattern, compiling it if it was not used yet."""
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = regex.compile(self.pattern, self.flags)
+            self.search = compiled.search
+        return compiled
+
+    @property
+    def compiled(self) -> bool:
+        """Whether the pattern has been compiled."""
+        return self._compiled is not None
+
+    @property
+    def groups(self) -> int:
+        """The number of capturing groups, counted without compiling the pattern where possible."""
+        if self._compiled is None:
+            groups = pattern_groups(self)
+            if groups is not None:
+                return groups
+        return self.compile().groups
+
+    def _search_first(self, *args: Any, **kwargs: Any) -> Any:
+        return self.compile().search(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.compile(), name)
+
+    def __reduce__(self):
+        return LazyPattern, (self.pattern, self.flags)
+
+    def __repr__(self) -> str:
+        return f"LazyPattern({self.pattern!r}, {self.flags})"
@@ -0,0 +1,698 @@
+import importlib
+import warnings
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import regex
+
+from PTT.scripts import range_scripts
+from PTT.tokens import DIGIT_REACH, FOLD_TABLE
+
+try:
+    # Imported by name, type checkers do not know the module under its new name.
+    sre_parse = importlib.import_module("re._parser")
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+# Requirements with more alternatives than this cost more to check than the regex search they would save.
+MAX_ALTERNATIVES = 32
+MIN_LITERAL_LENGTH = 2
+# Parsed patterns kept around, so that counting a pattern's groups and extracting its literals parse it only once.
+PARSE_CACHE_SIZE = 64
+# Analysis results kept by pattern source, enough for the patterns of a few rulesets: every new parser builds its plan
+# from the same patterns, and looks them up instead of analysing them again.
+ANALYSIS_CACHE_SIZE = 2048
+
+# `regex`-only syntax that the stdlib parser would silently read as plain literals (POSIX classes, fuzzy matching, version flags).
+UNSUPPORTED_SYNTAX = regex.compile(r"\[:|\{[eisd]\s*[<=]|\(\?V[01]")
+
+REPEATS = tuple(op for op in (getattr(sre_parse, "MAX_REPEAT", None), getattr(sre_parse, "MIN_REPEAT", None), getattr(sre_parse, "POSSESSIVE_REPEAT", None)) if op is not None)
+ZERO_WIDTH = (sre_parse.AT, sre_parse.ASSERT_NOT)
+LOOKAROUNDS = (sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+ATOMIC_GROUP = getattr(sre_parse, "ATOMIC_GROUP", None)
+
+# Repeats of word characters up to this count are enumerated into the tokens they match, e.g. ``subs?``.
+MAX_TOKEN_REPEAT = 4
+# Pattern characters that only match title characters with the same folded form (see ``PTT.tokens.TitleTokens``): the
+# ASCII word characters and the Latin-1 letters.
+TOKEN_CHARS = frozenset("0123456789_abcdefghijklmnopqrstuvwxyz" "àáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ")
+# Title characters that keep their own folded form but match a pattern character case-insensitively: ``I`` matches ``ı``.
+CASE_VARIANTS = {"I": "ı"}
+SEPARATOR_CATEGORIES = (sre_parse.CATEGORY_NOT_WORD, sre_parse.CATEGORY_SPACE)
+# Categories that never match a digit.
+NON_DIGIT_CATEGORIES = (sre_parse.CATEGORY_NOT_DIGIT, sre_parse.CATEGORY_NOT_WORD, sre_parse.CATEGORY_SPACE)
+# Pattern characters whose folded form is that of every title character they match case-insensitively, under regex and
+# re alike: those of these blocks but the outliers, which also match a Greek letter or a variant from another block,
+# like ``в`` and Cyrillic Extended-C. ``i`` additionally matches ``ı``.
+FOLDABLE_BLOCKS = ((0x0000, 0x024F), (0x0400, 0x04FF))
+FOLD_OUTLIERS = frozenset("µßƛıвдостъѣ")
+# Characters found around the digit runs of most titles, the least telling part of a digit context.
+COMMON_DIGIT_NEIGHBOURS = frozenset(" ._-")
+
+
+T = TypeVar("T")
+
+
+class PatternSource(NamedTuple):
+    """The source and flags of a pattern, all that the analysis of a pattern looks at."""
+
+    pattern: str
+    flags: int
+
+
+def by_source(analysis: Callable[[Any], T]) -> Callable[[Any], T]:
+    """
+    Cache an analysis of a pattern by the pattern's source and flags (see ``ANALYSIS_CACHE_SIZE``), so that equal
+    patterns share the result whether they are compiled, lazy or created anew for every parser.
+
+    :param analysis: A function of a pattern, which only reads its ``pattern`` and ``flags``.
+    :return: The cached function.
+    """
+    cached = lru_cache(maxsize=ANALYSIS_CACHE_SIZE)(analysis)
+
+    @wraps(analysis)
+    def analyse(reg_exp: Any) -> T:
+        return cached(PatternSource(reg_exp.pattern, reg_exp.flags))
+
+    return analyse
+
+
+def union_or_none(requirements: Iterable[Optional[Collection[Any]]]) -> Any:
+    """
+    Merge requirements that are met by any member of any of them, e.g. those of the alternatives of a branch.
+
+    :param requirements: Tuples, which keep their order, or sets.
+    :return: The distinct members of all of them, as a tuple for tuples and as a frozenset otherwise, or None if any of
+        them is None (no requirement).
+    """
+    members: Dict[Any, None] = {}
+    is_tuple = False
+    for requirement in requirements:
+        if requirement is None:
+            return None
+        is_tuple = type(requirement) is tuple
+        members.update(dict.fromkeys(requirement))
+    return tuple(members) if is_tuple else frozenset(members)
+
+
+def is_word_char(char: str) -> bool:
+    """Return whether a character is part of a token, as ``\\w`` in a pattern."""
+    return char.isalnum() or char == "_"
+
+
+def fold_title(title: str) -> str:
+    """
+    Case-fold a title for literal prefiltering.
+
+    ``casefold`` maps every character that the regex engine matches case-insensitively against an ASCII letter (``K``, ``ſ``, ``İ``)
+    onto that letter, but for ``ı``, which it leaves alone although ``I`` matches it (see ``CASE_VARIANTS``). That one is
+    folded to ``i`` here, and the combining dot left behind by ``İ`` is dropped so that it cannot split an ASCII literal.
+
+    :param title: The title to fold.
+    :return: The folded title.
+    """
+    folded = title.casefold()
+    if "ı" in folded:
+        folded = folded.replace("ı", "i")
+    if "\u0307" in folded:
+        folded = folded.replace("\u0307", "")
+    return folded
+
+
+def fold_char(item: Tuple) -> Optional[str]:
+    """Return the folded ASCII character a parsed LITERAL or single-letter IN item always matches, or None."""
+    op, av = item
+    if op is sre_parse.LITERAL:
+        chars = {chr(av).lower()}
+    elif op is sre_parse.IN and all(inner_op is sre_parse.LITERAL for inner_op, _ in av):
+        chars = {chr(code).lower() for _, code in av}
+    else:
+        return None
+    if len(chars) != 1:
+        return None
+    char = chars.pop()
+    return char if char.isascii() else None
+
+
+def best_requirement(candidates: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    """Pick the most selective of several requirements that all have to hold."""
+    candidates = [candidate for candidate in candidates if len(candidate) <= MAX_ALTERNATIVES]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda candidate: (min(len(literal) for literal in candidate), -len(candidate)))
+
+
+def requirement(items: List[Tuple]) -> Optional[FrozenSet[str]]:
+    """
+    Compute a set of literals of which at least one has to be present for the parsed pattern items to match.
+
+    :param items: Items of a parsed (sub)pattern.
+    :return: The folded literals, or None if no requirement could be derived.
+    """
+    candidates: List[FrozenSet[str]] = []
+    run: List[str] = []
+
+    for op, av in items:
+        char = fold_char((op, av))
+        if char is not None:
+            run.append(char)
+            continue
+        if op in ZERO_WIDTH:
+            continue
+
+        if run:
+            candidates.append(frozenset(["".join(run)]))
+            run = []
+
+        found = None
+        if op is sre_parse.SUBPATTERN:
+            found = requirement(av[-1])
+        elif op in REPEATS:
+            found = requirement(av[2]) if av[0] >= 1 else None
+        elif op is sre_parse.BRANCH:
+            alternatives = [requirement(alternative) for alternative in av[1]]
+            if all(alternatives):
+                found = union_or_none(alternatives)
+        elif op is sre_parse.ASSERT:
+            found = requirement(av[1])
+        elif op is ATOMIC_GROUP:
+            found = requirement(av)
+
+        if found:
+            candidates.append(found)
+
+    if run:
+        candidates.append(frozenset(["".join(run)]))
+
+    return best_requirement(candidates)
+
+
+@by_source
+def pattern_groups(reg_exp: Any) -> Optional[int]:
+    """
+    Count the capturing groups of a pattern without compiling it.
+
+    :param reg_exp: The pattern, compiled or not.
+    :return: The number of groups, or None if the stdlib parser does not read the pattern the way regex does.
+    """
+    parsed = parse_pattern(reg_exp.pattern, reg_exp.flags & regex.VERBOSE)
+    return None if parsed is None else parsed.state.groups - 1
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_pattern(pattern: str, verbose: int = 0) -> Optional[Any]:
+    """
+    Parse a pattern with the stdlib parser.
+
+    :param pattern: The pattern source.
+    :param verbose: ``regex.VERBOSE`` if the pattern is verbose, else 0.
+    :return: The parsed pattern, or None if the stdlib parser does not read the pattern the way regex does.
+    """
+    if UNSUPPORTED_SYNTAX.search(pattern):
+        return None
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return sre_parse.parse(pattern, verbose)
+    except Exception:
+        return None
+
+
+def fold_word_chars(item: Tuple) -> Optional[FrozenSet[str]]:
+    """Return the folded word characters a parsed LITERAL or IN item matches, if it only matches token characters."""
+    op, av = item
+    if op is sre_parse.LITERAL:
+        codes = [av]
+    elif op is sre_parse.IN and all(inner_op is sre_parse.LITERAL for inner_op, _ in av):
+        codes = [code for _, code in av]
+    else:
+        return None
+    chars = set()
+    for code in codes:
+        char = chr(code)
+        folded = char.translate(FOLD_TABLE).lower()
+        if folded not in TOKEN_CHARS:
+            return None
+        chars.add(folded)
+        if char in CASE_VARIANTS:
+            chars.add(CASE_VARIANTS[char])
+    return frozenset(chars)
+
+
+def word_strings(items: List[Tuple]) -> Optional[FrozenSet[str]]:
+    """
+    Enumerate the folded strings parsed pattern items match, if they only ever match a few strings of word characters.
+
+    :param items: Items of a parsed (sub)pattern.
+    :return: The strings, or None if the items match other characters or too many strings.
+    """
+    strings = frozenset([""])
+    for op, av in items:
+        chars = fold_word_chars((op, av))
+        if chars is not None:
+            options = chars
+        elif op in LOOKAROUNDS:
+            # Zero-width: they can only rule matches out.
+            continue
+        elif op is sre_parse.SUBPATTERN:
+            options = word_strings(av[-1])
+        elif op is sre_parse.BRANCH:
+            alternatives = [word_strings(alternative) for alternative in av[1]]
+            options = union_or_none(alternatives)
+        elif op in REPEATS and av[1] <= MAX_TOKEN_REPEAT:
+            body = word_strings(av[2])
+            options = None if body is None else frozenset(repeated for count in range(av[0], av[1] + 1) for repeated in repeat_strings(body, count))
+        else:
+            return None
+        if options is None:
+            return None
+        strings = frozenset(string + option for string in strings for option in options)
+        if len(strings) > MAX_ALTERNATIVES:
+            return None
+    return strings
+
+
+def repeat_strings(strings: FrozenSet[str], count: int) -> FrozenSet[str]:
+    """Return every concatenation of ``count`` of the strings."""
+    repeated = frozenset([""])
+    for _ in range(count):
+        repeated = frozenset(prefix + string for prefix in repeated for string in strings)
+    return repeated
+
+
+def is_separator(item: Tuple) -> bool:
+    """Return whether a parsed item always matches one or more non-word characters."""
+    op, av = item
+    if op is sre_parse.LITERAL:
+        return not is_word_char(chr(av))
+    if op is sre_parse.IN:
+        return all((inner_op is sre_parse.LITERAL and not is_word_char(chr(inner_av))) or (inner_op is sre_parse.CATEGORY and inner_av in SEPARATOR_CATEGORIES) for inner_op, inner_av in av)
+    if op in REPEATS:
+        return av[0] >= 1 and len(av[2]) == 1 and is_separator(av[2][0])
+    return False
+
+
+def is_optional_separator(item: Tuple) -> bool:
+    """Return whether a parsed item matches nothing or non-word characters only."""
+    op, av = item
+    return op in REPEATS and av[0] == 0 and len(av[2]) == 1 and is_separator(av[2][0])
+
+
+def token_starts(items: List[Tuple], index: int) -> bool:
+    """Return whether whatever the items from ``index`` on match is preceded by a non-word character or the start."""
+    for op, av in reversed(items[:index]):
+        if op is sre_parse.AT:
+            return av in (sre_parse.AT_BOUNDARY, sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING)
+        if op in LOOKAROUNDS or is_optional_separator((op, av)):
+            # Zero-width, or a separator that may be absent: the items before decide.
+            continue
+        return is_separator((op, av))
+    return False
+
+
+def token_ends(items: List[Tuple], index: int) -> bool:
+    """Return whether whatever the items before ``index`` match is followed by a non-word character or the end."""
+    for op, av in items[index:]:
+        if op is sre_parse.AT:
+            return av in (sre_parse.AT_BOUNDARY, sre_parse.AT_END, sre_parse.AT_END_STRING)
+        if op is sre_parse.ASSERT and av[0] == 1 and token_ends(av[1], 0):
+            return True
+        if op in LOOKAROUNDS or is_optional_separator((op, av)):
+            continue
+        return is_separator((op, av))
+    return False
+
+
+def token_requirement(items: List[Tuple]) -> Optional[FrozenSet[str]]:
+    """
+    Compute a set of tokens of which at least one has to be present for the parsed pattern items to match.
+
+    A stretch of items that only matches a few strings of word characters, with a ``\\b``, the start or end of the title
+    or a non-word character on both sides, can only match a whole token.
+
+    :param items: Items of a parsed (sub)pattern.
+    :return: The folded tokens, or None if no requirement could be derived.
+    """
+    candidates: List[FrozenSet[str]] = []
+    start = 0
+    while start < len(items):
+        end = start
+        while end < len(items) and word_strings(items[start : end + 1]) is not None:
+            end += 1
+        while end > start and items[end - 1][0] in LOOKAROUNDS:
+            # A lookahead after the word may be what ends it, see ``token_ends``.
+            end -= 1
+        if end > start:
+            strings = word_strings(items[start:end])
+            if strings is not None and "" not in strings and token_starts(items, start) and token_ends(items, end):
+                candidates.append(strings)
+            start = end
+            continue
+
+        op, av = items[start]
+        found = None
+        if op is sre_parse.SUBPATTERN:
+            found = token_requirement(av[-1])
+        elif op in REPEATS and av[0] >= 1:
+            found = token_requirement(av[2])
+        elif op is sre_parse.BRANCH:
+            alternatives = [token_requirement(alternative) for alternative in av[1]]
+            if all(alternatives):
+                found = union_or_none(alternatives)
+        if found:
+            candidates.append(found)
+        start += 1
+
+    return best_requirement(candidates)
+
+
+@by_source
+def required_tokens(reg_exp: regex.Pattern) -> Optional[FrozenSet[str]]:
+    """
+    Extract the tokens a compiled pattern needs: the pattern can only match a title with at least one of them among its
+    folded tokens (see ``PTT.tokens.TitleTokens``).
+
+    Unlike literals, tokens also rule out titles that only contain the text inside a longer word, like ``es`` in
+    ``Series``. Patterns whose word boundaries differ from the tokenizer's (``ASCII``, ``WORD`` or ``FULLCASE``) yield
+    None and are never gated.
+
+    :param reg_exp: The compiled pattern.
+    :return: The folded tokens, or None.
+    """
+    if reg_exp.flags & (regex.ASCII | regex.WORD | regex.FULLCASE):
+        return None
+    parsed = parse_pattern(reg_exp.pattern, reg_exp.flags & regex.VERBOSE)
+    if parsed is None or parsed.state.flags & sre_parse.SRE_FLAG_ASCII:
+        return None
+    return token_requirement(list(parsed))
+
+
+def item_scripts(item: Tuple) -> Optional[FrozenSet[str]]:
+    """Return the scripts a parsed LITERAL or IN item matches, if it only matches characters of ``SCRIPT_BLOCKS``."""
+    op, av = item
+    if op is sre_parse.LITERAL:
+        return range_scripts(av, av)
+    if op is not sre_parse.IN:
+        return None
+    found = set()
+    for inner_op, inner_av in av:
+        if inner_op is sre_parse.LITERAL:
+            scripts = range_scripts(inner_av, inner_av)
+        elif inner_op is sre_parse.RANGE:
+            scripts = range_scripts(*inner_av)
+        else:
+            return None
+        if scripts is None:
+            return None
+        found |= scripts
+    return frozenset(found)
+
+
+def script_requirement(items: List[Tuple]) -> Optional[FrozenSet[str]]:
+    """
+    Compute a set of scripts of which at least one has to occur in the title for the parsed pattern items to match.
+
+    :param items: Items of a parsed (sub)pattern.
+    :return: The script names, or None if no requirement could be derived.
+    """
+    candidates: List[FrozenSet[str]] = []
+    for op, av in items:
+        found = item_scripts((op, av))
+        if found is None:
+            if op is sre_parse.SUBPATTERN:
+                found = script_requirement(av[-1])
+            elif op in REPEATS and av[0] >= 1:
+                found = script_requirement(av[2])
+            elif op is sre_parse.BRANCH:
+                alternatives = [script_requirement(alternative) for alternative in av[1]]
+                if all(alternatives):
+                    found = union_or_none(alternatives)
+            elif op is sre_parse.ASSERT:
+                found = script_requirement(av[1])
+            elif op is ATOMIC_GROUP:
+                found = script_requirement(av)
+        if found:
+            candidates.append(found)
+    return min(candidates, key=len) if candidates else None
+
+
+@by_source
+def required_scripts(reg_exp: regex.Pattern) -> Optional[FrozenSet[str]]:
+    """
+    Extract the scripts a compiled pattern needs: the pattern can only match a title in which at least one of them
+    occurs (see ``PTT.scripts.title_scripts``), e.g. ``cyrillic`` for ``[Сс]езон``.
+
+    :param reg_exp: The compiled pattern.
+    :return: The script names, or None.
+    """
+    if reg_exp.flags & regex.FULLCASE:
+        return None
+    parsed = parse_pattern(reg_exp.pattern, reg_exp.flags & regex.VERBOSE)
+    if parsed is None:
+        return None
+    return script_requirement(list(parsed))
+
+
+def fold_context_chars(codes: List[int]) -> Optional[FrozenSet[str]]:
+    """Return the folded title characters that can match the pattern characters, or None if one does not fold simply."""
+    chars = set()
+    for code in codes:
+        char = chr(code)
+        folded = char.translate(FOLD_TABLE).lower()
+        if not any(first <= code <= last for first, last in FOLDABLE_BLOCKS) or folded in FOLD_OUTLIERS:
+            return None
+        chars.add(folded)
+        if folded == "i":
+            chars.add("ı")
+    return frozenset(chars)
+
+
+def context_chars(item: Tuple) -> Optional[FrozenSet[str]]:
+    """Return folded characters of which every match of a parsed item contains at least one, or None."""
+    op, av = item
+    if op is sre_parse.LITERAL:
+        return fold_context_chars([av])
+    if op is sre_parse.IN:
+        codes = []
+        for inner_op, inner_av in av:
+            if inner_op is sre_parse.LITERAL:
+                codes.append(inner_av)
+            elif inner_op is sre_parse.RANGE and inner_av[1] - inner_av[0] < MAX_ALTERNATIVES:
+                codes.extend(range(inner_av[0], inner_av[1] + 1))
+            else:
+                return None
+        return fold_context_chars(codes)
+    if op is sre_parse.SUBPATTERN:
+        return sequence_context_chars(av[-1])
+    if op in REPEATS and av[0] >= 1:
+        return sequence_context_chars(av[2])
+    if op is sre_parse.BRANCH:
+        alternatives = [sequence_context_chars(alternative) for alternative in av[1]]
+        return union_or_none(alternatives)
+    return None
+
+
+def sequence_context_chars(items: List[Tuple]) -> Optional[FrozenSet[str]]:
+    """Return the smallest ``context_chars`` of the items that always match something, or None."""
+    found = [chars for chars in map(context_chars, items) if chars is not None]
+    return min(found, key=len) if found else None
+
+
+def can_match_digit(item: Tuple) -> bool:
+    """Return whether a parsed item may consume a digit."""
+    op, av = item
+    if op is sre_parse.AT or op in LOOKAROUNDS:
+        return False
+    if op is sre_parse.LITERAL:
+        return chr(av).isdecimal()
+    if op is sre_parse.IN:
+        if av and av[0][0] is sre_parse.NEGATE:
+            return not any(inner_op is sre_parse.CATEGORY and inner_av in (sre_parse.CATEGORY_DIGIT, sre_parse.CATEGORY_WORD) for inner_op, inner_av in av[1:])
+        for inner_op, inner_av in av:
+            if inner_op is sre_parse.LITERAL:
+                if chr(inner_av).isdecimal():
+                    return True
+            elif inner_op is sre_parse.RANGE:
+                if any(chr(code).isdecimal() for code in range(inner_av[0], inner_av[1] + 1)):
+                    return True
+            elif inner_op is not sre_parse.CATEGORY or inner_av not in NON_DIGIT_CATEGORIES:
+                return True
+        return False
+    if op is sre_parse.SUBPATTERN:
+        return any(map(can_match_digit, av[-1]))
+    if op in REPEATS:
+        return any(map(can_match_digit, av[2]))
+    if op is sre_parse.BRANCH:
+        return any(can_match_digit(inner) for alternative in av[1] for inner in alternative)
+    return True
+
+
+def is_digit(item: Tuple) -> bool:
+    """Return whether a parsed LITERAL or IN item only matches digits."""
+    op, av = item
+    if op is sre_parse.LITERAL:
+        return chr(av).isdecimal()
+    if op is not sre_parse.IN or not av:
+        return False
+    return all((inner_op is sre_parse.CATEGORY and inner_av is sre_parse.CATEGORY_DIGIT) or (inner_op is sre_parse.LITERAL and chr(inner_av).isdecimal()) or (inner_op is sre_parse.RANGE and all(chr(code).isdecimal() for code in range(inner_av[0], inner_av[1] + 1))) for inner_op, inner_av in av)
+
+
+def edge_is_digit(item: Tuple, last: bool) -> bool:
+    """Return whether a parsed item always starts (or, if ``last``, ends) with a digit."""
+    op, av = item
+    if op is sre_parse.SUBPATTERN:
+        items = av[-1]
+    elif op in REPEATS and av[0] >= 1:
+        items = av[2]
+    elif op is sre_parse.BRANCH:
+        return all(alternative and edge_is_digit(alternative[-1 if last else 0], last) for alternative in av[1])
+    else:
+        return is_digit(item)
+    return bool(items) and edge_is_digit(items[-1 if last else 0], last)
+
+
+def item_widths(item: Tuple) -> Tuple[int, int]:
+    """Return the least and the most characters a parsed item matches, the latter capped just past ``DIGIT_REACH``."""
+    op, av = item
+    if op is sre_parse.AT or op in LOOKAROUNDS:
+        return 0, 0
+    if op in (sre_parse.LITERAL, sre_parse.NOT_LITERAL, sre_parse.IN, sre_parse.ANY):
+        return 1, 1
+    if op is sre_parse.SUBPATTERN:
+        return sequence_widths(av[-1])
+    if op in REPEATS:
+        least, most = sequence_widths(av[2])
+        return av[0] * least, min(av[1] * most, DIGIT_REACH + 1)
+    if op is sre_parse.BRANCH:
+        widths = [sequence_widths(alternative) for alternative in av[1]]
+        return min(least for least, _ in widths), max(most for _, most in widths)
+    return 0, DIGIT_REACH + 1
+
+
+def sequence_widths(items: List[Tuple]) -> Tuple[int, int]:
+    """Return the least and the most characters parsed items match, the latter capped just past ``DIGIT_REACH``."""
+    least = most = 0
+    for item in items:
+        item_least, item_most = item_widths(item)
+        least += item_least
+        most = min(most + item_most, DIGIT_REACH + 1)
+    return least, most
+
+
+def neighbour_requirements(items: List[Tuple], sign: int, least: int = 0, most: int = 0) -> List[FrozenSet[Tuple[int, str]]]:
+    """
+    Collect digit context requirements from the items next to a digit run, in order of increasing distance from it.
+
+    :param items: The items after the run (``sign`` 1) or before it, nearest first (``sign`` -1).
+    :param sign: The sign of the offsets.
+    :param least: The fewest characters between the run and the first item.
+    :param most: The most characters between the run and the first item.
+    :return: Sets of (offset, folded character) pairs, of which every match has at least one.
+    """
+    candidates: List[FrozenSet[Tuple[int, str]]] = []
+    for op, av in items:
+        if op is sre_parse.ASSERT and av[0] == sign:
+            # A lookaround on the run's side: what it looks at is there as well.
+            inner = list(av[1])
+            candidates.extend(neighbour_requirements(inner if sign == 1 else inner[::-1], sign, least, most))
+            continue
+        if can_match_digit((op, av)):
+            break
+        item_least, item_most = item_widths((op, av))
+        chars = context_chars((op, av))
+        if chars is not None and most + item_most <= DIGIT_REACH:
+            candidates.append(frozenset((sign * offset, char) for offset in range(least + 1, most + item_most + 1) for char in chars))
+        least += item_least
+        most += item_most
+        if most >= DIGIT_REACH:
+            break
+    return candidates
+
+
+def digit_context_requirement(items: List[Tuple]) -> Optional[FrozenSet[Tuple[int, str]]]:
+    """
+    Compute a set of (offset, character) pairs of which at least one has to be in the title's digit context (see
+    ``PTT.tokens.TitleTokens.digit_context``) for the parsed pattern items to match.
+
+    Next to an item that starts or ends with a digit, the pattern can only match where the title has a digit run: items
+    right before or after it that never match a digit match within the run's context.
+
+    :param items: Items of a parsed (sub)pattern.
+    :return: The pairs, or None if no requirement could be derived.
+    """
+    candidates: List[FrozenSet[Tuple[int, str]]] = []
+    for index, (op, av) in enumerate(items):
+        if edge_is_digit((op, av), last=False):
+            candidates.extend(neighbour_requirements(items[:index][::-1], -1))
+        if edge_is_digit((op, av), last=True):
+            candidates.extend(neighbour_requirements(items[index + 1 :], 1))
+
+        found = None
+        if op is sre_parse.SUBPATTERN:
+            found = digit_context_requirement(av[-1])
+        elif op in REPEATS and av[0] >= 1:
+            found = digit_context_requirement(av[2])
+        elif op is sre_parse.ASSERT or op is ATOMIC_GROUP:
+            found = digit_context_requirement(av[1] if op is sre_parse.ASSERT else av)
+        elif op is sre_parse.BRANCH:
+            alternatives = [digit_context_requirement(alternative) for alternative in av[1]]
+            if all(alternatives):
+                found = union_or_none(alternatives)
+        if found:
+            candidates.append(found)
+
+    candidates = [candidate for candidate in candidates if len(candidate) <= MAX_ALTERNATIVES]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda candidate: (sum(char in COMMON_DIGIT_NEIGHBOURS for _, char in candidate), len(candidate)))
+
+
+@by_source
+def required_digit_context(reg_exp: regex.Pattern) -> Optional[FrozenSet[Tuple[int, str]]]:
+    """
+    Extract the digit context a compiled pattern needs: the pattern can only match a title with at least one of the
+    returned (offset, folded character) pairs around its digit runs, e.g. ``(1, "x")`` for ``\\d+x\\d+``.
+
+    Patterns with ``ASCII`` semantics, whose ``\\D`` and ``\\W`` match digits of other scripts, yield None.
+
+    :param reg_exp: The compiled pattern.
+    :return: The pairs, or None.
+    """
+    if reg_exp.flags & regex.ASCII:
+        return None
+    parsed = parse_pattern(reg_exp.pattern, reg_exp.flags & regex.VERBOSE)
+    if parsed is None or parsed.state.flags & sre_parse.SRE_FLAG_ASCII:
+        return None
+    return digit_context_requirement(list(parsed))
+
+
+@by_source
+def required_literals(reg_exp: regex.Pattern) -> Optional[Tuple[str, ...]]:
+    """
+    Extract the literals a compiled pattern needs: the pattern can only match a title whose folded form contains at least one of them.
+
+    Patterns the stdlib parser does not understand, or that only consist of character classes, yield None and are never gated.
+
+    :param reg_exp: The compiled pattern.
+    :return: The folded literals, longest first, or None.
+    """
+    parsed = parse_pattern(reg_exp.pattern, reg_exp.flags & regex.VERBOSE)
+    if parsed is None:
+        return None
+
+    found = requirement(list(parsed))
+    if not found or min(len(literal) for literal in found) < MIN_LITERAL_LENGTH:
+        return None
+    return tuple(sorted(found, key=lambda literal: (-len(literal), literal)))
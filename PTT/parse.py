@@ -1,8 +1,41 @@
 import inspect
-from typing import Any, Callable, Dict, List, Union
+import re
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import regex
 
+from .adult import KeywordMatcher
+from .backend import BACKENDS, choose_pattern
+from .cache import CacheInfo, LRUCache, SQLiteCache, fingerprint_ruleset
+from .fusion import FusedBranches, can_fuse_pattern, fuse_patterns
+from .lazy import LazyPattern
+from .literals import (
+    fold_title,
+    required_digit_context,
+    required_literals,
+    required_scripts,
+    required_tokens,
+    union_or_none,
+)
+from .scripts import title_scripts
+from .spans import TitleSpans
+from .tokens import TitleTokens
 from .transformers import none
 
 # Non-English characters range
@@ -19,6 +52,8 @@ NON_ENGLISH_CHARS = (
     "\u0d00-\u0d7f"  # Malayalam characters
     "\u0e00-\u0e7f"  # Thai characters
 )
+# The scripts of those ranges (see ``PTT.scripts``): titles without any of them skip the non-English cleanup.
+NON_ENGLISH_SCRIPTS = frozenset(["kana", "han", "cyrillic", "arabic", "kannada", "malayalam", "thai"])
 
 CURLY_BRACKETS = ["{", "}"]
 SQUARE_BRACKETS = ["[", "]"]
@@ -40,11 +75,26 @@ MP3_REGEX = regex.compile(r"\bmp3$")
 SPACING_REGEX = regex.compile(r"\s+")
 SPECIAL_CHAR_SPACING = regex.compile(r"[\-\+\_\{\}\[\]]\W{2,}")
 SUB_PATTERN = regex.compile(r"_+")
+# Titles without any of these characters (or a non-English script) cannot match most of the cleanup patterns.
+BRACKET_AND_STAR_CHARS = frozenset("()[]{}【】★")
+STAR_OPENINGS = frozenset("[【★")
+STAR_CLOSINGS = frozenset("]】★")
 
 BEFORE_TITLE_MATCH_REGEX = regex.compile(r"^\[([^[\]]+)]")
 
 DEBUG_HANDLER = False
 
+# Patterns at least this long, or with a lookbehind, are matched with the GIL released (regex's ``concurrent``), so that
+# other threads can parse meanwhile. Cheap patterns keep the GIL, handing it over would cost more than the match.
+CONCURRENT_PATTERN_LENGTH = 200
+LOOKBEHIND_REGEX = regex.compile(r"(?<!\\)\(\?<[=!]")
+
+# Stands for "every field" in the fields a handler reads or writes.
+ANY_FIELD = "*"
+
+# Sentinel for plan values that are not resolved (yet), e.g. transformers whose output depends on the matched text.
+UNSET = object()
+
 
 def extend_options(options: Dict[str, Any] = {}) -> Dict[str, Any]:
     """
@@ -64,7 +114,21 @@ def extend_options(options: Dict[str, Any] = {}) -> Dict[str, Any]:
     return options
 
 
-def create_handler_from_regexp(name: str, reg_exp: regex.Pattern, transformer: Callable, options: Dict[str, Any]) -> Callable:
+class Handler(Protocol):
+    """
+    A handler as ``Parser.add_handler`` stores it: a function of the parse context that carries its name and options.
+    Handlers made by ``create_handler_from_regexp`` carry their pattern and transformer as well.
+    """
+
+    handler_name: str
+    reg_exp: Union[regex.Pattern, LazyPattern, KeywordMatcher]
+    transformer: Callable
+    options: Dict[str, Any]
+
+    def __call__(self, context: Dict[str, Any]) -> Optional[Dict[str, Any]]: ...
+
+
+def create_handler_from_regexp(name: str, reg_exp: Union[regex.Pattern, LazyPattern, KeywordMatcher], transformer: Callable, options: Dict[str, Any]) -> Handler:
     """
     Create a handler function from a regular expression pattern.
 
@@ -109,39 +173,343 @@ def create_handler_from_regexp(name: str, reg_exp: regex.Pattern, transformer: C
         return None
 
     handler.__name__ = name
-    handler.handler_name = name
-    return handler
+    regexp_handler = cast(Handler, handler)
+    regexp_handler.handler_name = name
+    regexp_handler.reg_exp = reg_exp
+    regexp_handler.transformer = transformer
+    regexp_handler.options = options
+    return regexp_handler
+
+
+class HandlerStep(NamedTuple):
+    """
+    A single pre-resolved entry of a compiled parser plan.
+
+    Regex handlers are flattened into their pattern, transformer and option flags so that the parse loop does not have to
+    look any of them up per call. Function handlers only carry ``handler`` and are called with the parse context.
+    ``reg_exp`` is the pattern to search with, which may be a stdlib ``re`` pattern (see ``compile_stdlib``) or a
+    ``LazyPattern`` that is compiled by its first search, or a ``KeywordMatcher``.
+
+    ``literals`` holds case-folded strings of which at least one has to occur in the title for the pattern to match; the
+    regex search is skipped when none of them does. ``tokens`` does the same for whole words: at least one of them has
+    to be a token of the title (see ``PTT.tokens``), and ``scripts`` for writing systems: at least one of them has to
+    occur in the title (see ``PTT.scripts``). ``digit_context`` holds (offset, character) pairs of which at least one
+    has to occur around the title's digit runs (see ``TitleTokens.digit_context``), which rules out most season and
+    episode patterns on titles without such numbering. ``concurrent`` steps are searched with the GIL released.
+
+    A step with ``branches`` stands for several fused steps (see ``fuse_steps``); the branch that matched supplies the
+    per-step values once the match is resolved.
+    """
+
+    name: str
+    handler: Handler
+    reg_exp: Any = None
+    transformer: Any = None
+    has_groups: bool = False
+    pass_existing: bool = False
+    constant: Any = UNSET
+    skip_if_already_found: bool = False
+    skip_from_title: bool = False
+    skip_if_first: bool = False
+    remove: bool = False
+    value: Any = UNSET
+    literals: Optional[Tuple[str, ...]] = None
+    concurrent: bool = False
+    branches: Optional[FusedBranches] = None
+    tokens: Optional[FrozenSet[str]] = None
+    scripts: Optional[FrozenSet[str]] = None
+    digit_context: Optional[FrozenSet[Tuple[int, str]]] = None
+
+
+def compile_step(handler: Handler, backend: str = "regex") -> HandlerStep:
+    """
+    Resolve a handler into a plan step.
+
+    Transformer arity, option flags, constant transformer outputs and the literal prefilter are resolved here once instead
+    of on every match. Literals and tokens declared through the ``literals`` and ``tokens`` options take precedence over
+    the extracted ones, and the ``concurrent`` option overrides whether the pattern is long enough to be matched with the
+    GIL released.
+
+    Depending on the backend, the pattern may be searched with the stdlib ``re`` instead (see ``choose_pattern``).
+    Concurrent steps stay on regex, re cannot release the GIL during a match. Lazy patterns (see ``LazyPattern``) stay
+    lazy under the regex backend only.
+
+    :param handler: A handler added through ``Parser.add_handler``.
+    :param backend: One of ``BACKENDS``.
+    :return: The compiled step.
+    """
+    reg_exp = getattr(handler, "reg_exp", None)
+    if reg_exp is None:
+        return HandlerStep(handler.handler_name, handler)
+
+    transformer = handler.transformer
+    options = handler.options
+    constant = getattr(transformer, "constant", UNSET)
+    if type(constant) is str:
+        constant = constant.strip()
+    literals = options.get("literals")
+    # Keyword matchers are no regex: they have no literal requirement and hold the GIL.
+    is_regex = not isinstance(reg_exp, KeywordMatcher)
+    literals = tuple(fold_title(literal) for literal in literals) if literals else required_literals(reg_exp) if is_regex else None
+    tokens = options.get("tokens")
+    tokens = frozenset(token.lower() for token in tokens) if tokens else required_tokens(reg_exp) if is_regex else None
+    scripts = required_scripts(reg_exp) if is_regex else None
+    digit_context = required_digit_context(reg_exp) if is_regex else None
+    concurrent = options.get("concurrent")
+    if concurrent is None:
+        concurrent = is_regex and (len(reg_exp.pattern) >= CONCURRENT_PATTERN_LENGTH or LOOKBEHIND_REGEX.search(reg_exp.pattern) is not None)
+    if backend != "regex" and isinstance(reg_exp, LazyPattern):
+        # Choosing between the engines compiles the pattern either way.
+        reg_exp = reg_exp.compile()
+    if not concurrent:
+        reg_exp = choose_pattern(reg_exp, backend)
+        if isinstance(reg_exp, re.Pattern):
+            # The stdlib's idea of a word character is not quite the tokenizer's.
+            tokens = None
+    return HandlerStep(
+        name=handler.handler_name,
+        handler=handler,
+        reg_exp=reg_exp,
+        transformer=transformer,
+        has_groups=reg_exp.groups >= 1,
+        pass_existing=len(inspect.signature(transformer).parameters) > 1,
+        constant=constant,
+        skip_if_already_found=bool(options.get("skipIfAlreadyFound", False)),
+        skip_from_title=bool(options.get("skipFromTitle", False)),
+        skip_if_first=bool(options.get("skipIfFirst", False)),
+        remove=bool(options.get("remove", False)),
+        value=options.get("value", UNSET),
+        literals=literals,
+        concurrent=bool(concurrent),
+        tokens=tokens,
+        scripts=scripts,
+        digit_context=digit_context,
+    )
+
+
+class HandlerRun(NamedTuple):
+    """
+    A maximal stretch of contiguous plan steps that write the same field.
+
+    A run is ``skippable`` when every step in it is a regex handler with ``skipIfAlreadyFound``: once the field is set,
+    none of them can do anything, so the whole run is skipped with a single lookup and left as soon as one step matches.
+    ``fused_steps`` are the steps as they are executed, with compatible stretches merged (see ``fuse_steps``).
+    """
+
+    name: str
+    steps: Tuple[HandlerStep, ...]
+    skippable: bool
+    fused_steps: Tuple[HandlerStep, ...]
+
+
+def can_fuse_step(step: HandlerStep) -> bool:
+    """
+    Return whether a step can be merged with its neighbours: a regex handler with ``skipIfAlreadyFound``, without
+    ``skipIfFirst`` and with a constant, non-None transformer output, so that the first step that matches always sets
+    the field and ends the stretch.
+    """
+    return (
+        step.reg_exp is not None
+        and step.skip_if_already_found
+        and not step.skip_if_first
+        and step.constant is not UNSET
+        and step.constant is not None
+        and not step.concurrent
+        and not isinstance(step.reg_exp, KeywordMatcher)
+        and can_fuse_pattern(step.reg_exp)
+    )
 
 
-def clean_title(raw_title: str) -> str:
+def fuse_steps(steps: Tuple[HandlerStep, ...]) -> Tuple[HandlerStep, ...]:
+    """
+    Merge every stretch of at least two contiguous fusable steps of one field into a single step that searches the title
+    once with an alternation of their patterns (see ``FusedBranches``).
+
+    The first step that matches still wins and the others are still skipped once the field is set, so the result is the
+    same as running the steps one by one.
+
+    :param steps: Steps of a single field, in plan order.
+    :return: The steps with the stretches replaced by fused steps.
+    """
+    fused: List[HandlerStep] = []
+    stretch: List[HandlerStep] = []
+    for step in steps + (None,):
+        if step is not None and can_fuse_step(step):
+            stretch.append(step)
+            continue
+        if len(stretch) > 1:
+            reg_exp, branches = fuse_patterns([member.reg_exp for member in stretch], stretch)
+            literals = union_or_none(member.literals for member in stretch)
+            tokens = union_or_none(member.tokens for member in stretch)
+            scripts = union_or_none(member.scripts for member in stretch)
+            digit_context = union_or_none(member.digit_context for member in stretch)
+            fused.append(HandlerStep(stretch[0].name, stretch[0].handler, reg_exp, skip_if_already_found=True, literals=literals, branches=branches, tokens=tokens, scripts=scripts, digit_context=digit_context))
+        else:
+            fused.extend(stretch)
+        stretch = []
+        if step is not None:
+            fused.append(step)
+    return tuple(fused)
+
+
+def group_runs(plan: Tuple[HandlerStep, ...], fuse: bool = False) -> Tuple[HandlerRun, ...]:
+    """
+    Group a compiled plan into contiguous same-field runs, keeping the execution order.
+
+    :param plan: The compiled plan.
+    :param fuse: Merge compatible steps within each run (see ``fuse_steps``).
+    :return: The runs, in plan order.
+    """
+    runs: List[HandlerRun] = []
+    start = 0
+    for index in range(1, len(plan) + 1):
+        if index < len(plan) and plan[index].name == plan[start].name:
+            continue
+        steps = plan[start:index]
+        skippable = all(step.reg_exp is not None and step.skip_if_already_found for step in steps)
+        runs.append(HandlerRun(plan[start].name, steps, skippable, fuse_steps(steps) if fuse else steps))
+        start = index
+    return tuple(runs)
+
+
+def step_dependencies(step: HandlerStep) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+    """
+    Return the fields a plan step reads and writes, and whether it may remove text from the title.
+
+    Regex handlers read their own field when they skip or extend an existing value and every field's match position
+    with ``skipIfFirst``. Function handlers declare theirs through the ``reads``, ``writes`` and ``remove`` options;
+    whatever they leave out is assumed to be ``ANY_FIELD``, and text may be removed unless ``remove`` is False.
+    """
+    if step.reg_exp is None:
+        options = getattr(step.handler, "options", None) or {}
+        reads = options.get("reads")
+        writes = options.get("writes")
+        return (
+            frozenset([ANY_FIELD]) if reads is None else frozenset(reads),
+            frozenset([ANY_FIELD]) if writes is None else frozenset(writes),
+            bool(options.get("remove", True)),
+        )
+    reads = set()
+    if step.skip_if_already_found or step.pass_existing:
+        reads.add(step.name)
+    if step.skip_if_first:
+        reads.add(ANY_FIELD)
+    return frozenset(reads), frozenset([step.name]), step.remove
+
+
+def fields_overlap(first: AbstractSet[str], second: AbstractSet[str]) -> bool:
+    """Return whether two sets of fields share a field, ``ANY_FIELD`` sharing one with any non-empty set."""
+    if not first or not second:
+        return False
+    return ANY_FIELD in first or ANY_FIELD in second or not first.isdisjoint(second)
+
+
+def build_dependency_graph(plan: Tuple[HandlerStep, ...]) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Build the dependency graph of a compiled plan.
+
+    Step ``j`` depends on an earlier step ``i`` when swapping them could change the result: ``j`` reads a field ``i``
+    writes, both write the same field, ``i`` reads a field ``j`` writes, or either of them may remove text from the
+    title (which every later pattern is matched against). Steps that do not depend on each other, directly or through
+    other steps, can be reordered or evaluated independently.
+
+    :param plan: The compiled plan.
+    :return: For every step, the indexes of the earlier steps it directly depends on, in ascending order.
+    """
+    dependencies = [step_dependencies(step) for step in plan]
+    graph: List[Tuple[int, ...]] = []
+    for index, (reads, writes, may_remove) in enumerate(dependencies):
+        graph.append(
+            tuple(
+                earlier
+                for earlier, (earlier_reads, earlier_writes, earlier_may_remove) in enumerate(dependencies[:index])
+                if may_remove
+                or earlier_may_remove
+                or fields_overlap(reads, earlier_writes)
+                or fields_overlap(writes, earlier_writes)
+                or fields_overlap(writes, earlier_reads)
+            )
+        )
+    return tuple(graph)
+
+
+def select_steps(plan: Tuple[HandlerStep, ...], fields: AbstractSet[str]) -> Tuple[HandlerStep, ...]:
+    """
+    Select the steps of a plan needed to compute the given fields exactly as a full parse would.
+
+    Walking the plan backwards, a step is kept when it writes a field that is requested or read by a kept later step,
+    or when it may remove text from the title while a later step is kept (the later step would see a different title).
+    The ``title`` field depends on every match position and therefore keeps the whole plan.
+
+    :param plan: The compiled plan.
+    :param fields: The requested fields.
+    :return: The needed steps, in plan order.
+    """
+    if "title" in fields:
+        return plan
+    required = set(fields)
+    selected: List[HandlerStep] = []
+    for step in reversed(plan):
+        reads, writes, may_remove = step_dependencies(step)
+        if fields_overlap(required, writes) or (may_remove and selected):
+            selected.append(step)
+            required |= reads
+    return tuple(reversed(selected))
+
+
+def ends_with_star_closing(title: str) -> bool:
+    """Return whether a title ends, before a final newline if any, like ``STAR_REGEX_2`` needs it to."""
+    end = len(title) - 1 if title.endswith("\n") else len(title)
+    return end > 0 and title[end - 1] in STAR_CLOSINGS
+
+
+def clean_title(raw_title: str, scripts: Optional[FrozenSet[str]] = None) -> str:
     """
     Clean up a title string by removing unwanted characters and patterns.
 
+    Most titles have no brackets, stars or non-English scripts. Cleaning only removes text, so none of the patterns
+    that need those can match them, and the start was already trimmed the way ``REMAINING_NOT_ALLOWED_SYMBOLS_AT_START_AND_END``
+    would: such titles only go through the trims that apply to any title.
+
     :param raw_title: The raw title string.
+    :param scripts: The scripts that may occur in the title (see ``title_scripts``), if already known.
     :return: The cleaned title string.
     """
+    if scripts is None:
+        scripts = title_scripts(raw_title)
     cleaned_title = raw_title
     cleaned_title = cleaned_title.replace("_", " ")
-    cleaned_title = MOVIE_REGEX.sub("", cleaned_title)
-    cleaned_title = NOT_ALLOWED_SYMBOLS_AT_START_AND_END.sub("", cleaned_title)
-    cleaned_title = RUSSIAN_CAST_REGEX.sub("", cleaned_title)
-    cleaned_title = STAR_REGEX_1.sub(r"\1", cleaned_title)
-    cleaned_title = STAR_REGEX_2.sub(r"\1", cleaned_title)
-    cleaned_title = ALT_TITLES_REGEX.sub("", cleaned_title)
-    cleaned_title = NOT_ONLY_NON_ENGLISH_REGEX.sub("", cleaned_title)
-    cleaned_title = REMAINING_NOT_ALLOWED_SYMBOLS_AT_START_AND_END.sub("", cleaned_title)
-    cleaned_title = EMPTY_BRACKETS_REGEX.sub("", cleaned_title)
-    cleaned_title = MP3_REGEX.sub("", cleaned_title)
-    cleaned_title = PARANTHESES_WITHOUT_CONTENT.sub("", cleaned_title)
-    cleaned_title = SPECIAL_CHAR_SPACING.sub("", cleaned_title)
-
-    # Remove brackets if only one is present
-    for open_bracket, close_bracket in BRACKETS:
-        if cleaned_title.count(open_bracket) != cleaned_title.count(close_bracket):
-            cleaned_title = cleaned_title.replace(open_bracket, "").replace(close_bracket, "")
+    if BRACKET_AND_STAR_CHARS.isdisjoint(cleaned_title) and NON_ENGLISH_SCRIPTS.isdisjoint(scripts):
+        cleaned_title = NOT_ALLOWED_SYMBOLS_AT_START_AND_END.sub("", cleaned_title)
+        if "mp3" in cleaned_title:
+            cleaned_title = MP3_REGEX.sub("", cleaned_title)
+        if "-" in cleaned_title or "+" in cleaned_title:
+            cleaned_title = SPECIAL_CHAR_SPACING.sub("", cleaned_title)
+    else:
+        cleaned_title = MOVIE_REGEX.sub("", cleaned_title)
+        cleaned_title = NOT_ALLOWED_SYMBOLS_AT_START_AND_END.sub("", cleaned_title)
+        cleaned_title = RUSSIAN_CAST_REGEX.sub("", cleaned_title)
+        if cleaned_title[:1] in STAR_OPENINGS:
+            cleaned_title = STAR_REGEX_1.sub(r"\1", cleaned_title)
+        # The pattern backtracks from every position of the title, but can only match at a closing bracket or star.
+        if ends_with_star_closing(cleaned_title):
+            cleaned_title = STAR_REGEX_2.sub(r"\1", cleaned_title)
+        if not NON_ENGLISH_SCRIPTS.isdisjoint(scripts):
+            cleaned_title = ALT_TITLES_REGEX.sub("", cleaned_title)
+            cleaned_title = NOT_ONLY_NON_ENGLISH_REGEX.sub("", cleaned_title)
+        cleaned_title = REMAINING_NOT_ALLOWED_SYMBOLS_AT_START_AND_END.sub("", cleaned_title)
+        cleaned_title = EMPTY_BRACKETS_REGEX.sub("", cleaned_title)
+        cleaned_title = MP3_REGEX.sub("", cleaned_title)
+        cleaned_title = PARANTHESES_WITHOUT_CONTENT.sub("", cleaned_title)
+        cleaned_title = SPECIAL_CHAR_SPACING.sub("", cleaned_title)
+
+        # Remove brackets if only one is present
+        for open_bracket, close_bracket in BRACKETS:
+            if cleaned_title.count(open_bracket) != cleaned_title.count(close_bracket):
+                cleaned_title = cleaned_title.replace(open_bracket, "").replace(close_bracket, "")
 
     if " " not in cleaned_title and "." in cleaned_title:
-        cleaned_title = regex.sub(r"\.", " ", cleaned_title)
+        cleaned_title = cleaned_title.replace(".", " ")
 
     cleaned_title = REDUNDANT_SYMBOLS_AT_END.sub("", cleaned_title)
     cleaned_title = SPACING_REGEX.sub(" ", cleaned_title)
@@ -164,6 +532,22 @@ def translate_langs(langs: List[str]) -> List[str]:
     return [LANGUAGES_TRANSLATION_TABLE.get(lang, "") for lang in langs if lang in LANGUAGES_TRANSLATION_TABLE]
 
 
+def copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a parse result so that it shares no mutable values (the list fields and ``offsets``) with the original."""
+    copy = {key: list(val) if type(val) is list else val for key, val in result.items()}
+    if "offsets" in result:
+        copy["offsets"] = {key: list(val) for key, val in result["offsets"].items()}
+    return copy
+
+
+def select_fields(result: Dict[str, Any], fields: AbstractSet[str]) -> Dict[str, Any]:
+    """Keep only the requested fields of a parse result, and of its ``offsets`` if it has them."""
+    selected = {key: val for key, val in result.items() if key in fields}
+    if "offsets" in result:
+        selected["offsets"] = {key: val for key, val in result["offsets"].items() if key in fields}
+    return selected
+
+
 class Parser:
     """
     A parser that can parse release titles using a set of handlers.
@@ -176,6 +560,11 @@ class Parser:
     regular expression pattern. If a regular expression pattern is used, the parser will use the first group as the
     match to be transformed by the transformer function.
 
+    Stages added with add_preprocessor and add_postprocessor run before and after the handlers. All per-call state lives
+    in a context created for each parse, so a single parser can be shared between threads. Function handlers get a
+    fresh context with the current ``title``, ``result``, ``matched`` and ``tokens`` (the ``TitleTokens`` of the title) on
+    every call, so what they store in it does not reach the other handlers or the stages.
+
     Example:
         >>> parser = Parser()
         >>> parser.add_handler("seasons", r"Season (\\d+)", int)
@@ -185,65 +574,493 @@ class Parser:
         >>> print(result)
     """
 
-    def __init__(self):
-        self.handlers: List[Callable] = []
+    def __init__(self, cache_size: int = 0, offsets: bool = False, fuse: bool = False, backend: str = "regex"):
+        """
+        :param cache_size: The number of parse results to keep in an LRU cache (default: 0 disables caching).
+        :param offsets: Track removed text as spans of the title (see ``TitleSpans``) instead of cutting it out on every
+            removal, and add an ``offsets`` field to the result with the ``[start, end)`` span each field was first
+            matched at, in ``context["prepared_title"]`` (the title as it was after the preprocessors).
+        :param fuse: Search runs of compatible value handlers of a field with a single alternation (see ``fuse_steps``).
+            The results are the same either way; it pays off for handlers whose patterns have no literal prefilter.
+        :param backend: The engine to search the handler patterns with: ``regex``, ``re`` for every pattern the stdlib
+            ``re`` compiles the same way, or ``auto`` for those of them that re searches measurably faster, which is
+            timed when the plan is built (see ``PTT.backend``).
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown regex backend {backend!r}, expected one of {', '.join(BACKENDS)}")
+        # Lists while handlers and stages are added, tuples once the parser is frozen.
+        self.handlers: Sequence[Handler] = []
+        self.preprocessors: Sequence[Callable[[Dict[str, Any]], None]] = []
+        self.postprocessors: Sequence[Callable[[Dict[str, Any]], None]] = []
+        self.frozen = False
+        self.offsets = offsets
+        self.fuse = fuse
+        self.backend = backend
+        self._plan: Optional[Tuple[HandlerStep, ...]] = None
+        # The runs together with the plan they were grouped from, so that they follow any plan rebuild.
+        self._runs: Optional[Tuple[Tuple[HandlerStep, ...], Tuple[HandlerRun, ...]]] = None
+        # Runs of the steps selected for a set of requested fields, again together with the plan they came from.
+        self._selected_runs: Dict[FrozenSet[str], Tuple[Tuple[HandlerStep, ...], Tuple[HandlerRun, ...]]] = {}
+        # The dependency graph together with the plan it was built from.
+        self._graph: Optional[Tuple[Tuple[HandlerStep, ...], Tuple[Tuple[int, ...], ...]]] = None
+        self.cache: Optional[LRUCache] = LRUCache(cache_size) if cache_size > 0 else None
+        self.persistent_cache: Optional[SQLiteCache] = None
+        self._fingerprint: Optional[str] = None
 
-    def add_handler(self, handler_name: str, handler: Union[Callable, regex.Pattern] = None, transformer: Callable = None, options: Dict[str, Any] = None):
+    def add_handler(
+        self,
+        handler_name: str,
+        handler: Optional[Union[Callable, regex.Pattern, LazyPattern, KeywordMatcher]] = None,
+        transformer: Optional[Union[Callable, Dict[str, Any]]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ):
         """
-        Add a handler to the parser. The handler can be a function or a regular expression pattern.
+        Add a handler to the parser. The handler can be a function, a regular expression pattern, compiled or lazy
+        (see ``LazyPattern``), or a ``KeywordMatcher``.
 
         :param handler_name: The name of the handler.
         :param handler: The handler function or regex pattern.
         :param transformer: The transformer function to process the match.
-        :param options: Additional options for the handler.
+        :param options: Additional options for the handler. Function handlers take them in place of the transformer as
+            well and only use ``reads``, ``writes`` and ``remove``, which declare their dependencies.
         """
+        if self.frozen:
+            raise ValueError("Cannot add handlers to a frozen parser")
         if handler is None and callable(handler_name):
-            handler = handler_name
-            handler.handler_name = handler_name.__name__ if hasattr(handler_name, "__name__") else "unknown"
-        elif isinstance(handler_name, str) and isinstance(handler, regex.Pattern):
+            handler = cast(Handler, handler_name)
+            handler.handler_name = getattr(handler_name, "__name__", "unknown")
+        elif isinstance(handler_name, str) and isinstance(handler, (regex.Pattern, LazyPattern, KeywordMatcher)):
             transformer = transformer if callable(transformer) else none
             options = extend_options(options if isinstance(options, dict) else {})
             handler = create_handler_from_regexp(handler_name, handler, transformer, options)
         elif isinstance(handler_name, str) and callable(handler):
+            handler = cast(Handler, handler)
             handler.handler_name = handler_name
+            # Function handlers only use the options that declare their dependencies, see ``step_dependencies``.
+            options = options if isinstance(options, dict) else transformer if isinstance(transformer, dict) else {}
+            for key in ("reads", "writes"):
+                if isinstance(options.get(key), str):
+                    raise ValueError(f"The {key} option of {handler_name} should be a collection of field names. Got {options[key]!r}")
+            handler.options = options
         else:
             raise ValueError(f"Handler for {handler_name} should be either a regex pattern or a function. Got {type(handler)}")
 
-        self.handlers.append(handler)
+        cast(List[Handler], self.handlers).append(handler)
+        self._plan = None
+        self.cache_clear()
+
+    def add_preprocessor(self, stage: Callable[[Dict[str, Any]], None]):
+        """
+        Add a stage that runs on the raw title before any handler.
+
+        The stage receives the per-parse context and may replace ``context["title"]``. It can also keep state for a
+        postprocessor in the context; the context is created anew for every parse, so nothing leaks between calls.
+
+        :param stage: The preprocessing function.
+        """
+        if self.frozen:
+            raise ValueError("Cannot add preprocessors to a frozen parser")
+        cast(List[Callable[[Dict[str, Any]], None]], self.preprocessors).append(stage)
+        self.cache_clear()
+
+    def add_postprocessor(self, stage: Callable[[Dict[str, Any]], None]):
+        """
+        Add a stage that runs on the finished result, after the title has been cleaned.
+
+        The stage receives the per-parse context and may modify ``context["result"]``. ``context["prepared_title"]``
+        holds the title as it was after the preprocessors.
+
+        :param stage: The postprocessing function.
+        """
+        if self.frozen:
+            raise ValueError("Cannot add postprocessors to a frozen parser")
+        cast(List[Callable[[Dict[str, Any]], None]], self.postprocessors).append(stage)
+        self.cache_clear()
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Return the hits, misses, evictions and size of the result cache, or None if caching is disabled."""
+        return self.cache.info() if self.cache is not None else None
+
+    def cache_clear(self):
+        """Drop all cached results."""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def fingerprint(self) -> str:
+        """
+        Return a hash of the active ruleset: handler patterns, options and transformers, the pre- and postprocessors,
+        the keyword files and the parser code. Results of two parsers with the same fingerprint are interchangeable.
+        """
+        if self._fingerprint is not None:
+            return self._fingerprint
+        fingerprint = fingerprint_ruleset(self.handlers, self.preprocessors, self.postprocessors, self.settings())
+        if self.frozen:
+            self._fingerprint = fingerprint
+        return fingerprint
+
+    def settings(self) -> Tuple[str, ...]:
+        """Return the constructor settings that can change a parse result, as part of the fingerprint."""
+        return (f"backend={self.backend}", f"offsets={self.offsets}")
+
+    def constructor_settings(self) -> Dict[str, Any]:
+        """Return the constructor arguments an equivalent parser is built with, e.g. in a worker process, but the cache."""
+        return {"backend": self.backend, "fuse": self.fuse, "offsets": self.offsets}
+
+    def set_persistent_cache(self, path: Optional[str]):
+        """
+        Store parse results in an SQLite database at ``path`` (None closes the current one).
+
+        Results are keyed by the parser's fingerprint, entries of rulesets that have not been used for a while are
+        discarded when the database is opened (see ``SQLiteCache``). The in-memory cache, if any, is still consulted
+        first.
+
+        :param path: The database file, created if it does not exist.
+        """
+        if path is not None and not self.frozen:
+            raise ValueError("Freeze the parser before setting a persistent cache, its ruleset must not change")
+        if self.persistent_cache is not None:
+            self.persistent_cache.close()
+        self.persistent_cache = SQLiteCache(path, self.fingerprint()) if path is not None else None
+
+    def freeze(self) -> "Parser":
+        """
+        Compile the handler list into an immutable execution plan and lock the parser against further changes.
+
+        Parsing works without freezing as well (the plan is then built on first use and rebuilt after ``add_handler``),
+        freezing only builds it up front and guarantees it is never invalidated.
+
+        :return: The parser itself, to allow ``Parser().freeze()`` style chaining.
+        """
+        self.handlers = tuple(self.handlers)
+        self.preprocessors = tuple(self.preprocessors)
+        self.postprocessors = tuple(self.postprocessors)
+        self._plan = tuple(compile_step(handler, self.backend) for handler in self.handlers)
+        self._runs = (self._plan, group_runs(self._plan, self.fuse))
+        self.frozen = True
+        return self
+
+    def get_plan(self) -> Tuple[HandlerStep, ...]:
+        """Return the compiled execution plan, building it if the handlers changed since it was last built."""
+        plan = self._plan
+        if plan is None or len(plan) != len(self.handlers):
+            plan = self._plan = tuple(compile_step(handler, self.backend) for handler in self.handlers)
+        return plan
+
+    def get_runs(self) -> Tuple[HandlerRun, ...]:
+        """Return the plan grouped into contiguous same-field runs (see ``HandlerRun``)."""
+        plan = self.get_plan()
+        if self._runs is None or self._runs[0] is not plan:
+            self._runs = (plan, group_runs(plan, self.fuse))
+        return self._runs[1]
+
+    def warmup(self) -> "Parser":
+        """
+        Freeze the parser and compile every lazily compiled pattern of its plan, so that no parse has to.
+
+        That includes the patterns function handlers declare with the ``patterns`` option.
 
-    def parse(self, title: str, translate_languages: bool = False) -> Dict[str, Any]:
+        :return: The parser itself.
+        """
+        for run in self.freeze().get_runs():
+            for step in run.fused_steps:
+                options = getattr(step.handler, "options", None) or {}
+                patterns = (step.reg_exp,) if step.reg_exp is not None else options.get("patterns", ())
+                for pattern in patterns:
+                    if isinstance(pattern, LazyPattern):
+                        pattern.compile()
+        return self
+
+    def get_selected_runs(self, fields: FrozenSet[str]) -> Tuple[HandlerRun, ...]:
+        """Return the runs of only those steps needed for the requested fields (see ``select_steps``)."""
+        plan = self.get_plan()
+        cached = self._selected_runs.get(fields)
+        if cached is None or cached[0] is not plan:
+            cached = self._selected_runs[fields] = (plan, group_runs(select_steps(plan, fields), self.fuse))
+        return cached[1]
+
+    def dependency_graph(self) -> Tuple[Tuple[int, ...], ...]:
+        """
+        Return the dependency graph of the plan: for every step, the indexes of the earlier steps it depends on (see
+        ``build_dependency_graph``). The indexes refer to ``get_plan()``.
+        """
+        plan = self.get_plan()
+        if self._graph is None or self._graph[0] is not plan:
+            self._graph = (plan, build_dependency_graph(plan))
+        return self._graph[1]
+
+    def parse_many(
+        self,
+        titles: Iterable[str],
+        translate_languages: bool = False,
+        lazy: bool = False,
+        workers: int = 1,
+        threads: int = 1,
+        initializer: Optional[Callable[["Parser"], None]] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+        """
+        Parse a batch of release titles, returning the results in input order.
+
+        Identical titles are parsed only once; every further occurrence gets its own copy of the first result, so the
+        returned dictionaries can be modified independently.
+
+        With ``workers`` above 1 the batch is split into chunks that are parsed by a persistent pool of worker
+        processes. Handlers cannot be sent to other processes, so every worker builds its own parser once, with this
+        parser's constructor settings, by calling ``initializer`` on it; it has to be a module-level function. It can
+        only be left out, for ``add_defaults``, when this parser has the default ruleset. The pool is kept alive and
+        reused by later calls with the same ``workers``, ``initializer`` and settings.
+
+        With ``threads`` above 1 the chunks are parsed by threads sharing this parser instead. Long patterns are matched
+        with the GIL released, which is where the threads overlap; it costs no extra memory but scales less than
+        ``workers``.
+
+        :param titles: The release titles to parse.
+        :param translate_languages: Whether to translate language codes to language names or short codes (default: False returns short codes)
+        :param lazy: Return a generator that yields results as they become available instead of a list.
+        :param workers: The number of worker processes, 1 parses in the current process.
+        :param threads: The number of threads, 1 parses in the calling thread. Cannot be combined with ``workers``.
+        :param initializer: The function that adds the handlers to the parser of each worker process, ``add_defaults``
+            when omitted.
+        :param chunk_size: The number of titles sent to a worker at once, sized automatically when omitted.
+        :return: A list of parsed results, or a generator of them when ``lazy`` is set.
+        """
+        if workers > 1 and threads > 1:
+            raise ValueError("Use either workers or threads, not both")
+        if threads > 1:
+            from .pool import parse_threaded
+
+            results = parse_threaded(self, list(titles), translate_languages, threads, chunk_size)
+        elif workers > 1:
+            from .pool import default_fingerprint, parse_parallel
+
+            settings = tuple(sorted(self.constructor_settings().items()))
+            if initializer is None:
+                from .handlers import add_defaults
+
+                if self.fingerprint() != default_fingerprint(settings):
+                    raise ValueError("Worker processes cannot use the handlers of this parser; pass the module-level initializer that adds them")
+                initializer = add_defaults
+            results = parse_parallel(list(titles), translate_languages, workers, initializer, chunk_size, settings)
+        else:
+            results = self._iter_parse_many(titles, translate_languages)
+        return results if lazy else list(results)
+
+    def _iter_parse_many(self, titles: Iterable[str], translate_languages: bool) -> Iterator[Dict[str, Any]]:
+        parse = self.parse
+        self.get_runs()
+        seen: Dict[str, Dict[str, Any]] = {}
+        for title in titles:
+            result = seen.get(title)
+            if result is None:
+                result = parse(title, translate_languages)
+                # Keep a private copy, the caller may modify the yielded result before a duplicate comes along.
+                seen[title] = copy_result(result)
+                yield result
+            else:
+                yield copy_result(result)
+
+    def parse(self, title: str, translate_languages: bool = False, stats: Optional[Dict[str, int]] = None, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Parse a release title and return the parsed data as a dictionary.
 
         :param title: The release title to parse.
         :param translate_languages: Whether to translate language codes to language names or short codes (default: False returns short codes)
+        :param stats: Optional dictionary that receives the number of ``handlers`` in the plan, how many of them were
+            ``evaluated`` and how many runs were ``skipped_runs`` because their field was already set. Bypasses the cache.
+        :param fields: Only compute these fields. Handlers that cannot affect them are skipped, and so is cleaning the
+            title unless ``title`` is requested. The result only contains the requested fields that were found.
         :return: A dictionary containing the parsed data.
         """
-        title = SUB_PATTERN.sub(" ", title)
+        cache = self.cache
+        store = self.persistent_cache
+        if fields is not None:
+            fields = frozenset(fields)
+            cached = cache.get((title, translate_languages)) if cache is not None and stats is None else None
+            if cached is not None:
+                return copy_result(select_fields(cached, fields))
+            return self._parse(title, translate_languages, stats, fields)
+        if stats is not None or (cache is None and store is None):
+            return self._parse(title, translate_languages, stats)
+
+        key = (title, translate_languages)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return copy_result(cached)
+
+        result = store.get(title, translate_languages) if store is not None else None
+        if result is None:
+            result = self._parse(title, translate_languages, stats)
+            if store is not None:
+                store.put(title, translate_languages, result)
+        if cache is not None:
+            cache.put(key, copy_result(result))
+        return result
+
+    def _parse(self, raw_title: str, translate_languages: bool, stats: Optional[Dict[str, int]], fields: Optional[FrozenSet[str]] = None) -> Dict[str, Any]:
         result: Dict[str, Any] = {}
         matched: Dict[str, Any] = {}
+        context = {"title": raw_title, "result": result, "matched": matched}
+        for preprocessor in self.preprocessors:
+            preprocessor(context)
+        context["prepared_title"] = context["title"]
+        # None while the spans have removals that the title does not reflect yet.
+        title: Optional[str]
+        offsets: Dict[str, List[int]] = {}
+        if self.offsets:
+            spans = TitleSpans.from_prepared(context["title"])
+            title = context["title"] = spans.text()
+        else:
+            spans = None
+            title = context["title"] = SUB_PATTERN.sub(" ", context["title"])
         end_of_title = len(title)
+        # Handlers only ever remove text, so a script missing now stays missing.
+        present_scripts = title_scripts(title)
+        before_title: Any = UNSET
+        folded = None
+        # The tokens of the current title, shared by the prefilters, keyword matchers and function handlers.
+        title_tokens: Optional[TitleTokens] = None
+        words = None
+        around_digits = None
+        debug = DEBUG_HANDLER
 
-        for handler in self.handlers:
-            match_result = handler({"title": title, "result": result, "matched": matched})
-
-            if DEBUG_HANDLER is True or (type(DEBUG_HANDLER) is str and DEBUG_HANDLER in handler.handler_name):
-                print(handler.handler_name, match_result, title)
+        evaluated = 0
+        skipped_runs = 0
 
-            if match_result is None:
+        for run_name, _, skippable, steps in self.get_runs() if fields is None else self.get_selected_runs(fields):
+            if skippable and run_name in result:
+                skipped_runs += 1
                 continue
 
-            match_index = match_result.get("match_index")
-            raw_match = match_result.get("raw_match", "")
-            remove = match_result.get("remove", False)
-            skip_from_title = match_result.get("skip_from_title", False)
+            for name, handler, reg_exp, transformer, has_groups, pass_existing, constant, skip_if_already_found, step_skip_from_title, skip_if_first, remove, value, literals, concurrent, branches, tokens, scripts, digit_context in steps:
+                evaluated += 1
+                if reg_exp is None:
+                    if title is None:
+                        assert spans is not None
+                        title = context["title"] = spans.text()
+                    if title_tokens is None:
+                        title_tokens = TitleTokens(title)
+                    # A context of its own, as for every handler call: only the stages share the parse context.
+                    match_result: Any = handler({"title": title, "result": result, "matched": matched, "tokens": title_tokens})
+
+                    if debug is True or (type(debug) is str and debug in name):
+                        print(name, match_result, title)
+
+                    if match_result is None:
+                        continue
 
-            if remove:
-                title = title[:match_index] + title[match_index + len(raw_match) :]
-            if not skip_from_title and match_index and 1 < match_index < end_of_title:
-                end_of_title = match_index
-            if remove and skip_from_title and match_index < end_of_title:
-                end_of_title -= len(raw_match)
+                    match_index = match_result.get("match_index")
+                    raw_match = match_result.get("raw_match", "")
+                    remove = match_result.get("remove", False)
+                    skip_from_title = match_result.get("skip_from_title", False)
+                else:
+                    if skip_if_already_found and name in result:
+                        continue
+                    if scripts is not None and scripts.isdisjoint(present_scripts):
+                        continue
+                    if title is None:
+                        assert spans is not None
+                        title = context["title"] = spans.text()
+                    if literals is not None:
+                        if folded is None:
+                            folded = fold_title(title)
+                        for literal in literals:
+                            if literal in folded:
+                                break
+                        else:
+                            continue
+                    if tokens is not None:
+                        if words is None:
+                            if title_tokens is None:
+                                title_tokens = TitleTokens(title)
+                            words = title_tokens.positions
+                        for token in tokens:
+                            if token in words:
+                                break
+                        else:
+                            continue
+                    if digit_context is not None:
+                        if around_digits is None:
+                            if title_tokens is None:
+                                title_tokens = TitleTokens(title)
+                            around_digits = title_tokens.digit_context
+                        if digit_context.isdisjoint(around_digits):
+                            continue
+                    if concurrent:
+                        match = reg_exp.search(title, concurrent=True)
+                    elif type(reg_exp) is KeywordMatcher:
+                        if title_tokens is None:
+                            title_tokens = TitleTokens(title)
+                        match = reg_exp.search(title, tokens=title_tokens)
+                    else:
+                        match = reg_exp.search(title)
+
+                    if debug is True or (type(debug) is str and debug in name):
+                        print(name, "Try to match " + title, "To " + reg_exp.pattern, "Matched " + str(match))
+
+                    if match is None:
+                        continue
+                    if branches is not None:
+                        match, branch = branches.resolve(title, match, concurrent)
+                        constant, step_skip_from_title, remove, value = branch.constant, branch.skip_from_title, branch.remove, branch.value
+
+                    raw_match = match.group(0)
+                    if constant is UNSET:
+                        clean_match = (match.group(1) if has_groups else raw_match) or raw_match
+                        transformed = transformer(clean_match, result.get(name)) if pass_existing else transformer(clean_match)
+                        if type(transformed) is str:
+                            transformed = transformed.strip()
+                        if transformed is None:
+                            continue
+                    else:
+                        transformed = constant
+
+                    match_index = match.start()
+                    if skip_if_first:
+                        other_indexes = [other["match_index"] for key, other in matched.items() if key != name]
+                        if other_indexes and match_index < min(other_indexes):
+                            continue
+
+                    if name not in matched:
+                        matched[name] = {"raw_match": raw_match, "match_index": match_index}
+                    result[name] = transformed if value is UNSET else value
+
+                    if before_title is UNSET:
+                        before_title_match = BEFORE_TITLE_MATCH_REGEX.match(title)
+                        before_title = before_title_match.group(1) if before_title_match else None
+                    skip_from_title = step_skip_from_title or (before_title is not None and raw_match in before_title)
+
+                if spans is not None:
+                    if name not in offsets and name in result and isinstance(match_index, int):
+                        start = spans.to_original(match_index)
+                        offsets[name] = [start, spans.to_original(match_index + len(raw_match) - 1) + 1 if raw_match else start]
+                    if remove:
+                        spans.remove(match_index, len(raw_match))
+                        title = None
+                        before_title = UNSET
+                        folded = None
+                        title_tokens = None
+                        words = None
+                        around_digits = None
+                elif remove:
+                    title = title[:match_index] + title[match_index + len(raw_match) :]
+                    context["title"] = title
+                    before_title = UNSET
+                    folded = None
+                    title_tokens = None
+                    words = None
+                    around_digits = None
+                if not skip_from_title and match_index and 1 < match_index < end_of_title:
+                    end_of_title = match_index
+                if remove and skip_from_title and match_index < end_of_title:
+                    end_of_title -= len(raw_match)
+                if skippable:
+                    break
+
+        if stats is not None:
+            stats["handlers"] = len(self.get_plan())
+            stats["evaluated"] = evaluated
+            stats["skipped_runs"] = skipped_runs
 
         result.setdefault("episodes", [])
         result.setdefault("seasons", [])
@@ -253,7 +1070,18 @@ class Parser:
             if result["languages"]:
                 result["languages"] = translate_langs(result["languages"])
 
-        # Clean the title up to end_of_title before further processing.
-        title = title[:end_of_title]
-        result["title"] = clean_title(title)
+        if title is None:
+            assert spans is not None
+            title = context["title"] = spans.text()
+        if fields is None or "title" in fields:
+            # Clean the title up to end_of_title before further processing.
+            title = title[:end_of_title]
+            result["title"] = clean_title(title, present_scripts)
+
+        for postprocessor in self.postprocessors:
+            postprocessor(context)
+        if spans is not None:
+            result["offsets"] = offsets
+        if fields is not None:
+            return select_fields(result, fields)
         return result
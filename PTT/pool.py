@@ -0,0 +1,169 @@
+import atexit
+import math
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .parse import Parser, copy_result
+
+# Upper bound for automatically sized chunks: large enough to amortize the inter-process round trip, small enough to
+# keep every worker busy until the end of a batch.
+MAX_CHUNK_SIZE = 512
+# Chunks per worker when sizing them automatically, so that uneven chunks still balance out.
+CHUNKS_PER_WORKER = 4
+
+# The constructor arguments of a parser (see ``Parser.constructor_settings``) as sorted items, so that they can be part of
+# a pool's key.
+Settings = Tuple[Tuple[str, Any], ...]
+
+_pools: Dict[Tuple[int, Callable[[Parser], None], Settings], ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+_worker_parser: Optional[Parser] = None
+
+
+def init_worker(initializer: Callable[[Parser], None], settings: Settings = ()) -> None:
+    """Build the parser of a worker process once, when the process starts."""
+    global _worker_parser
+    parser = Parser(**dict(settings))
+    initializer(parser)
+    _worker_parser = parser.freeze()
+
+
+def parse_chunk(titles: Sequence[str], translate_languages: bool) -> List[Dict[str, Any]]:
+    """Parse a chunk of titles with the parser of the current worker process."""
+    if _worker_parser is None:
+        raise ValueError("parse_chunk runs only in worker processes started by get_pool")
+    parse = _worker_parser.parse
+    return [parse(title, translate_languages) for title in titles]
+
+
+def get_pool(workers: int, initializer: Callable[[Parser], None], settings: Settings = ()) -> ProcessPoolExecutor:
+    """
+    Return the persistent pool for the given worker count and parser setup, starting it on first use.
+
+    :param workers: The number of worker processes.
+    :param initializer: A picklable (module-level) function that adds the handlers to a fresh parser, e.g. ``add_defaults``.
+    :param settings: The constructor arguments of the workers' parsers.
+    :return: The process pool.
+    """
+    key = (workers, initializer, settings)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(initializer, settings))
+        return pool
+
+
+@lru_cache(maxsize=None)
+def default_fingerprint(settings: Settings) -> str:
+    """Return the fingerprint of a parser with the default handlers and the given constructor arguments."""
+    from .handlers import add_defaults
+
+    parser = Parser(**dict(settings))
+    add_defaults(parser)
+    return parser.fingerprint()
+
+
+def shutdown_pools() -> None:
+    """Shut down all persistent worker pools. They are started again on the next parallel parse."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_pools)
+
+
+def parse_in_chunks(titles: Sequence[str], map_chunks: Callable[[List[List[str]]], Iterator[List[Dict[str, Any]]]], workers: int, chunk_size: Optional[int]) -> Iterator[Dict[str, Any]]:
+    """
+    Deduplicate titles, hand them to ``map_chunks`` in chunks and yield the results in input order.
+
+    Every distinct title is parsed once; repeated occurrences get copies of its result.
+
+    :param titles: The release titles to parse.
+    :param map_chunks: Parses the chunks concurrently, returning their results in chunk order.
+    :param workers: The number of workers, used to size the chunks.
+    :param chunk_size: The number of titles per chunk, sized from the batch and worker count when omitted.
+    :return: A generator of parsed results.
+    """
+    positions: Dict[str, int] = {}
+    unique: List[str] = []
+    order: List[int] = []
+    for title in titles:
+        position = positions.get(title)
+        if position is None:
+            position = positions[title] = len(unique)
+            unique.append(title)
+        order.append(position)
+
+    if chunk_size is None:
+        chunk_size = min(MAX_CHUNK_SIZE, math.ceil(len(unique) / (workers * CHUNKS_PER_WORKER))) or 1
+    chunk_results = map_chunks([unique[start : start + chunk_size] for start in range(0, len(unique), chunk_size)])
+
+    results: List[Dict[str, Any]] = []
+    emitted = [False] * len(unique)
+    for position in order:
+        while position >= len(results):
+            results.extend(next(chunk_results))
+        if emitted[position]:
+            yield copy_result(results[position])
+        else:
+            emitted[position] = True
+            # Keep a private copy, the caller may modify the yielded result before a duplicate comes along.
+            result = results[position]
+            results[position] = copy_result(result)
+            yield result
+
+
+def parse_parallel(
+    titles: Sequence[str],
+    translate_languages: bool,
+    workers: int,
+    initializer: Callable[[Parser], None],
+    chunk_size: Optional[int] = None,
+    settings: Settings = (),
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse titles in a persistent process pool, yielding the results in input order.
+
+    :param titles: The release titles to parse.
+    :param translate_languages: Whether to translate language codes to language names.
+    :param workers: The number of worker processes.
+    :param initializer: The function that sets up the parser of each worker.
+    :param chunk_size: The number of titles per dispatched chunk, sized from the batch and worker count when omitted.
+    :param settings: The constructor arguments of the workers' parsers.
+    :return: A generator of parsed results.
+    """
+    pool = get_pool(workers, initializer, settings)
+
+    def map_chunks(chunks: List[List[str]]) -> Iterator[List[Dict[str, Any]]]:
+        return pool.map(parse_chunk, chunks, [translate_languages] * len(chunks))
+
+    return parse_in_chunks(titles, map_chunks, workers, chunk_size)
+
+
+def parse_threaded(parser: Parser, titles: Sequence[str], translate_languages: bool, threads: int, chunk_size: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Parse titles with a pool of threads sharing ``parser``, yielding the results in input order.
+
+    Threads only run in parallel while a long pattern is matched with the GIL released (see ``HandlerStep.concurrent``),
+    so this scales less than ``parse_parallel`` but needs no extra parser per worker.
+
+    :param parser: The parser to share between the threads.
+    :param titles: The release titles to parse.
+    :param translate_languages: Whether to translate language codes to language names.
+    :param threads: The number of threads.
+    :param chunk_size: The number of titles per dispatched chunk, sized from the batch and thread count when omitted.
+    :return: A generator of parsed results.
+    """
+    parse = parser.parse
+    parser.get_runs()
+
+    def parse_titles_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+        return [parse(title, translate_languages) for title in chunk]
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        yield from parse_in_chunks(titles, lambda chunks: executor.map(parse_titles_chunk, chunks), threads, chunk_size)
@@ -0,0 +1,60 @@
+from typing import Any, Dict, Tuple
+
+import regex
+
+from PTT.lazy import LazyPattern
+from PTT.parse import Parser
+from PTT.transformers import value
+
+# The whole words ``T(?:ELE)?S(?:YNC)?(?:Rip)?`` and ``T(?:ELE)?C(?:INE)?(?:Rip)?`` can be, alone or joined to an
+# ``HD`` prefix. The extraction in ``PTT.literals`` does not see through the optional prefix, so the rows declare them.
+TELESYNC_TOKENS = tuple(hd + word + rip for hd in ("", "hd") for word in ("ts", "tsync", "teles", "telesync") for rip in ("", "rip"))
+TELECINE_TOKENS = tuple(hd + word + rip for hd in ("", "hd") for word in ("tc", "tcine", "telec", "telecine") for rip in ("", "rip"))
+
+# The precedence of the ``quality`` values: the value a match sets, the pattern with its flags, and the options of the
+# handler, highest first. Every row has ``skipIfAlreadyFound``, so the first row that matches decides the quality and
+# the rest are not searched. ``remove`` and ``skipFromTitle`` work on the span of that match as with any handler.
+#
+# The parser derives from every pattern the literals or tokens a title needs for it to match, e.g. ``remux`` for the
+# rows with a ``(?=.*remux)`` lookaround, so a title is only searched for the rows it has the words of.
+QUALITY_RULES: Tuple[Tuple[str, str, int, Dict[str, Any]], ...] = (
+    ("TeleSync", r"\b(?:HD[ .-]*)?T(?:ELE)?S(?:YNC)?(?:Rip)?\b", regex.IGNORECASE, {"remove": True, "tokens": TELESYNC_TOKENS}),
+    ("TeleCine", r"\b(?:HD[ .-]*)?T(?:ELE)?C(?:INE)?(?:Rip)?\b", 0, {"remove": True, "tokens": TELECINE_TOKENS}),
+    ("SCR", r"\b(?:DVD?|BD|BR|HD)?[ .-]*Scr(?:eener)?\b", regex.IGNORECASE, {"remove": True}),
+    ("SCR", r"\bP(?:RE)?-?(HD|DVD)(?:Rip)?\b", regex.IGNORECASE, {"remove": True}),
+    ("BluRay REMUX", r"\bBlu[ .-]*Ray\b(?=.*remux)", regex.IGNORECASE, {"remove": True}),
+    ("BluRay REMUX", r"(?:BD|BR|UHD)[- ]?remux", regex.IGNORECASE, {"remove": True}),
+    ("BluRay REMUX", r"(?<=remux.*)\bBlu[ .-]*Ray\b", regex.IGNORECASE, {"remove": True}),
+    ("REMUX", r"\bremux\b", regex.IGNORECASE, {"remove": True}),
+    ("BluRay", r"\bBlu[ .-]*Ray\b(?![ .-]*Rip)", regex.IGNORECASE, {"remove": True}),
+    ("UHDRip", r"\bUHD[ .-]*Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("HDRip", r"\bHD[ .-]*Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("HDRip", r"\bMicro[ .-]*HD\b", regex.IGNORECASE, {"remove": True}),
+    ("BRRip", r"\b(?:BR|Blu[ .-]*Ray)[ .-]*Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("BDRip", r"\bBD[ .-]*Rip\b|\bBDR\b|\bBD-RM\b|[[(]BD[\]) .,-]", regex.IGNORECASE, {"remove": True}),
+    ("DVDRip", r"\b(?:HD[ .-]*)?DVD[ .-]*Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("VHSRip", r"\bVHS[ .-]*Rip?\b", regex.IGNORECASE, {"remove": True}),
+    ("DVD", r"\bDVD(?:R\d?|.*Mux)?\b", regex.IGNORECASE, {"remove": True}),
+    ("VHS", r"\bVHS\b", regex.IGNORECASE, {"remove": True}),
+    ("PPVRip", r"\bPPVRip\b", regex.IGNORECASE, {"remove": True}),
+    ("HDTVRip", r"\bHD.?TV.?Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("HDTV", r"\bDVB[ .-]*(?:Rip)?\b", regex.IGNORECASE, {"remove": True}),
+    ("SATRip", r"\bSAT[ .-]*Rips?\b", regex.IGNORECASE, {"remove": True}),
+    ("TVRip", r"\bTVRips?\b", regex.IGNORECASE, {"remove": True}),
+    ("R5", r"\bR5\b", regex.IGNORECASE, {"remove": True}),
+    ("WEBMux", r"\b(?:DL|WEB|BD|BR)MUX\b", regex.IGNORECASE, {"remove": True}),
+    ("WEBRip", r"\bWEB[ .-]*Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("WEB-DLRip", r"\bWEB[ .-]?DL[ .-]?Rip\b", regex.IGNORECASE, {"remove": True}),
+    ("WEB-DL", r"\bWEB[ .-]*(DL|.BDrip|.DLRIP)\b", regex.IGNORECASE, {"remove": True}),
+    ("WEB", r"\b(?<!\w.)WEB\b|\bWEB(?!([ \.\-\(\],]+\d))\b", regex.IGNORECASE, {"remove": True, "skipFromTitle": True}),
+    ("CAM", r"\b(?:H[DQ][ .-]*)?CAM(?!.?(S|E|\()\d+)(?:H[DQ])?(?:[ .-]*Rip|Rp)?\b", regex.IGNORECASE, {"remove": True, "skipFromTitle": True}),  # can appear in a title as well, check it last
+    ("CAM", r"\b(?:H[DQ][ .-]*)?S[ \.\-]print", regex.IGNORECASE, {"remove": True, "skipFromTitle": True}),  # can appear in a title as well, check it last
+    ("PDTV", r"\bPDTV\b", regex.IGNORECASE, {"remove": True}),
+    ("HDTV", r"\bHD(.?TV)?\b", regex.IGNORECASE, {"remove": True}),
+)
+
+
+def add_quality_handlers(parser: Parser):
+    """Add a handler for every row of ``QUALITY_RULES``, in precedence order."""
+    for quality, pattern, flags, options in QUALITY_RULES:
+        parser.add_handler("quality", LazyPattern(pattern, flags), value(quality), dict(options))
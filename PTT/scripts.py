@@ -0,0 +1,65 @@
+from bisect import bisect_right
+from typing import FrozenSet, Optional, Tuple
+
+# The Unicode blocks handlers are written for, as (first code point, last code point, script), sorted. Cyrillic
+# Extended-C holds variants of Cyrillic letters that match them case-insensitively, so a Cyrillic pattern can match a
+# title with nothing but those.
+SCRIPT_BLOCKS: Tuple[Tuple[int, int, str], ...] = (
+    (0x0400, 0x04FF, "cyrillic"),
+    (0x0600, 0x06FF, "arabic"),
+    (0x0750, 0x077F, "arabic"),
+    (0x0900, 0x097F, "devanagari"),
+    (0x0980, 0x09FF, "bengali"),
+    (0x0A00, 0x0A7F, "gurmukhi"),
+    (0x0C80, 0x0CFF, "kannada"),
+    (0x0D00, 0x0D7F, "malayalam"),
+    (0x0E00, 0x0E7F, "thai"),
+    (0x1C80, 0x1C87, "cyrillic"),
+    (0x3040, 0x30FF, "kana"),
+    (0x3400, 0x4DBF, "han"),
+    (0x4E00, 0x9FFF, "han"),
+    (0xF900, 0xFAFF, "han"),
+    (0xFF66, 0xFF9F, "kana"),
+)
+BLOCK_STARTS = tuple(first for first, _, _ in SCRIPT_BLOCKS)
+NO_SCRIPTS: FrozenSet[str] = frozenset()
+
+
+def title_scripts(title: str) -> FrozenSet[str]:
+    """
+    Return the scripts of ``SCRIPT_BLOCKS`` that occur in a title.
+
+    Most titles are plain ASCII and are answered without looking at a single character; the others are classified once
+    per distinct character.
+
+    :param title: The title.
+    :return: The names of the scripts found.
+    """
+    if title.isascii():
+        return NO_SCRIPTS
+    found = set()
+    for char in set(title):
+        code = ord(char)
+        index = bisect_right(BLOCK_STARTS, code) - 1
+        if index >= 0 and code <= SCRIPT_BLOCKS[index][1]:
+            found.add(SCRIPT_BLOCKS[index][2])
+    return frozenset(found)
+
+
+def range_scripts(first: int, last: int) -> Optional[FrozenSet[str]]:
+    """
+    Return the scripts of a range of code points, if every code point in it belongs to one of ``SCRIPT_BLOCKS``.
+
+    :param first: The first code point.
+    :param last: The last code point, inclusive.
+    :return: The names of the scripts, or None if the range reaches outside the blocks.
+    """
+    found = set()
+    code = first
+    while code <= last:
+        index = bisect_right(BLOCK_STARTS, code) - 1
+        if index < 0 or code > SCRIPT_BLOCKS[index][1]:
+            return None
+        found.add(SCRIPT_BLOCKS[index][2])
+        code = SCRIPT_BLOCKS[index][1] + 1
+    return frozenset(found)
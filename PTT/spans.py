@@ -0,0 +1,88 @@
+from typing import List, Tuple
+
+import regex
+
+# Runs of underscores the parser reads as a single space.
+UNDERSCORES = regex.compile(r"_{2,}")
+
+
+class TitleSpans:
+    """
+    A title with removed text recorded as spans of the original string instead of being cut out right away.
+
+    Removals are kept as sorted, non-overlapping ``[start, end)`` intervals of the original string; touching or
+    overlapping ones are coalesced. The visible string, the original with those intervals left out, is only built
+    when it is asked for, so several removals in a row cost a single rebuild. Indexes into the visible string can be
+    translated back to the original with ``to_original``.
+    """
+
+    __slots__ = ("original", "removed", "visible")
+
+    def __init__(self, original: str):
+        self.original = original
+        self.removed: List[Tuple[int, int]] = []
+        self.visible = original
+
+    @classmethod
+    def from_prepared(cls, prepared: str) -> "TitleSpans":
+        """
+        Start from a title as it was after the preprocessors. Underscores read as spaces, and a run of them as a single
+        one, so the extra underscores of a run start out removed; indexes of the original match the prepared title.
+        """
+        spans = cls(prepared.replace("_", " "))
+        for run in UNDERSCORES.finditer(prepared):
+            spans.removed.append((run.start() + 1, run.end()))
+        if spans.removed:
+            spans.visible = None
+        return spans
+
+    def text(self) -> str:
+        """Return the visible string, building it if text was removed since it was last built."""
+        visible = self.visible
+        if visible is None:
+            original = self.original
+            parts = []
+            position = 0
+            for start, end in self.removed:
+                parts.append(original[position:start])
+                position = end
+            parts.append(original[position:])
+            visible = self.visible = "".join(parts)
+        return visible
+
+    def to_original(self, index: int) -> int:
+        """Translate an index of the visible string into an index of the original."""
+        for start, end in self.removed:
+            if start > index:
+                break
+            index += end - start
+        return index
+
+    def remove(self, index: int, length: int) -> None:
+        """Remove ``length`` visible characters starting at visible ``index``."""
+        if length <= 0:
+            return
+        position = self.to_original(index)
+        added = []
+        for start, end in self.removed:
+            if end <= position:
+                continue
+            if position + length <= start:
+                break
+            # Visible characters run up to the next removed interval, the removal continues behind it.
+            added.append((position, start))
+            length -= start - position
+            position = end
+        added.append((position, position + length))
+
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(self.removed + added):
+            if start == end:
+                continue
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self.removed = merged
+        self.visible = None
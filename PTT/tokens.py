@@ -0,0 +1,168 @@
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+import regex
+
+WORD_RUN = regex.compile(r"\w+")
+DIGIT_RUN = regex.compile(r"\d+")
+# How many characters on either side of a digit run ``TitleTokens.digit_context`` records.
+DIGIT_REACH = 4
+TRAIL_OFFSETS = tuple(range(1, DIGIT_REACH + 1))
+LEAD_OFFSETS = tuple(range(-1, -DIGIT_REACH - 1, -1))
+# Title characters that match an ASCII letter case-insensitively but do not lowercase to it as a single character.
+FOLD_TABLE = str.maketrans({"İ": "i", "ſ": "s"})
+OPENING_BRACKETS = "([{"
+CLOSING_BRACKETS = ")]}"
+
+
+class Token(NamedTuple):
+    """
+    A run of word characters in a title: the boundaries a ``\\b`` in a handler pattern finds.
+
+    ``separator`` is the text between the previous token (or the start of the title) and this one, e.g. ``"."`` or
+    ``" - ["``, and ``depth`` the number of brackets open at the token.
+    """
+
+    text: str
+    folded: str
+    start: int
+    end: int
+    separator: str
+    depth: int
+
+
+class TitleTokens:
+    """
+    A title split into tokens once, for handlers that look words up instead of searching for them.
+
+    ``folded`` is the whole title lowercased the way ``regex.IGNORECASE`` compares ASCII letters, with the same length
+    as the title, so that ``folded[token.start:token.end] == token.folded``. ``starts`` and ``ends`` hold the token
+    offsets. ``tokens`` and ``positions``, which maps every folded token to the indexes of the tokens with that text in
+    title order, and ``digit_context`` are built the first time they are used, and so is everything else: creating the
+    tokens of a title that is never looked at costs nothing.
+    """
+
+    __slots__ = ("title", "_folded", "_starts", "_ends", "_tokens", "_positions", "_digit_context")
+
+    def __init__(self, title: str):
+        self.title = title
+        self._folded: Optional[str] = None
+        self._starts: Optional[List[int]] = None
+        self._ends: Optional[List[int]] = None
+        self._tokens: Optional[Tuple[Token, ...]] = None
+        self._positions: Optional[Dict[str, Tuple[int, ...]]] = None
+        self._digit_context: Optional[Set[Tuple[int, str]]] = None
+
+    @property
+    def folded(self) -> str:
+        """The title, case-folded."""
+        folded = self._folded
+        if folded is None:
+            # Lowercasing keeps the length once the characters that lowercase to two are replaced.
+            folded = self._folded = self.title.translate(FOLD_TABLE).lower()
+        return folded
+
+    @property
+    def starts(self) -> List[int]:
+        """The start offsets of the tokens."""
+        starts = self._starts
+        if starts is None:
+            starts = self._split()[0]
+        return starts
+
+    @property
+    def ends(self) -> List[int]:
+        """The end offsets of the tokens."""
+        ends = self._ends
+        if ends is None:
+            ends = self._split()[1]
+        return ends
+
+    def _split(self) -> Tuple[List[int], List[int]]:
+        starts = []
+        ends = []
+        for run in WORD_RUN.finditer(self.title):
+            starts.append(run.start())
+            ends.append(run.end())
+        self._starts = starts
+        self._ends = ends
+        return starts, ends
+
+    @property
+    def tokens(self) -> Tuple[Token, ...]:
+        """The tokens, in title order."""
+        tokens = self._tokens
+        if tokens is None:
+            title = self.title
+            folded = self.folded
+            built: List[Token] = []
+            depth = 0
+            previous_end = 0
+            for start, end in zip(self.starts, self.ends):
+                separator = title[previous_end:start]
+                for char in separator:
+                    if char in OPENING_BRACKETS:
+                        depth += 1
+                    elif char in CLOSING_BRACKETS and depth:
+                        depth -= 1
+                built.append(Token(title[start:end], folded[start:end], start, end, separator, depth))
+                previous_end = end
+            tokens = self._tokens = tuple(built)
+        return tokens
+
+    @property
+    def positions(self) -> Dict[str, Tuple[int, ...]]:
+        """The indexes of the tokens, by folded text."""
+        positions = self._positions
+        if positions is None:
+            found: Dict[str, List[int]] = {}
+            folded = self.folded
+            for index, (start, end) in enumerate(zip(self.starts, self.ends)):
+                found.setdefault(folded[start:end], []).append(index)
+            positions = self._positions = {word: tuple(indexes) for word, indexes in found.items()}
+        return positions
+
+    @property
+    def digit_context(self) -> Set[Tuple[int, str]]:
+        """
+        The folded characters around the digit runs, as (offset, character) pairs: ``-1`` is the character right before
+        a run, ``1`` the one right after it, up to ``DIGIT_REACH`` characters away and never past the neighbouring run.
+        """
+        context = self._digit_context
+        if context is None:
+            context = self._digit_context = set()
+            # The text between the runs: every gap but the first follows a run, every gap but the last precedes one.
+            gaps = DIGIT_RUN.split(self.folded)
+            if len(gaps) > 1:
+                context.update(zip(LEAD_OFFSETS, gaps[0][: -DIGIT_REACH - 1 : -1]))
+                for gap in gaps[1:-1]:
+                    context.update(zip(TRAIL_OFFSETS, gap))
+                    context.update(zip(LEAD_OFFSETS, gap[: -DIGIT_REACH - 1 : -1]))
+                context.update(zip(TRAIL_OFFSETS, gaps[-1]))
+        return context
+
+    def find(self, word: str) -> Optional[Token]:
+        """Return the first token that equals ``word`` (lowercase) case-insensitively, or None."""
+        indexes = self.positions.get(word)
+        return self.tokens[indexes[0]] if indexes else None
+
+    def __contains__(self, word: str) -> bool:
+        return word in self.positions
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+
+def tokenize(title: str) -> TitleTokens:
+    """
+    Return the tokens of a title.
+
+    During a parse, function handlers get the tokens of the current title as ``context["tokens"]``, shared by all
+    handlers until one of them removes text; this is for titles outside of a parse.
+
+    :param title: The title.
+    :return: The tokenized title.
+    """
+    return TitleTokens(title)
@@ -1,9 +1,16 @@
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, List, Optional, Protocol, Union, cast
 
-import arrow
 import regex
 
 
+class ConstantTransformer(Protocol):
+    """A transformer whose output never depends on the match, marked with that output as ``constant``."""
+
+    constant: Any
+
+    def __call__(self, *args, **kwargs) -> Any: ...
+
+
 def none(input_value: str) -> str:
     """
     Return the input value without any transformation.
@@ -29,6 +36,9 @@ def value(val: Union[str, int, Callable[[str], Union[str, int]]]) -> Callable[[s
             return val(input_value)
         return val
 
+    # Mark transformers whose output never depends on the match so that compiled parser plans can skip calling them.
+    if not callable(val) and not (isinstance(val, str) and "$1" in val):
+        cast(ConstantTransformer, inner).constant = val
     return inner
 
 
@@ -54,6 +64,9 @@ def boolean(*args, **kwargs) -> bool:
     return True
 
 
+cast(ConstantTransformer, boolean).constant = True
+
+
 def lowercase(input_value: str) -> str:
     """
     Convert the input value to lowercase.
@@ -89,6 +102,10 @@ month_mapping = {
     r"\bDece\b": "Dec",
 }
 
+MONTH_PATTERNS = tuple((regex.compile(month, regex.IGNORECASE), shortened) for month, shortened in month_mapping.items())
+NON_WORD_RUN = regex.compile(r"\W+")
+DIGIT_RUN = regex.compile(r"\d+")
+
 
 def convert_months(date_str: str) -> str:
     """
@@ -97,8 +114,8 @@ def convert_months(date_str: str) -> str:
     :param date_str: The input date string.
     :return: The date string with shortened month names.
     """
-    for month, shortened in month_mapping.items():
-        date_str = regex.sub(month, shortened, date_str, flags=regex.IGNORECASE)
+    for month, shortened in MONTH_PATTERNS:
+        date_str = month.sub(shortened, date_str)
     return date_str
 
 
@@ -109,9 +126,11 @@ def date(date_format: Union[str, List[str]]) -> Callable[[str], Optional[str]]:
     :param date_format: The date format(s) to use for parsing.
     :return: The transformer function.
     """
+    # arrow takes a while to import; only rulesets with date handlers need it.
+    import arrow
 
     def inner(input_value: str) -> Optional[str]:
-        sanitized = regex.sub(r"\W+", " ", input_value).strip()
+        sanitized = NON_WORD_RUN.sub(" ", input_value).strip()
         sanitized = convert_months(sanitized)
         formats = [date_format] if not isinstance(date_format, list) else date_format
         for fmt in formats:
@@ -131,7 +150,7 @@ def range_func(input_str: str) -> Optional[List[int]]:
     :param input_str: The input string.
     :return: A list of integers representing the range, or None if invalid.
     """
-    numbers = [int(x) for x in regex.findall(r"\d+", input_str)]
+    numbers = [int(x) for x in DIGIT_RUN.findall(input_str)]
 
     if len(numbers) == 2 and numbers[0] < numbers[1]:
         return list(range(numbers[0], numbers[1] + 1))
@@ -150,7 +169,7 @@ def year_range(input_value: str) -> Optional[str]:
     :param input_value: The input string.
     :return: The year range as a string, or None if invalid.
     """
-    parts = regex.findall(r"\d+", input_value)
+    parts = DIGIT_RUN.findall(input_value)
     if not parts:
         return None
 
@@ -0,0 +1,81 @@
+"""
+Check that fused handler alternations give the same results as running the handlers one by one, and measure both.
+
+Usage:
+    python benchmarks/bench_fusion.py [--titles FILE] [--repeat R]
+
+Without ``--titles`` every string literal in the test suite that is longer than a few characters is parsed, which
+covers all titles the tests assert on. The script exits with status 1 if any result differs.
+"""
+import argparse
+import ast
+import sys
+import time
+from pathlib import Path
+
+from PTT import add_defaults
+from PTT.parse import Parser
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / "tests"
+
+
+def load_titles(path):
+    if path:
+        with open(path, encoding="utf-8") as file:
+            return [line.strip() for line in file if line.strip()]
+    titles = set()
+    for test_file in sorted(TESTS_DIR.glob("*.py")):
+        for node in ast.walk(ast.parse(test_file.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str) and len(node.value) > 3:
+                titles.add(node.value)
+    return sorted(titles)
+
+
+def build_parser(fuse):
+    parser = Parser(fuse=fuse)
+    add_defaults(parser)
+    return parser.freeze()
+
+
+def measure(parser, titles, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title in titles:
+            parser.parse(title)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--titles", help="file with one release title per line (default: the titles in tests/)")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="runs per configuration, the best one counts (default: 5)")
+    args = arg_parser.parse_args()
+
+    titles = load_titles(args.titles)
+    separate = build_parser(fuse=False)
+    fused = build_parser(fuse=True)
+
+    differences = 0
+    for title in titles:
+        for translate_languages in (False, True):
+            expected = separate.parse(title, translate_languages)
+            actual = fused.parse(title, translate_languages)
+            if actual != expected:
+                differences += 1
+                print(f"DIFFERENT {title!r}\n  separate: {expected}\n  fused:    {actual}")
+
+    steps = sum(len(run.steps) for run in fused.get_runs())
+    scans = sum(len(run.fused_steps) for run in fused.get_runs())
+    print(f"{len(titles)} titles, {differences} different results")
+    print(f"{steps} handler steps executed as {scans}")
+    for name, parser in (("separate", separate), ("fused", fused)):
+        elapsed = measure(parser, titles, args.repeat)
+        print(f"{name:<9} {elapsed * 1000 / len(titles):.3f} ms/title")
+    sys.exit(1 if differences else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Measure how batch parsing scales with the number of threads (and, optionally, worker processes).
+
+Usage:
+    python benchmarks/bench_threads.py [--titles FILE] [--count N] [--repeat R] [--max-threads T] [--workers]
+
+Without ``--titles`` a built-in sample of release names is used, made unique with a running number so that the
+in-batch deduplication of ``parse_many`` does not skew the result. The parser has no result cache, so every run parses
+every title; the cache of the default parser would answer all runs after the first.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Run from a checkout without installing the package; worker processes inherit the path.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PTT import add_defaults  # noqa: E402
+from PTT.parse import Parser  # noqa: E402
+from PTT.pool import shutdown_pools  # noqa: E402
+
+SAMPLE_TITLES = [
+    "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole",
+    "Mad.Max.Fury.Road.2015.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTG",
+    "[Erai-raws] Shingeki no Kyojin - 01 [1080p][Multiple Subtitle]",
+    "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+    "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+    "The.Walking.Dead.S06E07.SUBFRENCH.HDTV.x264-AMB3R.mkv",
+    "Deadpool 2 (2018) PL.DUB.1080p.WEB-DL.x264 + Napisy PL",
+    "Game of Thrones - The Complete Season 1-8 (2011-2019) [1080p BluRay x265 10bit]",
+    "Сезон 2 Серии 1-10 (2019) WEB-DLRip",
+    "Friends.1994.S01-S10.Complete.720p.BluRay.x264-PSYCHD",
+]
+
+
+def load_titles(path, count):
+    if path:
+        with open(path, encoding="utf-8") as file:
+            return [line.strip() for line in file if line.strip()][:count]
+    return [f"{SAMPLE_TITLES[index % len(SAMPLE_TITLES)]} {index}" for index in range(count)]
+
+
+def build_parser():
+    parser = Parser()
+    add_defaults(parser)
+    return parser.freeze()
+
+
+def measure(parser, titles, repeat, **kwargs):
+    parser.parse_many(titles[:100], initializer=add_defaults, **kwargs)  # warm up the pools and compile the patterns
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser.parse_many(titles, initializer=add_defaults, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--titles", help="file with one release title per line")
+    arg_parser.add_argument("--count", type=int, default=5000, help="number of titles to parse (default: 5000)")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="runs per configuration, the best one counts (default: 3)")
+    arg_parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1, help="largest thread count to try (default: CPU count)")
+    arg_parser.add_argument("--workers", action="store_true", help="also measure the process pool with the same counts")
+    args = arg_parser.parse_args()
+
+    titles = load_titles(args.titles, args.count)
+    parser = build_parser()
+    counts = sorted({1, *(2**power for power in range(1, args.max_threads.bit_length()) if 2**power <= args.max_threads), args.max_threads})
+    modes = ["threads", "workers"] if args.workers else ["threads"]
+
+    print(f"{len(titles)} titles, {os.cpu_count()} CPUs")
+    print(f"{'mode':<8} {'n':>3} {'seconds':>9} {'titles/s':>10} {'speedup':>8}")
+    baseline = measure(parser, titles, args.repeat)
+    for mode in modes:
+        for count in counts:
+            elapsed = baseline if count == 1 else measure(parser, titles, args.repeat, **{mode: count})
+            print(f"{mode:<8} {count:>3} {elapsed:>9.3f} {len(titles) / elapsed:>10.0f} {baseline / elapsed:>7.2f}x")
+    shutdown_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import pytest
+import regex
 
 from PTT import parse_title
+from PTT.adult import KeywordMatcher, create_adult_pattern
 
 
 @pytest.mark.parametrize("release_name, expected_adult, expected_title", [
@@ -13,3 +15,52 @@ def test_random_anime_parse(release_name, expected_adult, expected_title):
     if expected_adult:
         assert result["adult"] == expected_adult, f"Got {result['adult']} instead of {expected_adult}"
     assert result["title"] == expected_title, f"Got {result['title']} instead of {expected_title}"
+
+
+@pytest.fixture(scope="module")
+def adult_matcher():
+    return create_adult_pattern()
+
+
+@pytest.mark.parametrize("title", [
+    "Wicked.24.11.01.Liz.Jordan.It.Didnt.Have.To.End.This.Way.XXX.1080p.HEVC.x265.PRT.mp4",
+    "Amateur Porn Compilation 2021 720p",
+    "Amateur.Porn.Compilation.2021.720p",
+    "The.Sopranos.S04E01.For.All.Debts.Public.and.Private.480p.WEB-DL.x264-Sticky83.mkv",
+    "BRAZZERS_Exxtra 1080p",
+    "brazzersexxtra.com 1080p",
+    "ANAL SEX",
+    "Knight Rider",
+])
+def test_matcher_matches_like_the_alternation(adult_matcher, title):
+    alternation = regex.compile(adult_matcher.pattern, regex.IGNORECASE)
+    expected = alternation.search(title)
+    match = adult_matcher.search(title)
+    assert (match.span() if match else None) == (expected.span() if expected else None)
+    if match:
+        assert match.group(0) == match.group(1) == expected.group(1)
+
+
+def test_matcher_prefers_the_longest_keyword_at_the_leftmost_position():
+    matcher = KeywordMatcher(["amateur", "amateur porn", "porn"])
+    assert matcher.search("Best AMATEUR PORN ever").group(0) == "AMATEUR PORN"
+    assert matcher.search("Best amateur_porn ever") is None
+    assert matcher.search("porn amateur").span() == (0, 4)
+
+
+@pytest.mark.parametrize("title", [
+    "Best AMATEUR PORN ever",
+    "Best amateur-porn ever",
+    "Best amateur -dash porn",
+    "Best amateur-dash porn",
+    "Un CAFÉ noir",
+    "Un cafés noir",
+    "x -dash",
+])
+def test_matcher_falls_back_to_the_alternation_for_irregular_keywords(title):
+    matcher = KeywordMatcher(["amateur", "porn", "-dash", "café", "amateur-"])
+    assert matcher.irregular == {"-dash", "café", "amateur-"}
+    alternation = regex.compile(matcher.pattern, regex.IGNORECASE)
+    expected = alternation.search(title)
+    match = matcher.search(title)
+    assert (match.span() if match else None) == (expected.span() if expected else None)
@@ -0,0 +1,60 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from PTT import aparse_stream, aparse_title, parse_title
+
+TITLES = [
+    "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+    "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+    "Da Vinci Code DVDRip",
+    "The.Walking.Dead.S06E07.SUBFRENCH.HDTV.x264-AMB3R.mkv",
+]
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.jobs = 0
+
+    def submit(self, *args, **kwargs):
+        self.jobs += 1
+        return super().submit(*args, **kwargs)
+
+
+async def feed(titles):
+    for title in titles:
+        yield title
+
+
+def test_aparse_title_batches_concurrent_calls():
+    executor = CountingExecutor()
+
+    async def main():
+        return await asyncio.gather(*(aparse_title(title, True, executor=executor) for title in TITLES * 5))
+
+    with executor:
+        results = asyncio.run(main())
+
+    assert results == [parse_title(title, True) for title in TITLES * 5]
+    assert executor.jobs == 1
+
+
+def test_aparse_stream_keeps_order():
+    async def main():
+        return [result async for result in aparse_stream(feed(TITLES * 10), max_batch_size=3, max_pending_batches=1)]
+
+    assert asyncio.run(main()) == [parse_title(title) for title in TITLES * 10]
+
+
+def test_aparse_stream_propagates_source_errors():
+    async def broken():
+        yield TITLES[0]
+        raise RuntimeError("feed failed")
+
+    async def main():
+        return [result async for result in aparse_stream(broken())]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
@@ -0,0 +1,58 @@
+import re
+
+import pytest
+import regex
+
+from PTT.adult import KeywordMatcher
+from PTT.backend import backend_report, choose_pattern, compile_stdlib
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+
+
+def test_compatible_patterns_compile_with_stdlib():
+    compiled = compile_stdlib(regex.compile(r"\bAMZN\b", regex.IGNORECASE))
+    assert isinstance(compiled, re.Pattern)
+    assert compiled.flags & re.IGNORECASE
+    assert compiled.search("movie.amzn.web").group(0) == "amzn"
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        regex.compile(r"(?<=\b(?:S|Season )\d+)E\d+"),  # variable-length lookbehind
+        regex.compile(r"\p{Cyrillic}+"),
+        regex.compile(r"[[a-z]--[aeiou]]", regex.V1),
+        regex.compile(r"(?|(a)|(b))"),
+        regex.compile(r"[[:alpha:]]+"),
+    ],
+)
+def test_regex_only_patterns_stay_on_regex(pattern):
+    assert compile_stdlib(pattern) is None
+    assert choose_pattern(pattern, "re") is pattern
+
+
+def test_backends_give_the_same_results():
+    titles = [
+        "Mad.Max.Fury.Road.2015.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTG",
+        "[Erai-raws] Shingeki no Kyojin - 01 [1080p][Multiple Subtitle]",
+        "Сезон 2 Серии 1-10 (2019) WEB-DLRip",
+        "Deadpool 2 (2018) PL.DUB.1080p.WEB-DL.x264 + Napisy PL",
+    ]
+    parsers = {}
+    for backend in ("regex", "re", "auto"):
+        parsers[backend] = Parser(backend=backend)
+        add_defaults(parsers[backend])
+
+    engines = {step.reg_exp.__class__ for step in parsers["re"].get_plan() if step.reg_exp is not None}
+    assert engines == {re.Pattern, regex.Pattern, KeywordMatcher}
+    for title in titles:
+        assert parsers["re"].parse(title) == parsers["regex"].parse(title) == parsers["auto"].parse(title)
+
+    report = backend_report(parsers["re"].get_plan(), titles[:1], repeat=1)
+    assert len(report) == sum(1 for step in parsers["re"].get_plan() if step.reg_exp is not None)
+    assert all((choice.engine == "re") <= (choice.speedup is not None) for choice in report)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        Parser(backend="pcre")
@@ -0,0 +1,178 @@
+import time
+
+import pytest
+import regex
+
+from PTT import cache as cache_module
+from PTT import parse_title
+from PTT.cache import LRUCache
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+from PTT.transformers import lowercase
+
+
+@pytest.fixture
+def parser():
+    p = Parser(cache_size=2)
+    add_defaults(p)
+    return p
+
+
+def test_cached_results_are_defensive_copies(parser):
+    first = parser.parse("sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR")
+    first["seasons"].append(6)
+    first["title"] = "changed"
+
+    second = parser.parse("sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR")
+    assert second["seasons"] == [5]
+    assert second["title"] == "sons of anarchy"
+    assert parser.cache_info().hits == 1
+
+
+def test_cache_is_keyed_by_translate_languages(parser):
+    assert parser.parse("The.Walking.Dead.S06E07.SUBFRENCH.HDTV.x264-AMB3R.mkv")["languages"] == ["fr"]
+    assert parser.parse("The.Walking.Dead.S06E07.SUBFRENCH.HDTV.x264-AMB3R.mkv", True)["languages"] == ["French"]
+
+
+def test_cache_evicts_least_recently_used(parser):
+    parser.parse("Title One 720p")
+    parser.parse("Title Two 720p")
+    parser.parse("Title One 720p")
+    parser.parse("Title Three 720p")
+    parser.parse("Title One 720p")
+
+    info = parser.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.size, info.maxsize) == (2, 3, 1, 2, 2)
+
+
+def test_adding_handlers_clears_the_cache():
+    parser = Parser(cache_size=10)
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+    parser.parse("Movie 720p BluRay")
+    parser.add_handler("quality", regex.compile(r"\bBluRay\b"), lowercase)
+
+    assert parser.parse("Movie 720p BluRay")["quality"] == "bluray"
+    assert parser.cache_info().size == 1
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+    assert Parser().cache_info() is None
+
+
+def test_parse_title_exposes_cache_statistics():
+    parse_title.cache_clear()
+    parse_title("Da Vinci Code DVDRip")
+    parse_title("Da Vinci Code DVDRip")
+    assert parse_title.cache_info().hits == 1
+
+
+@pytest.fixture
+def frozen_parser():
+    p = Parser()
+    add_defaults(p)
+    return p.freeze()
+
+
+def test_fingerprint_tracks_the_ruleset(frozen_parser):
+    other = Parser()
+    add_defaults(other)
+    assert other.fingerprint() == frozen_parser.fingerprint()
+
+    other.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+    assert other.fingerprint() != frozen_parser.fingerprint()
+
+
+def test_persistent_cache_survives_restarts(frozen_parser, tmp_path):
+    path = tmp_path / "results.sqlite"
+    frozen_parser.set_persistent_cache(path)
+    expected = frozen_parser.parse("sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR", True)
+    assert len(frozen_parser.persistent_cache) == 1
+    frozen_parser.set_persistent_cache(None)
+
+    restarted = Parser()
+    add_defaults(restarted)
+    restarted.freeze().set_persistent_cache(path)
+    restarted._parse = None  # a hit must not parse again
+    assert restarted.parse("sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR", True) == expected
+    restarted.set_persistent_cache(None)
+
+
+def test_persistent_cache_keeps_entries_of_other_rulesets_until_stale(frozen_parser, tmp_path, monkeypatch):
+    path = tmp_path / "results.sqlite"
+    frozen_parser.set_persistent_cache(path)
+    frozen_parser.parse("Da Vinci Code DVDRip")
+    frozen_parser.set_persistent_cache(None)
+
+    other = Parser()
+    other.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+    other.freeze().set_persistent_cache(path)
+    assert len(other.persistent_cache) == 0
+    assert other.parse("Da Vinci Code DVDRip")["title"] == "Da Vinci Code DVDRip"
+    other.set_persistent_cache(None)
+
+    frozen_parser.set_persistent_cache(path)
+    assert len(frozen_parser.persistent_cache) == 1
+    frozen_parser.set_persistent_cache(None)
+
+    later = time.time() + cache_module.STALE_RULESET_AGE + 1
+    monkeypatch.setattr(cache_module.time, "time", lambda: later)
+    other.set_persistent_cache(path)
+    other.set_persistent_cache(None)
+    frozen_parser.set_persistent_cache(path)
+    assert len(frozen_parser.persistent_cache) == 0
+    frozen_parser.set_persistent_cache(None)
+
+
+def test_persistent_cache_round_trips_offsets(tmp_path):
+    path = tmp_path / "results.sqlite"
+    title = "[HorribleSubs] One Punch Man S2 - 01 [1080p].mkv"
+    parser = Parser(offsets=True)
+    add_defaults(parser)
+    parser.freeze().set_persistent_cache(path)
+    expected = parser.parse(title)
+    assert expected["offsets"]
+    parser.set_persistent_cache(None)
+
+    restarted = Parser(offsets=True)
+    add_defaults(restarted)
+    restarted.freeze().set_persistent_cache(path)
+    restarted._parse = None  # a hit must not parse again
+    assert restarted.parse(title) == expected
+    restarted.set_persistent_cache(None)
+
+
+def test_persistent_cache_skips_results_json_would_change(tmp_path):
+    def tuple_handler(context):
+        context["result"]["pair"] = (1, 2)
+
+    parser = Parser()
+    parser.add_handler("pair", tuple_handler)
+    parser.freeze().set_persistent_cache(tmp_path / "results.sqlite")
+    assert parser.parse("Movie 2010")["pair"] == (1, 2)
+    assert len(parser.persistent_cache) == 0
+    assert parser.parse("Movie 2010")["pair"] == (1, 2)
+    parser.set_persistent_cache(None)
+
+
+def test_persistent_cache_writes_results_in_batches(frozen_parser, tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, "WRITE_BATCH_DELAY", 3600)
+    path = tmp_path / "results.sqlite"
+    frozen_parser.set_persistent_cache(path)
+    store = frozen_parser.persistent_cache
+    titles = ["Da Vinci Code DVDRip", "Tsunami 2016 1080p", "The Simpsons S01E01"]
+    expected = [frozen_parser.parse(title) for title in titles]
+    assert len(store.pending) == 3
+    assert store.get(titles[0], False) == expected[0]
+
+    monkeypatch.setattr(cache_module, "WRITE_BATCH_SIZE", 4)
+    frozen_parser.parse("Movie 2010")
+    assert not store.pending
+    assert len(store) == 4
+    frozen_parser.set_persistent_cache(None)
+
+
+def test_persistent_cache_requires_frozen_parser(tmp_path):
+    with pytest.raises(ValueError):
+        Parser().set_persistent_cache(tmp_path / "results.sqlite")
@@ -0,0 +1,57 @@
+import regex
+
+from PTT.fusion import can_fuse_pattern, fuse_patterns
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+from PTT.transformers import boolean, value
+
+
+def test_first_matching_branch_wins_over_leftmost_match():
+    patterns = [regex.compile(r"\bAMZN\b"), regex.compile(r"\bNF\b", regex.IGNORECASE), regex.compile(r"\bweb\b")]
+    reg_exp, branches = fuse_patterns(patterns, ["amazon", "netflix", "web"])
+
+    title = "Movie nf web AMZN"
+    match, branch = branches.resolve(title, reg_exp.search(title))
+    assert branch == "amazon"
+    assert (match.group(0), match.start()) == ("AMZN", 13)
+
+    title = "Movie web nf"
+    match, branch = branches.resolve(title, reg_exp.search(title))
+    assert branch == "netflix"
+    assert reg_exp.search("Movie WEB") is None
+
+
+def test_patterns_with_renumbered_groups_are_not_fused():
+    assert can_fuse_pattern(regex.compile(r"\b(HDTV|PDTV)\b", regex.IGNORECASE))
+    assert not can_fuse_pattern(regex.compile(r"(\d+)([. -])\d+\2"))
+    assert not can_fuse_pattern(regex.compile(r"(?<=\bS)\d{2}"))
+    assert not can_fuse_pattern(regex.compile(r"\bfoo\b", regex.VERBOSE))
+
+
+def test_fused_runs_keep_first_match_wins():
+    parser = Parser(fuse=True)
+    parser.add_handler("network", regex.compile(r"\bAMZN\b"), value("Amazon"), {"remove": True})
+    parser.add_handler("network", regex.compile(r"\bNF\b"), value("Netflix"), {"remove": True})
+    parser.add_handler("network", regex.compile(r"\bHULU\b", regex.IGNORECASE), value("Hulu"), {"remove": True})
+    parser.add_handler("proper", regex.compile(r"\bPROPER\b"), boolean)
+
+    run = parser.get_runs()[0]
+    assert len(run.steps) == 3 and len(run.fused_steps) == 1
+    assert parser.parse("Movie NF hulu AMZN PROPER") == {"network": "Amazon", "proper": True, "episodes": [], "seasons": [], "languages": [], "title": "Movie NF hulu"}
+
+
+def test_fused_default_parser_matches_separate_handlers():
+    separate = Parser()
+    add_defaults(separate)
+    fused = Parser(fuse=True)
+    add_defaults(fused)
+
+    assert sum(len(run.fused_steps) for run in fused.get_runs()) < len(fused.get_plan())
+    for title in [
+        "Mad.Max.Fury.Road.2015.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTG",
+        "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole",
+        "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+        "Friends.1994.S01-S10.Complete.720p.BluRay.x264-PSYCHD",
+        "Deadpool 2 (2018) PL.DUB.1080p.WEB-DL.x264 + Napisy PL",
+    ]:
+        assert fused.parse(title) == separate.parse(title)
@@ -0,0 +1,101 @@
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import regex
+
+import PTT
+from PTT.handlers import add_defaults
+from PTT.lazy import LazyPattern
+from PTT.parse import Parser
+
+# Cumulative `python -X importtime` cost of `import PTT`, in microseconds: about 90 ms is measured, and building the
+# default parser at import took about three times as long.
+IMPORT_BUDGET = 120_000
+ROOT = Path(__file__).resolve().parent.parent
+# Titles that reach the function handlers, pre- and postprocessors and transformers that use patterns of their own.
+HOT_PATH_TITLES = [
+    "The.Simpsons.S01E01.1080p.BluRay.x265-Tigole",
+    "[best-torrents.com.pl] Gra o Tron Kompletny Sezon 1-3 PL 1080p",
+    "zone-telechargement.pl - Rodzinka Cały Sezon HDTV",
+    "Avatar Nickelodeon 2009 720p",
+    "SpongeBob 2005 NICK 1080p WEB-DL",
+    "Naruto Vol 3 DVDRip",
+    "Gra o Tron 2-4 sezony PL",
+    "Ranczo 3 sezony 720p",
+    "Serial sezon 2-4 1080p",
+    "Ranczo Cały sezon 1080p",
+    "The Daily Show 2019.03.05 720p HDTV x264",
+    "Doctor Who 2005 Capitulo 3 DUBLADO",
+    "[HorribleSubs] One Piece - 1001 [1080p].mkv",
+    "Movie 2020 1080p DD 5.1 H 264 ---- trash",
+    "Война и мир (2019) WEB-DLRip",
+    "The.Office.PL.S01.720p",
+    "1917 Wojna 2019 [1080p]",
+]
+
+
+def test_pattern_compiles_on_first_search():
+    pattern = LazyPattern(r"\b(\d{3,4})p\b", regex.IGNORECASE)
+    assert pattern.groups == 1
+    assert not pattern.compiled
+
+    assert pattern.search("Movie 1080P").group(1) == "1080"
+    assert pattern.compiled
+    assert pattern.search == pattern.compile().search
+    assert pattern.sub("", "Movie 720p") == "Movie "
+    assert pickle.loads(pickle.dumps(pattern)).search("480p").group(1) == "480"
+
+
+def test_warmup_compiles_every_pattern():
+    parser = Parser()
+    add_defaults(parser)
+    lazy = [step.reg_exp for step in parser.freeze().get_plan() if isinstance(step.reg_exp, LazyPattern)]
+    assert lazy
+    assert all(pattern.groups == regex.compile(pattern.pattern, pattern.flags).groups for pattern in lazy)
+
+    parser.parse("The.Simpsons.S01E01.1080p.BluRay.x265-Tigole")
+    assert not all(pattern.compiled for pattern in lazy)
+    parser.warmup()
+    assert all(pattern.compiled for pattern in lazy)
+
+
+def test_parse_compiles_nothing_after_warmup(monkeypatch):
+    parser = Parser()
+    add_defaults(parser)
+    parser.warmup()
+
+    # Every regex.compile, regex.search(...) with a pattern string and the like goes through the module's _compile,
+    # which either compiles the pattern or looks it up in the module's cache.
+    main = sys.modules[regex.compile.__module__]
+    compile_pattern = main._compile
+    compiled = []
+
+    def record(pattern, *args, **kwargs):
+        compiled.append(pattern)
+        return compile_pattern(pattern, *args, **kwargs)
+
+    monkeypatch.setattr(main, "_compile", record)
+    for title in HOT_PATH_TITLES:
+        parser.parse(title)
+    assert compiled == []
+
+
+def test_module_parser_is_built_on_first_use():
+    result = PTT.parse_title("The.Simpsons.S01E01.1080p.BluRay.x265-Tigole")
+    assert PTT._parser is not None
+    assert result["resolution"] == "1080p"
+    PTT.warmup()
+    assert PTT.parse_title.cache_info() is not None
+
+
+def test_import_stays_within_budget():
+    code = "import sys, PTT; print(PTT._parser is None, *(module in sys.modules for module in ('asyncio', 'arrow', 'sqlite3')))"
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert process.stdout.split() == ["True", "False", "False", "False"]
+
+    # Lines read "import time: self [us] | cumulative [us] | module".
+    timings = [line.split("|") for line in process.stderr.splitlines() if line.startswith("import time:")]
+    cumulative = next(int(timing[1]) for timing in timings if timing[2].strip() == "PTT")
+    assert cumulative < IMPORT_BUDGET
@@ -0,0 +1,139 @@
+import pytest
+import regex
+
+from PTT.handlers import add_defaults
+from PTT.lazy import LazyPattern
+from PTT.literals import (
+    fold_title,
+    required_digit_context,
+    required_literals,
+    required_tokens,
+)
+from PTT.parse import Parser
+from PTT.tokens import tokenize
+from PTT.transformers import value
+
+
+@pytest.fixture
+def parser():
+    p = Parser()
+    add_defaults(p)
+    return p
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    (r"\bAMZN\b", ("amzn",)),
+    (r"\bNF|Netflix\b", ("netflix", "nf")),
+    (r"\bHEVC10(bit)?\b|\b[xh][\. \-]?265\b", ("hevc10", "265")),
+    (r"(?<=remux.*)\bBlu[ .-]*Ray\b", ("remux",)),
+    (r"\b[Ss]\d{1,2}[ .](\d{1,2})\b", None),
+    (r"(\d{3,4})[pi]", None),
+    (r"\bRUS?\b", ("ru",)),
+    (r"[\u0400-\u04ff]+", None),
+])
+def test_required_literals(pattern, expected):
+    assert required_literals(regex.compile(pattern, regex.IGNORECASE)) == expected
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    (r"\beng?\b", {"en", "eng"}),
+    (r"\benglish\W+(?:subs?|sdh|hi)\b", {"english"}),
+    (r"\b-?ITA\b", {"ita", "ıta"}),
+    (r"\b(?:(?<!w{3}\.\w+\.)NL|dut|holand[eê]s)\b", {"nl", "dut", "holandes", "holandês"}),
+    (r"\bes(?=\.(?:ass|ssa|srt|sub|idx)$)", {"es"}),
+    (r"\bHR(?=[ .,/-]*(?:[A-Z]{2}[ .,/-]+)*sub)\b", {"hr"}),
+    (r"\bRO(?=[ .,/-]*(?:[A-Z]{2}[ .,/-]+)*sub)", None),
+    (r"\bengl?(?:sub[A-Z]*)?\b", None),
+    (r"\b[Ss]\d{1,2}\b", None),
+    (r"\bAMZN", None),
+    (r"(?a)\bAMZN\b", None),
+])
+def test_required_tokens(pattern, expected):
+    assert required_tokens(regex.compile(pattern, regex.IGNORECASE)) == expected
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    (r"(?:\D|^)(\d{1,2})[xх]\d{1,3}(?:\D|$)", {(1, "x"), (1, "х")}),
+    (r"\b[st]\d{2}(\d{2})\b", {(-1, "s"), (-1, "t")}),
+    (r"(?<=S\d{2}E)\d+", {(-1, "s")}),
+    (r"(?<=\D|^)(\d{1,3})[. ]?(?:of|из|iz)[. ]?\d{1,3}(?=\D|$)", {(offset, char) for offset in (1, 2, 3) for char in "oиz"}),
+    (r"\bep\d+", {(-1, "p")}),
+    (r"\bS\d+", {(-1, "s")}),
+    (r"\bI\d+", {(-1, "i"), (-1, "ı")}),
+    # Cyrillic ``с`` also matches a Cyrillic Extended-C variant.
+    (r"\b\d+[.]?сезон", {(2, "е"), (3, "е")}),
+    (r"\d+.x", None),
+    (r"(?a)\bs\d+", None),
+    (r"\bseason\W+\d+", None),
+])
+def test_required_digit_context(pattern, expected):
+    assert required_digit_context(regex.compile(pattern, regex.IGNORECASE)) == expected
+
+
+def test_equal_patterns_share_their_analysis():
+    first = LazyPattern(r"\b(remux)\b", regex.IGNORECASE)
+    second = LazyPattern(r"\b(remux)\b", regex.IGNORECASE)
+    assert required_tokens(first) == {"remux"}
+    assert required_tokens(second) is required_tokens(first)
+    assert required_literals(second) is required_literals(first)
+    assert first.groups == 1 and not first.compiled
+    assert required_tokens(LazyPattern(r"\b(remux)\b", regex.ASCII)) is None
+
+
+def test_tokens_rule_out_words_inside_words(parser):
+    step = next(step for step in parser.get_plan() if step.reg_exp is not None and step.reg_exp.pattern == r"\bes(?=\.(?:ass|ssa|srt|sub|idx)$)")
+    assert step.tokens == {"es"}
+
+    title = "The.Series.Finale.srt"
+    assert any(literal in fold_title(title) for literal in step.literals)
+    assert step.tokens.isdisjoint(tokenize(title).positions)
+    assert parser.parse("Show.S01E01.es.srt")["languages"] == ["es"]
+
+
+def test_fold_title_matches_ignorecase_equivalents():
+    assert fold_title("TİVİBU") == "tivibu"
+    assert "4k" in fold_title("Movie 4K")
+    assert "subs" in fold_title("Movie ſubs")
+    assert fold_title("Ghost.Rıder.DıvX.avı") == "ghost.rider.divx.avi"
+
+
+def test_dotless_i_passes_the_literal_gate(parser):
+    assert parser.parse("Ghost.Rıder.DıvX.avı")["container"] == "avı"
+    assert parser.parse("Movie.2010.ıTA.Eng.1080p")["languages"] == ["en", "it"]
+    assert parser.parse("Movie.2010.RERıP.1080p")["repack"] is True
+
+
+def test_declared_literals_take_precedence():
+    parser = Parser()
+    parser.add_handler("network", regex.compile(r"\bAMZN\b", regex.IGNORECASE), value("Amazon"), {"literals": ["AMAZON"]})
+
+    step, = parser.get_plan()
+    assert step.literals == ("amazon",)
+    assert "network" not in parser.parse("Show.1080p.AMZN.WEB-DL")
+
+
+def test_declared_tokens_take_precedence():
+    parser = Parser()
+    parser.add_handler("network", regex.compile(r"\bAMZN\b", regex.IGNORECASE), value("Amazon"), {"tokens": ["Amazon"]})
+
+    step, = parser.get_plan()
+    assert step.tokens == {"amazon"}
+    assert "network" not in parser.parse("Show.1080p.AMZN.WEB-DL")
+
+
+def test_gating_does_not_change_results(parser):
+    titles = [
+        "Mad.Max.Fury.Road.2015.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTG",
+        "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole",
+        "[Erai-raws] Shingeki no Kyojin - 01 [1080p][Multiple Subtitle]",
+        "Сезон 2 Серии 1-10 (2019) WEB-DLRip TİVİBU",
+        "Deadpool 2 (2018) PL.DUB.1080p.WEB-DL.x264 + Napisy PL",
+    ]
+    plan = parser.get_plan()
+    assert any(step.literals for step in plan)
+    assert any(step.tokens for step in plan)
+    assert any(step.digit_context for step in plan)
+    gated = [parser.parse(title) for title in titles]
+
+    parser._plan = tuple(step._replace(literals=None, tokens=None, digit_context=None) for step in plan)
+    assert [parser.parse(title) for title in titles] == gated
@@ -1,7 +1,9 @@
 import pytest
+import regex
 
 from PTT.handlers import add_defaults
-from PTT.parse import Parser
+from PTT.parse import UNSET, Parser
+from PTT.transformers import integer, lowercase, uniq_concat, value
 
 
 @pytest.fixture
@@ -73,3 +75,185 @@ def test_episode_code(parser):
 #         result = parser.parse(test_case)
 #         assert isinstance(result, dict)
 #         assert result["languages"] == expected
+
+
+def test_frozen_parser_matches_unfrozen(parser):
+    frozen = Parser()
+    add_defaults(frozen)
+    frozen.freeze()
+
+    for test_case in [
+        "The.Matrix.1999.1080p.BluRay.x264",
+        "[Golumpa] Fairy Tail - 214 [FuniDub 720p x264 AAC] [5E46AC39]",
+        "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+        "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole",
+    ]:
+        assert frozen.parse(test_case) == parser.parse(test_case)
+
+
+def test_frozen_parser_rejects_new_handlers():
+    parser = Parser()
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+    parser.freeze()
+
+    with pytest.raises(ValueError):
+        parser.add_handler("year", regex.compile(r"\b(\d{4})\b"), integer)
+
+
+def test_plan_resolves_constant_transformers():
+    parser = Parser()
+    parser.add_handler("network", regex.compile(r"\bAMZN\b"), value("Amazon"), {"remove": True})
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4})p\b"), value("$1p"))
+    parser.add_handler("languages", regex.compile(r"\bENG\b"), uniq_concat(value("en")))
+
+    network, resolution, languages = parser.get_plan()
+    assert network.constant == "Amazon" and network.remove
+    assert resolution.constant is UNSET
+    assert languages.pass_existing
+
+    result = parser.parse("Show.1080p.AMZN.WEB-DL.ENG")
+    assert result["network"] == "Amazon"
+    assert result["resolution"] == "1080p"
+    assert result["languages"] == ["en"]
+
+
+def test_runs_group_contiguous_fields_in_order(parser):
+    runs = parser.get_runs()
+    assert [step for run in runs for step in run.steps] == list(parser.get_plan())
+    assert all(runs[i].name != runs[i + 1].name for i in range(len(runs) - 1))
+
+    quality = [run for run in runs if run.name == "quality"]
+    assert quality and all(run.skippable for run in quality)
+
+
+def test_parse_reports_evaluated_handlers(parser):
+    stats = {}
+    result = parser.parse("Mad.Max.Fury.Road.2015.1080p.BluRay.x264-SPARKS", stats=stats)
+
+    assert result["quality"] == "BluRay"
+    assert stats["handlers"] == len(parser.handlers)
+    assert stats["skipped_runs"] >= 0
+    assert 0 < stats["evaluated"] < stats["handlers"]
+
+
+def test_parse_many_matches_parse_in_order(parser):
+    titles = [
+        "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+        "Da Vinci Code DVDRip",
+        "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+        "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+    ]
+    results = parser.parse_many(titles)
+
+    assert isinstance(results, list)
+    assert results == [parser.parse(title) for title in titles]
+    assert results[0] is not results[2]
+    assert results[0]["seasons"] is not results[2]["seasons"]
+
+
+def test_parse_many_lazy_returns_independent_results(parser):
+    titles = ["Da Vinci Code DVDRip"] * 3
+    results = parser.parse_many(titles, lazy=True)
+
+    first = next(results)
+    first["languages"].append("en")
+    assert [result["languages"] for result in results] == [[], []]
+
+
+def test_pre_and_postprocessors_share_the_parse_context():
+    parser = Parser()
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+
+    def strip_prefix(context):
+        if context["title"].startswith("NEW: "):
+            context["title"] = context["title"][5:]
+            context["is_new"] = True
+
+    def mark_new(context):
+        context["result"]["new"] = context.get("is_new", False)
+
+    parser.add_preprocessor(strip_prefix)
+    parser.add_postprocessor(mark_new)
+    parser.freeze()
+
+    assert parser.parse("NEW: Movie 720p") == {"resolution": "720p", "new": True, "title": "Movie", "episodes": [], "seasons": [], "languages": []}
+    assert parser.parse("Movie 720p")["new"] is False
+    with pytest.raises(ValueError):
+        parser.add_preprocessor(strip_prefix)
+
+
+def test_function_handlers_get_a_context_of_their_own():
+    parser = Parser()
+    seen = []
+
+    def first(context):
+        seen.append(context.get("note"))
+        context["note"] = "first"
+        context["title"] = "changed"
+
+    def second(context):
+        seen.append((context.get("note"), context["title"]))
+
+    parser.add_handler("first", first)
+    parser.add_handler("second", second)
+    parser.add_postprocessor(lambda context: seen.append(context.get("note")))
+
+    assert parser.parse("Movie 720p")["title"] == "Movie 720p"
+    assert seen == [None, (None, "Movie 720p"), None]
+
+
+def test_parse_selected_fields_matches_full_parse(parser):
+    title = "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole"
+    full = parser.parse(title)
+
+    assert parser.parse(title, fields={"resolution"}) == {"resolution": full["resolution"]}
+    assert parser.parse(title, fields=["seasons", "episodes"]) == {"seasons": full["seasons"], "episodes": full["episodes"]}
+    assert parser.parse(title, fields={"title", "year"}) == {"title": full["title"]}
+
+
+def test_parse_selected_fields_skips_unrelated_handlers():
+    parser = Parser()
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+    parser.add_handler("quality", regex.compile(r"\bBluRay\b"), value("BluRay"), {"remove": True})
+    parser.add_handler("year", regex.compile(r"\b(\d{4})\b"), integer)
+    parser.add_handler("codec", regex.compile(r"\bx264\b"), value("avc"))
+
+    stats = {}
+    assert parser.parse("Movie 2019 1080p BluRay x264", stats=stats, fields={"year"}) == {"year": 2019}
+    assert stats["evaluated"] == 2
+
+
+def test_dependency_graph_follows_declared_fields():
+    def fix_resolution(context):
+        context["result"]["resolution"] = context["result"]["resolution"].upper()
+
+    parser = Parser()
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+    parser.add_handler("year", regex.compile(r"\b(\d{4})\b"), integer)
+    parser.add_handler("resolution", fix_resolution, {"reads": ["resolution"], "writes": ["resolution"], "remove": False})
+    parser.add_handler("quality", regex.compile(r"\bBluRay\b"), value("BluRay"), {"remove": True})
+    parser.add_handler("codec", regex.compile(r"\bx264\b"), value("avc"))
+
+    assert parser.dependency_graph() == ((), (), (0,), (0, 1, 2), (3,))
+
+    stats = {}
+    assert parser.parse("Movie 2019 1080p BluRay x264", stats=stats, fields={"resolution"}) == {"resolution": "1080P"}
+    assert stats["evaluated"] == 2
+
+
+def test_undeclared_function_handlers_depend_on_everything():
+    parser = Parser()
+    parser.add_handler("year", regex.compile(r"\b(\d{4})\b"), integer)
+    parser.add_handler("custom", lambda context: None)
+    parser.add_handler("codec", regex.compile(r"\bx264\b"), value("avc"))
+
+    assert parser.dependency_graph() == ((), (0,), (1,))
+    with pytest.raises(ValueError):
+        parser.add_handler("custom", lambda context: None, {"reads": "year"})
+
+
+def test_builtin_handlers_declare_their_dependencies(parser):
+    title = "The Simpsons S01E01 1080p BluRay x265 HEVC 10bit AAC 5.1 Tigole"
+    stats = {}
+    assert parser.parse(title, stats=stats, fields={"resolution"}) == {"resolution": parser.parse(title)["resolution"]}
+    assert stats["evaluated"] < stats["handlers"] // 4
@@ -0,0 +1,87 @@
+import pytest
+import regex
+
+from PTT import parse_titles
+from PTT.adult import KeywordMatcher
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+from PTT.pool import get_pool, shutdown_pools
+from PTT.transformers import lowercase
+
+
+# Shared by the module, like the worker pools: starting workers is what these tests spend their time on.
+@pytest.fixture(scope="module")
+def parser():
+    p = Parser()
+    add_defaults(p)
+    return p
+
+
+@pytest.fixture(scope="module", autouse=True)
+def pools():
+    yield
+    shutdown_pools()
+
+
+TITLES = [
+    "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+    "Color.Of.Night.Unrated.DC.VostFR.BRrip.x264",
+    "Da Vinci Code DVDRip",
+    "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+    "The.Walking.Dead.S06E07.SUBFRENCH.HDTV.x264-AMB3R.mkv",
+    "Da Vinci Code DVDRip",
+]
+
+
+def test_parallel_results_match_sequential(parser):
+    expected = [parser.parse(title, True) for title in TITLES]
+
+    assert parser.parse_many(TITLES, True, workers=2, chunk_size=1) == expected
+    assert list(parser.parse_many(iter(TITLES), True, lazy=True, workers=2)) == expected
+
+
+def test_parallel_duplicates_are_independent(parser):
+    results = parser.parse_many(TITLES, workers=2)
+
+    results[0]["seasons"].append(6)
+    assert results[3]["seasons"] == [5]
+
+
+def test_workers_use_the_parser_settings():
+    parser = Parser(offsets=True, fuse=True)
+    add_defaults(parser)
+    expected = [parser.parse(title) for title in TITLES]
+
+    assert "offsets" in expected[0]
+    assert parser.parse_many(TITLES, workers=2) == expected
+
+
+def test_workers_need_an_initializer_for_custom_handlers():
+    parser = Parser()
+    parser.add_handler("resolution", regex.compile(r"\b(\d{3,4}p)\b"), lowercase)
+
+    with pytest.raises(ValueError):
+        parser.parse_many(TITLES, workers=2)
+
+
+def test_pool_is_reused():
+    assert get_pool(2, add_defaults) is get_pool(2, add_defaults)
+    assert parse_titles(TITLES[:2], workers=2) == parse_titles(TITLES[:2])
+
+
+def test_threaded_results_match_sequential(parser):
+    expected = [parser.parse(title) for title in TITLES]
+
+    assert parser.parse_many(TITLES, threads=4, chunk_size=1) == expected
+    assert parse_titles(TITLES, threads=2) == expected
+
+
+def test_long_patterns_release_the_gil(parser):
+    concurrent = {step.name for step in parser.get_plan() if step.concurrent}
+    assert {"episodes", "seasons"} <= concurrent
+    assert not any(step.concurrent for step in parser.get_plan() if step.name == "network")
+    # The adult keyword list is looked up by a KeywordMatcher, which holds the GIL.
+    assert not any(step.concurrent for step in parser.get_plan() if isinstance(step.reg_exp, KeywordMatcher))
+
+    with pytest.raises(ValueError):
+        parser.parse_many(TITLES, workers=2, threads=2)
@@ -2,6 +2,7 @@ import pytest
 
 from PTT.handlers import add_defaults
 from PTT.parse import Parser
+from PTT.quality import QUALITY_RULES
 
 
 @pytest.fixture
@@ -78,3 +79,13 @@ def parser():
 def test_source_detection(parser, release_name, expected_quality):
     result = parser.parse(release_name)
     assert result.get("quality") == expected_quality, f"Source detection failed for {release_name}"
+
+
+def test_quality_steps_follow_the_precedence_table(parser):
+    steps = [step for step in parser.get_plan() if step.name == "quality"]
+    assert [(step.constant, step.reg_exp.pattern) for step in steps] == [(quality, pattern) for quality, pattern, _, _ in QUALITY_RULES]
+    assert all(step.literals or step.tokens for step in steps)
+
+    assert parser.parse("Movie 2016 HD TS x264")["quality"] == "TeleSync"
+    assert parser.parse("Movie 2016 1080p BluRay REMUX AVC")["quality"] == "BluRay REMUX"
+    assert "quality" not in parser.parse("Tsunami 2016 1080p")
@@ -0,0 +1,60 @@
+import pytest
+import regex
+
+from PTT.handlers import add_defaults
+from PTT.literals import required_scripts
+from PTT.parse import (
+    ALT_TITLES_REGEX,
+    NON_ENGLISH_SCRIPTS,
+    NOT_ONLY_NON_ENGLISH_REGEX,
+    Parser,
+    clean_title,
+)
+from PTT.scripts import range_scripts, title_scripts
+
+
+@pytest.fixture
+def parser():
+    p = Parser()
+    add_defaults(p)
+    return p
+
+
+def test_title_scripts():
+    assert title_scripts("The.Simpsons.S01E01.1080p.BluRay.x265-Tigole") == frozenset()
+    assert title_scripts("Amélie (2001) 1080p") == frozenset()
+    assert title_scripts("Сезон 2 / 进击的巨人 [1080p]") == {"cyrillic", "han"}
+    assert title_scripts("ᲀ") == {"cyrillic"}
+
+
+def test_range_scripts():
+    assert range_scripts(0x0600, 0x06FF) == {"arabic"}
+    assert range_scripts(0x0400, 0x0410) == {"cyrillic"}
+    assert range_scripts(0x0600, 0x077F) is None
+    assert range_scripts(ord("a"), ord("z")) is None
+
+
+@pytest.mark.parametrize("pattern, expected", [
+    (r"[\u0400-\u04ff]+", {"cyrillic"}),
+    (r"[Сс]езон:?[. _]?№?(\d{1,2})(?!\d)", {"cyrillic"}),
+    (r"(?:[Сс]езон|sez(?:on)?)", None),
+    (r"[\u3040-\u30ff]+|[\u4e00-\u9fff]+", {"kana", "han"}),
+    (r"\bRUS?\b", None),
+])
+def test_required_scripts(pattern, expected):
+    assert required_scripts(regex.compile(pattern, regex.IGNORECASE)) == expected
+
+
+def test_non_english_scripts_cover_cleanup_patterns():
+    assert required_scripts(ALT_TITLES_REGEX) == NON_ENGLISH_SCRIPTS
+    assert required_scripts(NOT_ONLY_NON_ENGLISH_REGEX) == NON_ENGLISH_SCRIPTS
+    assert clean_title("Сезон 2 / Season 2") == clean_title("Сезон 2 / Season 2", frozenset(["cyrillic"]))
+
+
+def test_script_steps_only_run_for_their_scripts(parser):
+    gated = [step for step in parser.get_plan() if step.scripts]
+    assert {step.name for step in gated} >= {"languages", "seasons"}
+
+    assert parser.parse("Tokyo Story 1953 1080p")["languages"] == []
+    assert parser.parse("Война и мир (2019) WEB-DLRip")["languages"] == ["ru"]
+    assert parser.parse("[Erai-raws] 進撃の巨人 - 01 [1080p]")["languages"] == ["ja", "zh"]
@@ -0,0 +1,67 @@
+import pytest
+
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+from PTT.spans import TitleSpans
+
+
+def test_removals_are_coalesced_and_translated():
+    spans = TitleSpans("abcdefghij")
+    spans.remove(2, 2)
+    assert spans.text() == "abefghij"
+    spans.remove(2, 1)
+    assert spans.removed == [(2, 5)]
+    assert spans.text() == "abfghij"
+    assert spans.to_original(2) == 5
+
+    # A removal spanning an already removed interval only takes the visible characters around it.
+    spans.remove(1, 3)
+    assert spans.removed == [(1, 7)]
+    assert spans.text() == "ahij"
+
+
+def test_underscore_runs_read_as_a_single_space():
+    spans = TitleSpans.from_prepared("The__Movie_2019")
+    assert spans.original == "The  Movie 2019"
+    assert spans.text() == "The Movie 2019"
+    assert spans.to_original(4) == 5
+
+
+@pytest.fixture(scope="module")
+def parsers():
+    plain = Parser()
+    add_defaults(plain)
+    tracking = Parser(offsets=True)
+    add_defaults(tracking)
+    return plain.freeze(), tracking.freeze()
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        "The.Simpsons.S01E01.1080p.BluRay.x265-Tigole",
+        "[SubsPlease] Spy x Family - 01 (1080p) [A1B2C3D4].mkv",
+        "Dune_Part_Two__2024_2160p_WEB-DL_DDP5.1_Atmos_HDR_H.265-FLUX",
+        "Сезон 2 Серии 1-10 (2019) WEB-DLRip",
+    ],
+)
+def test_offsets_mode_matches_plain_parse(parsers, title):
+    plain, tracking = parsers
+    result = tracking.parse(title)
+    offsets = result.pop("offsets")
+    assert result == plain.parse(title)
+    assert "resolution" in offsets or "seasons" in offsets
+    for start, end in offsets.values():
+        assert 0 <= start <= end <= len(title)
+
+
+def test_offsets_point_into_the_original_title(parsers):
+    _, tracking = parsers
+    title = "The.Simpsons.S01E01.1080p.BluRay.x265-Tigole"
+    offsets = tracking.parse(title)["offsets"]
+
+    start, end = offsets["resolution"]
+    assert title[start:end] == "1080p"
+    start, end = offsets["quality"]
+    assert title[start:end].strip(".") == "BluRay"
+    assert tracking.parse(title, fields={"resolution"})["offsets"] == {"resolution": offsets["resolution"]}
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+
+TITLES = [
+    "[Audio PL] Die Hard 1988 1080p BluRay x264",
+    "best-torrents pl - Shrek 2 (2004) PL.DUB.720p.WEB-DL",
+    "www.Torrenting.com   -    Anatomy Of A Fall (2023)",
+    "sons.of.anarchy.s05e10.480p.BluRay.x264-GAnGSteR",
+    "The.Office.PL.S01E01.720p.WEB-DL",
+    "Da Vinci Code DVDRip",
+    "[Erai-raws] Shingeki no Kyojin - 01 [1080p][Multiple Subtitle]",
+    "1917 Wojna 2019 PL.1080p.BluRay.x264",
+    "The.Walking.Dead.S06E07.SUBFRENCH.HDTV.x264-AMB3R.mkv",
+    "Mad.Max.Fury.Road.2015.1080p.AMZN.WEB-DL.DDP5.1.H.264-NTG",
+]
+
+
+def test_threaded_results_match_sequential():
+    # A parser without a result cache, so that every threaded call parses the title again.
+    parser = Parser()
+    add_defaults(parser)
+    expected = {title: parser.parse(title) for title in TITLES}
+    assert any("site" in result for result in expected.values())
+
+    workload = TITLES * 10
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parser.parse, workload))
+
+    assert parser.cache_info() is None
+    for title, result in zip(workload, results):
+        assert result == expected[title], title
@@ -1,7 +1,7 @@
 import pytest
 
 from PTT.handlers import add_defaults
-from PTT.parse import Parser
+from PTT.parse import Parser, clean_title
 
 
 @pytest.fixture
@@ -70,3 +70,24 @@ def parser():
 def test_title_detection(parser, release_name, expected_title):
     result = parser.parse(release_name)
     assert result["title"] == expected_title, f"Title detection failed for {release_name}"
+
+
+@pytest.mark.parametrize("raw_title, expected", [
+    # No brackets, stars or non-English scripts: only the trims that apply to any title.
+    ("The.Simpsons.", "The Simpsons"),
+    ("The Simpsons - ", "The Simpsons"),
+    ("  --Movie Title  :", "Movie Title"),
+    ("Dragon_Ball_Z_", "Dragon Ball Z"),
+    ("Best Hits mp3", "Best Hits"),
+    ("Movie -- + Title", "Movie Title"),
+    ("Title\n", "Title"),
+    # The rest.
+    ("★Top Gear★ Season", "Season"),
+    ("Movie Title [Extended]", "Movie Title"),
+    ("[HorribleSubs] One Piece", "One Piece"),
+    ("Movie (Иван Петров)", "Movie"),
+    ("Title ]", "Title"),
+    ("Movie [movie] (2019", "Movie 2019"),
+])
+def test_clean_title(raw_title, expected):
+    assert clean_title(raw_title) == expected
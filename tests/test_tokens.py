@@ -0,0 +1,66 @@
+from PTT.handlers import add_defaults
+from PTT.parse import Parser
+from PTT.tokens import TitleTokens
+
+
+def test_tokens_carry_offsets_separators_and_depth():
+    tokens = TitleTokens("[Erai-raws] Shingeki no Kyojin - 01 [1080p]")
+    assert [token.text for token in tokens] == ["Erai", "raws", "Shingeki", "no", "Kyojin", "01", "1080p"]
+    erai, raws, shingeki = tokens.tokens[:3]
+    assert (erai.start, erai.end, erai.separator, erai.depth) == (1, 5, "[", 1)
+    assert (raws.separator, raws.depth) == ("-", 1)
+    assert (shingeki.separator, shingeki.depth) == ("] ", 0)
+    assert tokens.tokens[-1].depth == 1
+    assert tokens.find("1080p").start == tokens.title.index("1080p")
+    assert "kyojin" in tokens and "Kyojin" not in tokens
+
+
+def test_folding_matches_regex_ignorecase():
+    tokens = TitleTokens("İNTERNAL ſample Kelvin")
+    assert len(tokens.folded) == len(tokens.title)
+    assert [token.folded for token in tokens] == ["internal", "sample", "kelvin"]
+    assert tokens.positions == {"internal": (0,), "sample": (1,), "kelvin": (2,)}
+
+
+def test_digit_context_holds_the_characters_around_digit_runs():
+    context = TitleTokens("Show.S01E02.720p-x264").digit_context
+    assert {(-1, "s"), (1, "e"), (-1, "e"), (1, "p"), (-1, "x"), (-2, "-")} <= context
+    # Neither reaching past the neighbouring run nor further than DIGIT_REACH.
+    assert (-2, "e") not in context and (-4, "p") not in context and (-5, "w") not in context
+    assert TitleTokens("Ⅻ Angry Men").digit_context == set()
+
+
+def test_tokens_are_shared_until_the_title_changes():
+    seen = []
+
+    def record(context):
+        seen.append(context["tokens"])
+        assert context["tokens"].title == context["title"]
+
+    def remove_year(context):
+        token = context["tokens"].find("2019")
+        return {"raw_match": token.text, "match_index": token.start, "remove": True}
+
+    parser = Parser()
+    for name, handler in [("first", record), ("second", record), ("year", remove_year), ("third", record)]:
+        parser.add_handler(name, handler)
+    parser.parse("Movie.2019.1080p")
+    assert seen[0] is seen[1] and seen[2] is not seen[1]
+    assert seen[2].title == "Movie..1080p"
+    parser.parse("Movie.2019.1080p")
+    assert seen[3] is not seen[0]
+
+
+def test_function_handlers_can_look_up_tokens():
+    def handle_remux(context):
+        token = context["tokens"].find("remux")
+        if token is None:
+            return None
+        context["result"]["remux"] = True
+        return {"raw_match": token.text, "match_index": token.start, "remove": False}
+
+    parser = Parser()
+    parser.add_handler("remux", handle_remux, {"reads": [], "writes": ["remux"], "remove": False})
+    add_defaults(parser)
+    assert parser.parse("Movie.2019.1080p.BluRay.REMUX.AVC-GROUP")["remux"] is True
+    assert "remux" not in parser.parse("Movie.2019.1080p.BluRay.AVC-GROUP")